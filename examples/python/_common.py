@@ -0,0 +1,136 @@
+"""
+Terminal formatting and validation helpers shared by the token_metrics and
+wallet_info example scripts.
+"""
+
+import functools
+import math
+import re
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Basic Solana address validation (32-44 base58 chars)
+_SOLANA_ADDR_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
+
+# Terminal color codes
+COLORS = {
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'reset': '\033[0m',
+    'bold': '\033[1m',
+    'underline': '\033[4m'
+}
+
+_RESET = COLORS['reset']
+
+@functools.lru_cache(maxsize=64)
+def _style_prefix(color, bold, underline):
+    """Return the escape codes that start text styled with this combination."""
+    prefix = COLORS.get(color.lower(), '') if color else ''
+    if bold:
+        prefix = COLORS['bold'] + prefix
+    if underline:
+        prefix = COLORS['underline'] + prefix
+    return prefix
+
+def colorize(text, color=None, bold=False, underline=False):
+    """Apply color and styling to text for terminal output."""
+    return f"{_style_prefix(color, bold, underline)}{text}{_RESET}"
+
+# (suffix, divisor) per power of a thousand, indexed by log10(|value|) // 3
+_SUFFIXES = (('', 1.0), ('K', 1e3), ('M', 1e6), ('B', 1e9), ('T', 1e12))
+_MAX_SUFFIX = len(_SUFFIXES) - 1
+
+def format_number(value, decimal_places=2, prefix='', suffix=''):
+    """Format large numbers with K, M, B, T suffixes."""
+    if value is None:
+        return 'N/A'
+
+    try:
+        value = float(value)
+        abs_value = abs(value)
+        i = min(int(math.log10(abs_value)) // 3, _MAX_SUFFIX) if 1_000 <= abs_value < math.inf else 0
+        unit, divisor = _SUFFIXES[i]
+        return f"{prefix}{value/divisor:.{decimal_places}f}{unit}{suffix}"
+    except (TypeError, ValueError):
+        return 'N/A'
+
+def format_number_array(values, decimal_places=2, prefix='', suffix=''):
+    """Format a column of numbers like format_number, picking every suffix at once.
+
+    Falls back to calling format_number per value when NumPy is not installed.
+    """
+    if np is None:
+        return [format_number(v, decimal_places, prefix, suffix) for v in values]
+
+    values = np.asarray(values, dtype=float)
+    abs_values = np.abs(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponents = np.floor(np.log10(abs_values)) // 3
+    scaled = (abs_values >= 1_000) & np.isfinite(abs_values)
+    idx = np.where(scaled, np.minimum(exponents, _MAX_SUFFIX), 0).astype(np.intp)
+    units = np.take([unit for unit, _ in _SUFFIXES], idx)
+    divisors = np.take([divisor for _, divisor in _SUFFIXES], idx)
+    return [
+        f"{prefix}{v:.{decimal_places}f}{unit}{suffix}"
+        for v, unit in zip((values / divisors).tolist(), units.tolist())
+    ]
+
+def format_price(price, currency='SOL'):
+    """Format price with appropriate decimal places."""
+    if price is None:
+        return 'N/A'
+
+    try:
+        price = float(price)
+        if price >= 1:
+            return f"{price:,.4f} {currency}"
+        elif price >= 0.0001:
+            return f"{price:.8f} {currency}".rstrip('0').rstrip('.')
+        else:
+            return f"{price:.4e} {currency}"
+    except (TypeError, ValueError):
+        return 'N/A'
+
+def format_change(change, is_percent=True):
+    """Format price/percent change with color coding."""
+    if change is None:
+        return 'N/A'
+
+    try:
+        change = float(change)
+        suffix = '%' if is_percent else ''
+
+        if change > 0:
+            return f"{colorize(f'+{change:.2f}{suffix}', 'green')} ↑"
+        elif change < 0:
+            return f"{colorize(f'{change:.2f}{suffix}', 'red')} ↓"
+        else:
+            return f"{change:.2f}{suffix} →"
+    except (TypeError, ValueError):
+        return 'N/A'
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(ts, fmt='%Y-%m-%d %H:%M:%S'):
+    """Format a whole-second Unix timestamp; repeated timestamps skip strftime."""
+    return datetime.fromtimestamp(ts).strftime(fmt)
+
+def format_timestamp(timestamp):
+    """Convert Unix timestamp to human-readable format."""
+    try:
+        return _fmt_ts(math.floor(timestamp))
+    except (TypeError, ValueError):
+        return str(timestamp)
+
+def is_valid_solana_address(address):
+    """Check if the provided string is a valid Solana address."""
+    return _SOLANA_ADDR_RE.match(address) is not None
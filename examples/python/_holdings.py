@@ -0,0 +1,66 @@
+"""
+Wallet holding valuation helpers used by the advanced examples.
+
+This module is plain, fully annotated Python so it can optionally be compiled
+with mypyc (``PUMPFUN_MYPYC=1 python setup.py build_ext --inplace``). When no
+compiled extension is present the interpreter simply imports this file.
+"""
+
+import heapq
+import logging
+import math
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def safe_float(value: Any) -> float:
+    """Convert an API value to float, mapping unparseable values to NaN."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def holding_row(token: Dict[str, Any], balance: float, price: float, value: float) -> Dict[str, Any]:
+    """Build the summary record reported for a single holding."""
+    return {
+        'mint': token.get('mint', ''),
+        'symbol': token.get('symbol', 'UNKNOWN'),
+        'balance': balance,
+        'price': price,
+        'value': value
+    }
+
+
+def rank_holdings(tokens: List[Dict[str, Any]], top_n: int = 5) -> Tuple[float, int, List[Dict[str, Any]]]:
+    """Value wallet holdings and pick the most valuable ones (pure-Python path).
+
+    Holdings whose balance or price is not numeric are skipped; missing values
+    count as zero. Zero-value holdings are counted but never ranked.
+
+    Returns:
+        Tuple of (total value, number of valued holdings, top ``top_n`` holdings by value)
+    """
+    total_value = 0.0
+    num_tokens = 0
+    valued: List[Tuple[float, Dict[str, Any], float, float]] = []
+
+    for token in tokens:
+        try:
+            balance = float(token.get('balance') or 0)
+            price = float(token.get('price') or 0)
+        except (ValueError, TypeError) as e:
+            logger.warning("Error processing token %s: %s", token.get('mint'), e)
+            continue
+        num_tokens += 1
+        if not balance or not price:
+            continue
+        value = balance * price
+        total_value += value
+        valued.append((value, token, balance, price))
+
+    # Partial selection of the top holdings instead of sorting every row
+    top = heapq.nlargest(top_n, valued, key=itemgetter(0))
+    return total_value, num_tokens, [holding_row(token, balance, price, value) for value, token, balance, price in top]
@@ -0,0 +1,115 @@
+"""
+Shared pieces of the Pump.fun rate limit testers.
+
+``test_rate_limits.py`` probes raw endpoint paths once each, while
+``test_rate_limits_updated.py`` stresses the client methods until limited. Both
+share a quota per host, back off through the same store and write results the
+same way; those parts live here.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger('RateLimitTester')
+
+
+def quota_bucket(base_url: str) -> str:
+    """Return the backoff bucket for an API base URL.
+
+    All endpoints live on one host whose quota is per IP, so they share a bucket.
+    """
+    return urlparse(base_url).netloc
+
+
+def dumps_line(record: Any) -> bytes:
+    """Serialize one result as a JSON line, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS, default=str)
+    return (json.dumps(record, default=str) + '\n').encode('utf-8')
+
+
+def dump_pretty(data: Any, filepath: str) -> None:
+    """Write ``data`` to ``filepath`` as indented JSON, with orjson when installed."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+class SlidingWindow:
+    """Client-side limiter allowing at most ``limit`` request starts per ``window_seconds``."""
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._starts = deque()
+        self._lock = None  # Created lazily so it binds to the running loop
+
+    async def acquire(self) -> None:
+        """Wait until another request fits in the window, then record its start.
+
+        Serialized with a lock, so concurrent acquirers re-check the window after
+        every sleep instead of all claiming the slot they waited for.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._starts and self._starts[0] <= now - self.window_seconds:
+                    self._starts.popleft()
+                if len(self._starts) < self.limit:
+                    break
+                # Sleep only as long as it takes for the oldest start to leave the window
+                await asyncio.sleep(self._starts[0] + self.window_seconds - now)
+            self._starts.append(now)
+
+
+class RetryAfterStore:
+    """Per-bucket backoff deadlines set from ``Retry-After`` / reset headers.
+
+    Endpoints sharing a quota share a bucket, so once one of them is told to back
+    off the others wait too instead of collecting their own guaranteed 429s.
+    """
+
+    def __init__(self):
+        self._deadlines: Dict[str, float] = {}
+
+    def defer(self, bucket: str, seconds: Any) -> None:
+        """Block ``bucket`` for ``seconds`` from now (ignored if not a number)."""
+        try:
+            deadline = time.time() + float(seconds)
+        except (TypeError, ValueError):
+            return
+        self._deadlines[bucket] = max(self._deadlines.get(bucket, 0.0), deadline)
+
+    def remaining(self, bucket: str) -> float:
+        """Seconds until ``bucket`` may be called again (0 if not blocked)."""
+        return max(0.0, self._deadlines.get(bucket, 0.0) - time.time())
+
+    def sleep(self, bucket: str) -> None:
+        """Block the calling thread until ``bucket`` may be called again."""
+        delay = self.remaining(bucket)
+        if delay > 0:
+            logger.info("Backing off %s for %.1fs", bucket, delay)
+            time.sleep(delay)
+
+    async def wait(self, bucket: str) -> None:
+        """Sleep until ``bucket`` may be called again."""
+        delay = self.remaining(bucket)
+        if delay > 0:
+            logger.info("Backing off %s for %.1fs", bucket, delay)
+            await asyncio.sleep(delay)
@@ -5,11 +5,24 @@ This module provides practical examples for working with the Pump.fun API,
 including price history analysis, wallet activity monitoring, and new token alerts.
 """
 
+import re
 import time
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
 import sys
 import os
 from pathlib import Path
@@ -17,29 +30,147 @@ from pathlib import Path
 # Add the project root to the Python path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from utils.python_client import PumpFunAPI
+from utils.async_client import AsyncPumpFunAPI
+from utils.python_client import json_loads
 from examples.python.market_analyzer import MarketAnalyzer, colorize, format_number, format_timestamp
+from examples.python.logging_utils import configure_queued_logging
+from examples.python._holdings import holding_row, rank_holdings, safe_float
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pump_fun_advanced.log')
-    ]
-)
+# Logging is configured in __main__ (see configure_queued_logging)
 logger = logging.getLogger(__name__)
 
+# Popular keywords that flag a new token as interesting, matched in a single pass
+_KEYWORDS = frozenset(('pump', 'moon', 'btc', 'eth', 'sol', 'meme'))
+_KEYWORD_RE = re.compile('|'.join(sorted(_KEYWORDS)), re.IGNORECASE)
+
+# New-token monitor settings and log templates (formatted lazily by logging)
+_MIN_ALERT_LIQUIDITY = 10000  # $10k+ initial liquidity
+_ALERT_FMT = (
+    "🚨 NEW TOKEN ALERT: %s ($%s)\n"
+    "   🔗 Mint: %s\n"
+    "   🕒 Created: %s\n"
+    "   💰 Liquidity: $%s\n"
+    "   🔍 Reason: %s\n"
+    "   🌐 Explorer: https://pump.fun/token/%s"
+)
+_NEW_TOKEN_FMT = "New token: %s ($%s) - %s"
+
+def _rank_holdings(tokens: List[Dict], top_n: int = 5) -> Tuple[float, int, List[Dict]]:
+    """Value wallet holdings and pick the most valuable ones.
+    
+    Holdings whose balance or price is not numeric are skipped; missing values
+    count as zero. Zero-value holdings are counted but never ranked.
+    
+    Returns:
+        Tuple of (total value, number of valued holdings, top ``top_n`` holdings by value)
+    """
+    if np is None or not tokens:
+        return rank_holdings(tokens, top_n)
+    
+    # Vectorized path: columns of balances/prices instead of per-row arithmetic
+    count = len(tokens)
+    balances = np.fromiter((safe_float(t.get('balance') or 0) for t in tokens), dtype=np.float64, count=count)
+    prices = np.fromiter((safe_float(t.get('price') or 0) for t in tokens), dtype=np.float64, count=count)
+    values = balances * prices
+    
+    valid = np.flatnonzero(~(np.isnan(balances) | np.isnan(prices)))
+    if len(valid) < count:
+        logger.warning("Skipped %d holdings with non-numeric balance or price", count - len(valid))
+    
+    nonzero = valid[values[valid] != 0]
+    ranked = nonzero[np.argsort(-values[nonzero], kind='stable')[:top_n]]
+    top_holdings = [
+        holding_row(tokens[i], float(balances[i]), float(prices[i]), float(values[i]))
+        for i in ranked
+    ]
+    return float(values[valid].sum()), len(valid), top_holdings
+
 class PumpFunAdvanced:
     """Advanced examples for working with Pump.fun API."""
     
-    def __init__(self, api_key: str = None):
-        """Initialize with optional API key."""
-        self.analyzer = MarketAnalyzer()
-        self.client = self.analyzer.client  # For direct API access if needed
+    def __init__(
+        self,
+        api_key: str = None,
+        max_connections: int = 64,
+        cache_ttl: float = 30.0,
+        cache_size: int = 1024
+    ):
+        """Initialize the advanced client.
+        
+        Args:
+            api_key: Optional API key for authenticated requests
+            max_connections: Size of the shared HTTP connection pool
+            cache_ttl: Seconds to reuse a token lookup (0 disables caching)
+            cache_size: Maximum number of token lookups to keep cached
+        """
+        self.client = AsyncPumpFunAPI(api_key=api_key, max_connections=max_connections)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # token address -> (expiry, lookup task); sharing the task also collapses concurrent lookups
+        self._token_cache = OrderedDict()
+    
+    async def __aenter__(self) -> 'PumpFunAdvanced':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
-    def analyze_token_price_history(self, token_address: str, days: int = 7) -> Dict:
+    async def aclose(self) -> None:
+        """Release the shared HTTP connection pool."""
+        await self.client.aclose()
+    
+    async def _get_token_info(self, token_address: str) -> Optional[Dict]:
+        """Look up a token's market data, reusing recent lookups within ``cache_ttl``."""
+        if self.cache_ttl <= 0:
+            return await self._fetch_token_info(token_address)
+        
+        now = time.monotonic()
+        cached = self._token_cache.get(token_address)
+        if cached is not None and cached[0] > now and not cached[1].cancelled():
+            return await self._await_lookup(token_address, cached[1])
+        
+        task = asyncio.ensure_future(self._fetch_token_info(token_address))
+        self._token_cache[token_address] = (now + self.cache_ttl, task)
+        self._token_cache.move_to_end(token_address)
+        if len(self._token_cache) > self.cache_size:
+            self._token_cache.popitem(last=False)
+        
+        return await self._await_lookup(token_address, task)
+    
+    async def _await_lookup(self, token_address: str, task: asyncio.Future) -> Optional[Dict]:
+        """Wait for a shared lookup task without letting our cancellation reach it.
+        
+        The task is shielded, so a caller that times out or is cancelled only
+        stops waiting; other callers still get the result. Failed or cancelled
+        lookups are evicted so they are not served from the cache.
+        """
+        try:
+            return await asyncio.shield(task)
+        except BaseException:
+            if task.done() and (task.cancelled() or task.exception() is not None):
+                if self._token_cache.get(token_address, (None, None))[1] is task:
+                    del self._token_cache[token_address]
+            raise
+    
+    async def _fetch_token_info(self, token_address: str) -> Optional[Dict]:
+        """Look up a token's market data by its mint address."""
+        search_results = await self.client.search_coins(
+            search_term=token_address,
+            limit=1,
+            search_type='exact'
+        )
+        
+        token_data = []
+        if isinstance(search_results, dict):
+            token_data = search_results.get('data', [])
+        elif isinstance(search_results, list):
+            token_data = search_results
+        
+        if token_data and isinstance(token_data[0], dict):
+            return token_data[0]
+        return None
+    
+    async def analyze_token_price_history(self, token_address: str, days: int = 7) -> Dict:
         """Analyze price history of a token over a specified period.
         
         Args:
@@ -49,18 +180,18 @@ class PumpFunAdvanced:
         Returns:
             Dictionary with price analysis including high, low, volatility, etc.
         """
-        logger.info(f"Analyzing price history for token: {token_address}")
+        logger.info("Analyzing price history for token: %s", token_address)
         
         try:
-            # Get token details using the market analyzer
-            token_info = self.analyzer.get_token_analysis(token_address)
+            # Get token details
+            token_info = await self._get_token_info(token_address)
             
             if not token_info or 'error' in token_info:
-                return {"error": token_info.get('error', 'Token not found')}
+                return {"error": (token_info or {}).get('error', 'Token not found')}
             
             # Get the latest trades (limited to what the API provides)
             # Note: The actual implementation would need to use the correct endpoint for historical data
-            # For now, we'll use the available data from the token analysis
+            # For now, we'll use the available data from the token details
             
             # Extract available price data
             current_price = token_info.get('price', 0)
@@ -87,10 +218,25 @@ class PumpFunAdvanced:
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing price history: {e}", exc_info=True)
+            logger.error("Error analyzing price history: %s", e)
+            logger.debug("Traceback", exc_info=True)
             return {"error": str(e)}
     
-    def get_wallet_activity(self, wallet_address: str, days: int = 7) -> Dict:
+    async def analyze_many(self, token_addresses: List[str], days: int = 7) -> List[Dict]:
+        """Analyze several tokens concurrently over the shared connection pool.
+        
+        Args:
+            token_addresses: Token mint addresses to analyze
+            days: Number of days of history to analyze (max 30)
+            
+        Returns:
+            List of price analyses in the same order as ``token_addresses``
+        """
+        return await asyncio.gather(
+            *(self.analyze_token_price_history(address, days) for address in token_addresses)
+        )
+    
+    async def get_wallet_activity(self, wallet_address: str, days: int = 7) -> Dict:
         """Get recent activity for a wallet including trades and token interactions.
         
         Args:
@@ -100,133 +246,197 @@ class PumpFunAdvanced:
         Returns:
             Dictionary with wallet activity summary
         """
-        logger.info(f"Fetching activity for wallet: {wallet_address}")
+        logger.info("Fetching activity for wallet: %s", wallet_address)
         
         try:
-            # Get wallet analysis using the market analyzer
-            wallet_info = self.analyzer.get_wallet_analysis(wallet_address)
+            # Get wallet holdings
+            wallet_info = await self.client.get_wallet_holdings(wallet_address=wallet_address)
             
             if not wallet_info or 'error' in wallet_info:
-                return {"error": wallet_info.get('error', 'Failed to fetch wallet data')}
-            
-            # Process the wallet data
-            total_value = 0
-            token_holdings = []
+                return {"error": (wallet_info or {}).get('error', 'Failed to fetch wallet data')}
             
-            # Extract token holdings if available
-            if 'tokens' in wallet_info and isinstance(wallet_info['tokens'], list):
-                for token in wallet_info['tokens']:
-                    try:
-                        value = float(token.get('balance', 0)) * float(token.get('price', 0))
-                        token_holdings.append({
-                            'mint': token.get('mint', ''),
-                            'symbol': token.get('symbol', 'UNKNOWN'),
-                            'balance': float(token.get('balance', 0)),
-                            'price': float(token.get('price', 0)),
-                            'value': value
-                        })
-                        total_value += value
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Error processing token {token.get('mint')}: {e}")
-                        continue
-            
-            # Sort holdings by value (descending)
-            token_holdings.sort(key=lambda x: x['value'], reverse=True)
+            # Value the holdings and keep the most valuable ones
+            tokens = wallet_info.get('data')
+            total_value, num_tokens, top_holdings = _rank_holdings(
+                tokens if isinstance(tokens, list) else [], top_n=5
+            )
             
             # Get recent transactions if available
             recent_trades = wallet_info.get('transactions', [])
             
-            # Calculate unique tokens traded
+            # Total the volume and collect the unique tokens traded in one pass
+            recent_volume = 0.0
             tokens_traded = set()
+            add_token = tokens_traded.add
             for trade in recent_trades:
-                if 'token_address' in trade:
-                    tokens_traded.add(trade['token_address'])
+                recent_volume += float(trade.get('amount_usd') or 0)
+                token_address = trade.get('token_address')
+                if token_address:
+                    add_token(token_address)
             
             return {
                 "wallet": wallet_address,
                 "total_value_usd": total_value,
-                "num_tokens": len(token_holdings),
+                "num_tokens": num_tokens,
                 "recent_trade_count": len(recent_trades),
-                "recent_volume_usd": sum(float(t.get('amount_usd', 0)) for t in recent_trades),
+                "recent_volume_usd": recent_volume,
                 "unique_tokens_traded": len(tokens_traded),
-                "top_holdings": token_holdings[:5],  # Top 5 holdings
-                "last_updated": int(time.time() * 1000)
+                "top_holdings": top_holdings,  # Top 5 holdings
+                "last_updated": time.time_ns() // 1_000_000
             }
             
         except Exception as e:
-            logger.error(f"Error fetching wallet activity: {e}", exc_info=True)
+            logger.error("Error fetching wallet activity: %s", e)
+            logger.debug("Traceback", exc_info=True)
             return {"error": str(e)}
     
-    def monitor_new_tokens(self, interval_minutes: int = 5, max_iterations: int = None):
-        """Monitor for new token listings and alert on interesting ones.
+    def _handle_new_token(self, token: Dict, seen_tokens: OrderedDict, max_seen_tokens: int) -> None:
+        """Record a token in the seen-set and log it if it has not been seen before."""
+        get = token.get
+        token_address = get('mint')
+        if not token_address:
+            return
+        if token_address in seen_tokens:
+            seen_tokens.move_to_end(token_address)
+            return
+        
+        # New token found
+        seen_tokens[token_address] = None
+        if len(seen_tokens) > max_seen_tokens:
+            seen_tokens.popitem(last=False)
+        symbol = get('symbol', 'UNKNOWN')
+        name = get('name', 'Unnamed Token')
+        created = format_timestamp(get('created_timestamp', 0))
+        
+        # Check if this is an interesting token (example criteria)
+        is_interesting = False
+        reason = ""
+        
+        # Example criteria: High initial liquidity
+        liquidity = float(get('liquidity_usd', 0))
+        if liquidity > _MIN_ALERT_LIQUIDITY:
+            is_interesting = True
+            reason = f"High initial liquidity: ${liquidity:,.2f}"
+        
+        # Example criteria: Specific keywords in name/symbol
+        search = _KEYWORD_RE.search
+        if search(symbol) or search(name):
+            is_interesting = True
+            reason = "Contains popular keywords"
+        
+        # Log the new token
+        if is_interesting:
+            # One multi-line record per alert instead of six separate writes
+            logger.info(
+                _ALERT_FMT, name, symbol, token_address, created,
+                format(liquidity, ',.2f'), reason, token_address
+            )
+        else:
+            logger.info(_NEW_TOKEN_FMT, name, symbol, created)
+    
+    async def _subscribe_new_tokens(
+        self,
+        ws_url: str,
+        seen_tokens: OrderedDict,
+        max_seen_tokens: int,
+        max_messages: int = None
+    ) -> None:
+        """Consume a pushed feed of new tokens until it closes.
+        
+        Each message may be a single coin object, a list of coins, or a
+        ``{'data': [...]}`` envelope like the REST endpoints return.
         
         Args:
-            interval_minutes: How often to check for new tokens (minutes)
-            max_iterations: Maximum number of iterations (None for infinite)
+            ws_url: WebSocket URL of the new-coin feed
+            seen_tokens: Shared LRU of mint addresses already reported
+            max_seen_tokens: Bound on ``seen_tokens``
+            max_messages: Stop after this many messages (None for infinite)
         """
-        logger.info(f"Starting token monitor (checking every {interval_minutes} minutes)")
+        async with websockets.connect(ws_url) as ws:
+            logger.info("Subscribed to new token feed: %s", ws_url)
+            handle = self._handle_new_token
+            received = 0
+            async for message in ws:
+                try:
+                    payload = json_loads(message)
+                except ValueError:
+                    logger.debug("Ignoring non-JSON message from token feed")
+                    continue
+                
+                if isinstance(payload, dict):
+                    tokens = payload.get('data', [payload])
+                else:
+                    tokens = payload if isinstance(payload, list) else []
+                for token in tokens:
+                    if isinstance(token, dict):
+                        handle(token, seen_tokens, max_seen_tokens)
+                
+                received += 1
+                if max_messages is not None and received >= max_messages:
+                    break
+    
+    async def monitor_new_tokens(
+        self,
+        interval_minutes: int = 5,
+        max_iterations: int = None,
+        max_seen_tokens: int = 100_000,
+        ws_url: Optional[str] = None
+    ):
+        """Monitor for new token listings and alert on interesting ones.
+        
+        When a WebSocket feed is configured (``ws_url`` or the ``PUMPFUN_WS_URL``
+        environment variable) new tokens are pushed as they are created. If no feed
+        is configured, or it cannot be reached, the monitor polls ``get_latest_coins``
+        every ``interval_minutes`` instead.
         
-        # Track seen tokens
-        seen_tokens = set()
-        iteration = 0
+        Args:
+            interval_minutes: How often to check for new tokens (minutes) when polling
+            max_iterations: Maximum number of polls or feed messages (None for infinite)
+            max_seen_tokens: How many mint addresses to remember before the least
+                recently seen ones are forgotten
+            ws_url: WebSocket URL of a new-coin feed
+        """
+        # Track seen tokens as an LRU so long-running monitors use bounded memory
+        seen_tokens = OrderedDict()
+        ws_url = ws_url or os.getenv('PUMPFUN_WS_URL')
         
         try:
+            if ws_url:
+                if websockets is None:
+                    logger.warning("websockets is not installed; falling back to polling")
+                else:
+                    try:
+                        await self._subscribe_new_tokens(ws_url, seen_tokens, max_seen_tokens, max_iterations)
+                        return
+                    except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+                        logger.warning("Token feed unavailable (%s); falling back to polling", e)
+            
+            logger.info("Starting token monitor (checking every %s minutes)", interval_minutes)
+            handle = self._handle_new_token
+            interval_seconds = interval_minutes * 60
+            iteration = 0
             while max_iterations is None or iteration < max_iterations:
                 iteration += 1
-                logger.info(f"Checking for new tokens (iteration {iteration})...")
+                logger.info("Checking for new tokens (iteration %d)...", iteration)
                 
                 # Get latest tokens
-                response = self.client.get_latest_coins(limit=20)
+                response = await self.client.get_latest_coins(limit=20)
                 tokens = response.get('data', []) if isinstance(response, dict) else (response if isinstance(response, list) else [])
                 
                 for token in tokens:
-                    token_address = token.get('mint')
-                    if not token_address or token_address in seen_tokens:
-                        continue
-                    
-                    # New token found
-                    seen_tokens.add(token_address)
-                    symbol = token.get('symbol', 'UNKNOWN')
-                    name = token.get('name', 'Unnamed Token')
-                    created = format_timestamp(token.get('created_timestamp', 0))
-                    
-                    # Check if this is an interesting token (example criteria)
-                    is_interesting = False
-                    reason = ""
-                    
-                    # Example criteria: High initial liquidity
-                    liquidity = float(token.get('liquidity_usd', 0))
-                    if liquidity > 10000:  # $10k+ initial liquidity
-                        is_interesting = True
-                        reason = f"High initial liquidity: ${liquidity:,.2f}"
-                    
-                    # Example criteria: Specific keywords in name/symbol
-                    keywords = ['pump', 'moon', 'btc', 'eth', 'sol', 'meme']
-                    if any(kw in (symbol + name).lower() for kw in keywords):
-                        is_interesting = True
-                        reason = "Contains popular keywords"
-                    
-                    # Log the new token
-                    if is_interesting:
-                        logger.info(f"🚨 NEW TOKEN ALERT: {name} (${symbol})")
-                        logger.info(f"   🔗 Mint: {token_address}")
-                        logger.info(f"   🕒 Created: {created}")
-                        logger.info(f"   💰 Liquidity: ${liquidity:,.2f}")
-                        logger.info(f"   🔍 Reason: {reason}")
-                        logger.info(f"   🌐 Explorer: https://pump.fun/token/{token_address}")
-                    else:
-                        logger.info(f"New token: {name} (${symbol}) - {created}")
+                    handle(token, seen_tokens, max_seen_tokens)
                 
                 # Wait for the next interval
                 if max_iterations is None or iteration < max_iterations:
-                    time.sleep(interval_minutes * 60)
+                    await asyncio.sleep(interval_seconds)
                     
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             logger.info("Monitoring stopped by user")
         except Exception as e:
-            logger.error(f"Error in token monitor: {e}", exc_info=True)
-        
-        logger.info("Token monitoring stopped")
+            logger.error("Error in token monitor: %s", e)
+            logger.debug("Traceback", exc_info=True)
+        finally:
+            logger.info("Token monitoring stopped")
 
 def display_price_analysis(analysis: Dict):
     """Display price analysis in a formatted way."""
@@ -234,9 +444,9 @@ def display_price_analysis(analysis: Dict):
         print(f"❌ Error: {analysis['error']}")
         return
     
-    print("\n" + "=" * 90)
-    print(f"📊 {analysis.get('name', 'Token')} (${analysis.get('symbol', 'N/A')}) - Price Analysis")
-    print("=" * 90)
+    lines = ["\n" + "=" * 90]
+    lines.append(f"📊 {analysis.get('name', 'Token')} (${analysis.get('symbol', 'N/A')}) - Price Analysis")
+    lines.append("=" * 90)
     
     # Format numbers
     price_current = f"${analysis.get('price_current', 0):,.8f}"
@@ -247,29 +457,30 @@ def display_price_analysis(analysis: Dict):
     change_color = "green" if price_change >= 0 else "red"
     change_sign = "+" if price_change >= 0 else ""
     
-    print(f"\n💵 Current Price: {price_current}")
-    print(f"📈 24h High: {price_high}")
-    print(f"📉 24h Low: {price_low}")
-    print(f"📊 24h Change: {colorize(f'{change_sign}{price_change:,.8f} ({change_sign}{price_change_pct:.2f}%)', change_color)}")
+    lines.append(f"\n💵 Current Price: {price_current}")
+    lines.append(f"📈 24h High: {price_high}")
+    lines.append(f"📉 24h Low: {price_low}")
+    lines.append(f"📊 24h Change: {colorize(f'{change_sign}{price_change:,.8f} ({change_sign}{price_change_pct:.2f}%)', change_color)}")
     
     # Volatility
     volatility = analysis.get('volatility', 0) * 100  # Convert to percentage
-    print(f"🎢 Volatility (24h): {volatility:.2f}%")
+    lines.append(f"🎢 Volatility (24h): {volatility:.2f}%")
     
     # Volume
     total_volume = f"${analysis.get('total_volume', 0):,.2f}"
     avg_volume = f"${analysis.get('avg_volume', 0):,.2f}"
-    print(f"💹 24h Volume: {total_volume}")
-    print(f"📊 Avg. Trade Size: {avg_volume}")
+    lines.append(f"💹 24h Volume: {total_volume}")
+    lines.append(f"📊 Avg. Trade Size: {avg_volume}")
     
     # Additional info
-    print(f"\n📊 Number of Trades: {analysis.get('num_trades', 0):,}")
+    lines.append(f"\n📊 Number of Trades: {analysis.get('num_trades', 0):,}")
     if 'first_trade' in analysis and analysis['first_trade']:
-        print(f"⏰ First Trade: {format_timestamp(analysis['first_trade'])}")
+        lines.append(f"⏰ First Trade: {format_timestamp(analysis['first_trade'])}")
     if 'last_trade' in analysis and analysis['last_trade']:
-        print(f"🕒 Last Trade: {format_timestamp(analysis['last_trade'])}")
+        lines.append(f"🕒 Last Trade: {format_timestamp(analysis['last_trade'])}")
     
-    print("=" * 90 + "\n")
+    lines.append("=" * 90 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def display_wallet_activity(activity: Dict):
     """Display wallet activity in a formatted way."""
@@ -277,46 +488,65 @@ def display_wallet_activity(activity: Dict):
         print(f"❌ Error: {activity['error']}")
         return
     
-    print("\n" + "=" * 90)
-    print(f"👛 Wallet Activity - {activity.get('wallet', 'Unknown')}")
-    print("=" * 90)
+    lines = ["\n" + "=" * 90]
+    lines.append(f"👛 Wallet Activity - {activity.get('wallet', 'Unknown')}")
+    lines.append("=" * 90)
     
     # Portfolio summary
     total_value = f"${activity.get('total_value_usd', 0):,.2f}"
     num_tokens = activity.get('num_tokens', 0)
     
-    print(f"\n💼 Portfolio Value: {colorize(total_value, 'green' if activity.get('total_value_usd', 0) > 0 else 'yellow')}")
-    print(f"📊 Number of Tokens: {num_tokens}")
+    lines.append(f"\n💼 Portfolio Value: {colorize(total_value, 'green' if activity.get('total_value_usd', 0) > 0 else 'yellow')}")
+    lines.append(f"📊 Number of Tokens: {num_tokens}")
     
     # Recent activity
-    print(f"\n🔄 Recent Activity (Last 7 Days)")
-    print(f"   • Trades: {activity.get('recent_trade_count', 0):,}")
-    print(f"   • Volume: ${activity.get('recent_volume_usd', 0):,.2f}")
-    print(f"   • Unique Tokens Traded: {activity.get('unique_tokens_traded', 0)}")
+    lines.append(f"\n🔄 Recent Activity (Last 7 Days)")
+    lines.append(f"   • Trades: {activity.get('recent_trade_count', 0):,}")
+    lines.append(f"   • Volume: ${activity.get('recent_volume_usd', 0):,.2f}")
+    lines.append(f"   • Unique Tokens Traded: {activity.get('unique_tokens_traded', 0)}")
     
     # Top holdings
-    print("\n🏆 Top Holdings")
+    lines.append("\n🏆 Top Holdings")
     holdings = activity.get('top_holdings', [])
     if holdings:
         for i, holding in enumerate(holdings, 1):
             symbol = holding.get('symbol', 'UNKNOWN')
             value = f"${holding.get('value', 0):,.2f}"
             balance = format_number(holding.get('balance', 0), 2)
-            print(f"   {i}. {symbol}: {balance} tokens ({value})")
+            lines.append(f"   {i}. {symbol}: {balance} tokens ({value})")
     else:
-        print("   No significant holdings found")
+        lines.append("   No significant holdings found")
     
-    print("=" * 90 + "\n")
+    lines.append("=" * 90 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+async def main(args) -> None:
+    """Run the selected command against a single shared client."""
+    async with PumpFunAdvanced() as client:
+        if args.command == 'price':
+            analyses = await client.analyze_many(args.token_addresses, args.days)
+            for analysis in analyses:
+                display_price_analysis(analysis)
+        elif args.command == 'wallet':
+            activity = await client.get_wallet_activity(args.wallet_address, args.days)
+            display_wallet_activity(activity)
+        elif args.command == 'monitor':
+            await client.monitor_new_tokens(
+                interval_minutes=args.interval,
+                max_iterations=args.iterations,
+                ws_url=args.ws_url
+            )
 
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Advanced Pump.fun API Examples")
+    parser.add_argument('--verbose', action='store_true', help='Enable debug logging, including tracebacks')
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
     
     # Price analysis command
     price_parser = subparsers.add_parser('price', help='Analyze token price history')
-    price_parser.add_argument('token_address', help='Token mint address')
+    price_parser.add_argument('token_addresses', nargs='+', help='One or more token mint addresses')
     price_parser.add_argument('--days', type=int, default=7, help='Number of days of history to analyze')
     
     # Wallet activity command
@@ -328,20 +558,25 @@ if __name__ == "__main__":
     monitor_parser = subparsers.add_parser('monitor', help='Monitor for new token listings')
     monitor_parser.add_argument('--interval', type=int, default=5, help='Check interval in minutes')
     monitor_parser.add_argument('--iterations', type=int, help='Number of iterations (default: infinite)')
+    monitor_parser.add_argument('--ws-url', help='WebSocket feed of new coins (default: $PUMPFUN_WS_URL, else poll)')
     
     args = parser.parse_args()
     
-    # Initialize the advanced client
-    client = PumpFunAdvanced()
-    
-    # Execute the appropriate command
-    if args.command == 'price':
-        analysis = client.analyze_token_price_history(args.token_address, args.days)
-        display_price_analysis(analysis)
-    elif args.command == 'wallet':
-        activity = client.get_wallet_activity(args.wallet_address, args.days)
-        display_wallet_activity(activity)
-    elif args.command == 'monitor':
-        client.monitor_new_tokens(interval_minutes=args.interval, max_iterations=args.iterations)
-    else:
+    # File writes happen on a background thread so logging never stalls the event loop
+    configure_queued_logging('pump_fun_advanced.log', logging.DEBUG if args.verbose else logging.INFO)
+    
+    if args.command is None:
         parser.print_help()
+    else:
+        # uvloop is a faster drop-in event loop; fall back to asyncio's default if unavailable
+        if sys.platform != 'win32':
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
+        
+        try:
+            asyncio.run(main(args))
+        except KeyboardInterrupt:
+            pass
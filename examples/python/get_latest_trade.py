@@ -7,10 +7,21 @@ across all tokens on Pump.fun.
 
 import json
 import sys
+import time
 import logging
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +39,7 @@ try:
     from utils.python_client import PumpFunAPI
 except ImportError as e:
     logger.error("Failed to import PumpFunAPI. Make sure you've installed the required dependencies.")
-    logger.error(f"Error: {e}")
+    logger.error("Error: %s", e)
     sys.exit(1)
 
 def format_timestamp(timestamp):
@@ -38,6 +49,49 @@ def format_timestamp(timestamp):
     except (TypeError, ValueError):
         return str(timestamp)
 
+def dump_json(data):
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
+# Largest timestamp datetime can represent (9999-12-31 23:59:59 UTC)
+_MAX_TIMESTAMP = 253402300799
+
+def format_timestamps(timestamps):
+    """Convert a batch of Unix timestamps to human-readable format.
+    
+    Produces the same strings as format_timestamp, but converts the whole batch
+    in one vectorized step when NumPy is available.
+    """
+    if np is None or not timestamps:
+        return [format_timestamp(ts) for ts in timestamps]
+    
+    secs = np.fromiter(
+        (ts if isinstance(ts, (int, float)) else np.nan for ts in timestamps),
+        dtype=np.float64,
+        count=len(timestamps)
+    )
+    valid = np.isfinite(secs) & (secs >= 0) & (secs < _MAX_TIMESTAMP)
+    if not valid.any():
+        return [format_timestamp(ts) for ts in timestamps]
+    
+    # Shift to local time with a single UTC offset; fall back if any timestamp
+    # has a different one (the batch spans a DST change). Checking only the
+    # ends would miss e.g. a summer timestamp between two winter ones.
+    valid_secs = np.floor(secs[valid])
+    offsets = {time.localtime(ts).tm_gmtoff for ts in np.unique(valid_secs).tolist()}
+    if len(offsets) != 1:
+        return [format_timestamp(ts) for ts in timestamps]
+    offset = offsets.pop()
+    
+    local = (valid_secs.astype(np.int64) + offset).astype('datetime64[s]')
+    converted = iter(np.datetime_as_string(local, unit='s').tolist())
+    return [
+        next(converted).replace('T', ' ') if is_valid else format_timestamp(ts)
+        for ts, is_valid in zip(timestamps, valid.tolist())
+    ]
+
 def main():
     logger.info("Starting Pump.fun API example: Get Latest Trades")
     
@@ -51,43 +105,52 @@ def main():
         result = client.get_latest_trades(limit=5)
         
         # Debug: Log the raw API response
-        logger.debug(f"Raw API response: {json.dumps(result, indent=2)}")
+        # Only serialize the payload when DEBUG output is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw API response: %s", dump_json(result))
         
         # Handle different response formats
         if isinstance(result, dict):
             if 'trades' in result and result['trades']:
-                print("\nLatest Trades:")
-                print("-" * 100)
-                print(f"{'Token':<15} {'Amount In':<15} {'Amount Out':<15} {'Type':<8} {'Timestamp':<20} {'Tx Hash'}")
-                print("-" * 100)
+                lines = [
+                    "\nLatest Trades:",
+                    "-" * 100,
+                    f"{'Token':<15} {'Amount In':<15} {'Amount Out':<15} {'Type':<8} {'Timestamp':<20} {'Tx Hash'}",
+                    "-" * 100
+                ]
                 
-                for trade in result['trades']:
-                    print(
+                timestamps = format_timestamps([trade.get('timestamp') for trade in result['trades']])
+                for trade, timestamp in zip(result['trades'], timestamps):
+                    lines.append(
                         f"{trade.get('symbol', 'N/A'):<15} "
                         f"{trade.get('sol_amount', 'N/A'):<15} "
                         f"{trade.get('token_amount', 'N/A'):<15} "
                         f"{'BUY' if trade.get('is_buy') else 'SELL':<8} "
-                        f"{format_timestamp(trade.get('timestamp')):<20} "
+                        f"{timestamp:<20} "
                         f"{trade.get('signature', 'N/A')}"
                     )
+                
+                # Emit the whole table in a single write
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 # Handle direct trade object (non-array response)
                 print("\nLatest Trade:")
                 print("-" * 100)
-                print(json.dumps(result, indent=2, default=str))
+                print(dump_json(result))
                 
                 # Log the trade details
-                logger.info(f"Trade: {result.get('symbol')} - "
-                           f"SOL: {result.get('sol_amount')}, "
-                           f"Tokens: {result.get('token_amount')}, "
-                           f"Type: {'BUY' if result.get('is_buy') else 'SELL'}")
+                logger.info("Trade: %s - SOL: %s, Tokens: %s, Type: %s",
+                            result.get('symbol'),
+                            result.get('sol_amount'),
+                            result.get('token_amount'),
+                            'BUY' if result.get('is_buy') else 'SELL')
         else:
-            logger.warning(f"Unexpected response format: {type(result)}")
+            logger.warning("Unexpected response format: %s", type(result))
             print("\nUnexpected response format. Raw response:")
-            print(json.dumps(result, indent=2, default=str))
+            print(dump_json(result))
             
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
         print(f"\nError: {str(e)}")
         print("Check pumpfun_api.log for more details.")
         sys.exit(1)
@@ -0,0 +1,111 @@
+"""
+Logging helpers shared by the Pump.fun example scripts.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``%(asctime)s`` at most once per second.
+
+    Records logged within the same wall-clock second share the cached
+    ``strftime`` result; only the millisecond suffix is formatted per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+def configure_queued_logging(log_file: str, level: int = logging.INFO) -> QueueListener:
+    """Send root logging through a queue drained by a background thread.
+
+    Callers only enqueue records; a ``QueueListener`` thread formats them and writes
+    them to stderr and ``log_file``, so disk writes never block the caller (or the
+    event loop). Any handlers already attached to the root logger are replaced.
+
+    Args:
+        log_file: Path of the log file to append to
+        level: Root logger level
+
+    Returns:
+        The started listener. It is stopped, flushing pending records, at exit.
+    """
+    formatter = CachedTimeFormatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(), logging.FileHandler(log_file)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def buffered_file_handler(log_file: str, capacity: int = 1024, flush_level: int = logging.ERROR) -> MemoryHandler:
+    """Return a handler that keeps records in memory until one is worth keeping.
+
+    Records are buffered and only written to ``log_file`` when a record at
+    ``flush_level`` or above arrives (or the buffer fills), so the records leading
+    up to an error still reach the file. A run that never hits an error never
+    opens the file, and whatever is still buffered at exit is discarded.
+
+    Args:
+        log_file: Path of the log file to append to
+        capacity: Number of records to buffer before writing them anyway
+        flush_level: Lowest level that writes the buffer to disk
+
+    Returns:
+        The handler, ready to add to a logger.
+    """
+    target = logging.FileHandler(log_file, delay=True)
+    target.setFormatter(CachedTimeFormatter(LOG_FORMAT))
+    return MemoryHandler(capacity, flushLevel=flush_level, target=target, flushOnClose=False)
+
+
+def log_json(logger: logging.Logger, label: str, data: Any) -> None:
+    """Log ``data`` as indented JSON at DEBUG level.
+
+    The payload is only serialized (with orjson when installed) if DEBUG records
+    would actually be emitted, so large API responses cost nothing otherwise.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if orjson is not None:
+        dumped = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+    else:
+        dumped = json.dumps(data, indent=2, default=str)
+    logger.debug("%s: %s", label, dumped)
@@ -17,31 +17,48 @@ Examples:
     # Analyze a specific token
     python market_analyzer.py --token TOKEN_ADDRESS
 
+    # Analyze several tokens concurrently
+    python market_analyzer.py --token TOKEN_A TOKEN_B TOKEN_C
+
     # Check wallet's created tokens
     python market_analyzer.py --wallet WALLET_ADDRESS
 """
 
-import argparse
-import json
+import asyncio
 import logging
+import os
 import sys
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+# Default on-disk location for cached search and listing results
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'pumpfun')
 
 # Add the parent directory to the path so we can import the client
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from utils.python_client import PumpFunAPI
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('market_analyzer.log')
-    ]
-)
+from utils.schemas import decode_list_data, list_items
+from examples.python.logging_utils import configure_queued_logging, log_json
+
+# The HTTP clients (requests, httpx) are imported where they are first needed,
+# so that `--help` and importing this module for its helpers stay cheap
+if TYPE_CHECKING:
+    from utils.python_client import PumpFunAPI
+
+# Logging is configured in main() (see configure_queued_logging)
 logger = logging.getLogger(__name__)
 
 # Terminal colors for better output
@@ -56,11 +73,26 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Escape codes by name, in the spellings callers use ('cyan' or 'CYAN')
+_COLOR_CODES = {
+    key: code
+    for name, code in vars(Colors).items() if name.isupper()
+    for key in (name, name.lower())
+}
+_BOLD = Colors.BOLD
+_ENDC = Colors.ENDC
+
 def colorize(text: str, color: str, bold: bool = False) -> str:
     """Apply color and formatting to text for terminal output."""
-    color_code = getattr(Colors, color.upper(), '')
-    bold_code = Colors.BOLD if bold else ''
-    return f"{bold_code}{color_code}{text}{Colors.ENDC}"
+    color_code = _COLOR_CODES.get(color)
+    if color_code is None:
+        color_code = _COLOR_CODES.get(color.upper(), '')
+    return f"{_BOLD if bold else ''}{color_code}{text}{_ENDC}"
+
+# Lower bounds and suffixes of the format_number scales
+_SCALE_BOUNDS = (1_000, 1_000_000, 1_000_000_000)
+_SCALE_DIVISORS = (1, 1_000, 1_000_000, 1_000_000_000)
+_SCALE_SUFFIXES = ('', 'K', 'M', 'B')
 
 def format_number(value: float, decimal_places: int = 2) -> str:
     """Format large numbers with K, M, B suffixes."""
@@ -68,15 +100,36 @@ def format_number(value: float, decimal_places: int = 2) -> str:
         return 'N/A'
     try:
         value = float(value)
-        if value >= 1_000_000_000:
-            return f"{value/1_000_000_000:.{decimal_places}f}B"
-        elif value >= 1_000_000:
-            return f"{value/1_000_000:.{decimal_places}f}M"
-        elif value >= 1_000:
-            return f"{value/1_000:.{decimal_places}f}K"
-        return f"{value:.{decimal_places}f}"
     except (TypeError, ValueError):
         return str(value)
+    # NaN compares false against every bound, so keep it unscaled
+    scale = bisect_right(_SCALE_BOUNDS, value) if value == value else 0
+    return f"{value / _SCALE_DIVISORS[scale]:.{decimal_places}f}{_SCALE_SUFFIXES[scale]}"
+
+def _to_float(value: Any) -> float:
+    """Convert an API value to float, mapping missing or unparseable values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+def format_numbers(values: List[Any], decimal_places: int = 2) -> List[str]:
+    """Format a column of numbers exactly like format_number.
+    
+    With NumPy available the scale of every value is picked in one vectorized
+    step instead of a chain of comparisons per value.
+    """
+    if np is None or not values:
+        return [format_number(value, decimal_places) for value in values]
+    
+    nums = np.fromiter((_to_float(v) for v in values), dtype=np.float64, count=len(values))
+    buckets = np.digitize(nums, _SCALE_BOUNDS)
+    scaled = nums / np.take(_SCALE_DIVISORS, buckets)
+    
+    return [
+        f"{num:.{decimal_places}f}{_SCALE_SUFFIXES[bucket]}" if num == num else format_number(value, decimal_places)
+        for value, num, bucket in zip(values, scaled.tolist(), buckets.tolist())
+    ]
 
 def format_timestamp(timestamp: int) -> str:
     """Convert Unix timestamp to human-readable format."""
@@ -85,9 +138,73 @@ def format_timestamp(timestamp: int) -> str:
     except (TypeError, ValueError):
         return str(timestamp)
 
+# Shared default client, created on first use by _get_client
+_client_singleton: Optional['PumpFunAPI'] = None
+
+def _get_client() -> 'PumpFunAPI':
+    """Return the module-wide PumpFunAPI, so analyzers reuse one Session pool."""
+    global _client_singleton
+    if _client_singleton is None:
+        from utils.python_client import PumpFunAPI
+        _client_singleton = PumpFunAPI()
+    return _client_singleton
+
 class MarketAnalyzer:
-    def __init__(self):
-        self.client = PumpFunAPI()
+    def __init__(
+        self,
+        client: Optional['PumpFunAPI'] = None,
+        max_workers: int = 8,
+        cache_ttl: float = 30.0,
+        cache_dir: str = DEFAULT_CACHE_DIR
+    ):
+        """Initialize the analyzer.
+        
+        Args:
+            client: API client to use. Defaults to a module-wide client, so every
+                analyzer shares one keep-alive connection pool.
+            max_workers: Threads used by analyze_many. Kept within the client's
+                connection pool so every worker reuses a keep-alive connection.
+            cache_ttl: Seconds to keep top-token and search results on disk so
+                repeated runs skip the API (0 disables; requires diskcache)
+            cache_dir: Directory of the on-disk cache
+        """
+        self.client = client if client is not None else _get_client()
+        self.max_workers = max_workers
+        self._pool = None  # Created on first use by _get_pool
+        self.cache_ttl = cache_ttl
+        self._cache = diskcache.Cache(cache_dir) if diskcache is not None and cache_ttl > 0 else None
+    
+    def _cached(self, key: Hashable, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """Return a cached result for ``key``, calling ``fetch`` on a miss.
+        
+        Empty results are not cached, since they are also what the fetchers
+        return on errors.
+        """
+        if self._cache is None:
+            return fetch()
+        
+        result = self._cache.get(key)
+        if result is None:
+            result = fetch()
+            if result:
+                self._cache.set(key, result, expire=self.cache_ttl)
+        else:
+            logger.debug("Cache hit for %s", key)
+        return result
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._cache is not None:
+            self._cache.close()
 
     def get_top_tokens(self, limit: int = 10) -> List[Dict]:
         """Get top tokens by market cap.
@@ -95,23 +212,18 @@ class MarketAnalyzer:
         Uses the latest coins endpoint which returns tokens sorted by creation time (newest first).
         This is the closest approximation to 'top tokens' available in the API.
         """
-        logger.info(f"Fetching top {limit} latest tokens...")
+        return self._cached(('top_tokens', limit), lambda: self._fetch_top_tokens(limit))
+    
+    def _fetch_top_tokens(self, limit: int) -> List[Dict]:
+        logger.info("Fetching top %s latest tokens...", limit)
         try:
-            # Get multiple tokens in a single request if possible
-            response = self.client.get_latest_coins(limit=limit)
+            # Stream coins from a single request, stopping once we have enough
+            tokens = list(self.client.iter_latest_coins(limit=limit))
             
-            # Handle different response formats
-            if isinstance(response, dict) and 'data' in response:
-                tokens = response['data']
-            elif isinstance(response, list):
-                tokens = response
-            else:
-                tokens = []
-                
-            logger.info(f"Found {len(tokens)} tokens")
-            return tokens if isinstance(tokens, list) else []
+            logger.info("Found %s tokens", len(tokens))
+            return tokens
         except Exception as e:
-            logger.error(f"Error fetching top tokens: {e}", exc_info=True)
+            logger.error("Error fetching top tokens: %s", e, exc_info=True)
             return []
 
     def search_tokens(self, query: str, limit: int = 10) -> List[Dict]:
@@ -124,62 +236,68 @@ class MarketAnalyzer:
         Returns:
             List of token dictionaries matching the search query
         """
-        logger.info(f"Searching for tokens matching: {query}")
+        return self._cached(('search_tokens', query, limit), lambda: self._fetch_search_tokens(query, limit))
+    
+    def _fetch_search_tokens(self, query: str, limit: int) -> List[Dict]:
+        logger.info("Searching for tokens matching: %s", query)
         results = []
         
         try:
-            # First try an exact match search
-            logger.debug(f"Trying exact match search for: {query}")
-            exact_results = self.client.search_coins(
-                search_term=query,
-                limit=limit,
-                search_type='exact'
-            )
+            # Every search costs a request of quota, so the fuzzy search is only
+            # sent once the exact matches are known to fall short of the limit.
+            # An address-like query almost always matches exactly.
+            looks_like_address = len(query) > 20
+            logger.debug("Trying exact search for: %s", query)
             
-            # Process exact match results
-            if isinstance(exact_results, dict) and 'data' in exact_results:
-                results.extend(exact_results['data'])
-            elif isinstance(exact_results, list):
-                results.extend(exact_results)
-            
-            # If we don't have enough results, try a fuzzy search
-            if len(results) < limit:
-                logger.debug(f"Trying fuzzy search for: {query}")
-                fuzzy_results = self.client.search_coins(
+            def search(search_type: str) -> List[Dict]:
+                # Decoded straight to the list of records
+                return self.client.search_coins(
                     search_term=query,
-                    limit=limit - len(results),
-                    search_type='fuzzy'
+                    limit=limit,
+                    search_type=search_type,
+                    decoder=decode_list_data
                 )
-                
-                # Process fuzzy match results, avoiding duplicates
-                if isinstance(fuzzy_results, dict) and 'data' in fuzzy_results:
-                    # Filter out duplicates by mint address
-                    existing_mints = {t.get('mint') for t in results if t.get('mint')}
-                    new_results = [t for t in fuzzy_results['data'] 
-                                 if t.get('mint') and t['mint'] not in existing_mints]
-                    results.extend(new_results)
-                elif isinstance(fuzzy_results, list):
-                    existing_mints = {t.get('mint') for t in results if t.get('mint')}
-                    new_results = [t for t in fuzzy_results 
-                                 if isinstance(t, dict) and t.get('mint') and t['mint'] not in existing_mints]
-                    results.extend(new_results)
+            
+            # Mint addresses already in results, updated as tokens are appended
+            seen_mints = set()
+            for token in search('exact'):
+                if not isinstance(token, dict):
+                    continue
+                mint = token.get('mint')
+                if mint in seen_mints:
+                    continue
+                if mint:
+                    seen_mints.add(mint)
+                results.append(token)
+            
+            # Only use the fuzzy results if the exact matches didn't fill the limit
+            if len(results) < limit:
+                logger.debug("Trying fuzzy search for: %s", query)
+                # Fuzzy matches must have a mint address not already returned
+                for token in search('fuzzy'):
+                    if not isinstance(token, dict):
+                        continue
+                    mint = token.get('mint')
+                    if mint and mint not in seen_mints:
+                        seen_mints.add(mint)
+                        results.append(token)
             
             # If we still don't have results and it looks like an address, try direct fetch
-            if not results and len(query) > 20:  # Likely a token address
-                logger.debug(f"Trying direct token fetch for address: {query}")
+            if not results and looks_like_address:
+                logger.debug("Trying direct token fetch for address: %s", query)
                 try:
                     # Try to get token details directly
                     token_details = self.client._request('GET', f'/tokens/{query}')
                     if token_details:
                         results.append(token_details)
                 except Exception as e:
-                    logger.debug(f"Direct token fetch failed: {e}")
+                    logger.debug("Direct token fetch failed: %s", e)
             
             # Ensure we don't exceed the limit
             results = results[:limit]
             
             # Log the number of results found
-            logger.info(f"Found {len(results)} matching tokens")
+            logger.info("Found %s matching tokens", len(results))
             
             # Enhance results with additional data if needed
             for token in results:
@@ -199,12 +317,12 @@ class MarketAnalyzer:
             return results
                 
         except Exception as e:
-            logger.error(f"Error searching tokens: {e}", exc_info=True)
+            logger.error("Error searching tokens: %s", e, exc_info=True)
             return []
     
     def get_token_analysis(self, token_address: str) -> Dict:
         """Get detailed analysis for a specific token."""
-        logger.info(f"Analyzing token: {token_address}")
+        logger.info("Analyzing token: %s", token_address)
         result = {
             'token_info': None,
             'trades': [],
@@ -213,126 +331,253 @@ class MarketAnalyzer:
         
         try:
             # Get token details
-            logger.debug(f"Searching for token: {token_address}")
-            search_results = self.client.search_coins(
+            logger.debug("Searching for token: %s", token_address)
+            token_data = self.client.search_coins(
                 search_term=token_address,
                 limit=1,
-                search_type='exact'
+                search_type='exact',
+                decoder=decode_list_data
             )
-            logger.debug(f"Token search results: {json.dumps(search_results, indent=2)}")
-            
-            # Handle different response formats
-            token_data = []
-            if isinstance(search_results, dict):
-                token_data = search_results.get('data', [])
-            elif isinstance(search_results, list):
-                token_data = search_results
+            log_json(logger, "Token search results", token_data)
             
-            if token_data and len(token_data) > 0:
+            if token_data:
                 result['token_info'] = token_data[0] if isinstance(token_data[0], dict) else {}
                 
                 # Get recent trades
-                logger.debug(f"Fetching trades for token: {token_address}")
+                logger.debug("Fetching trades for token: %s", token_address)
                 try:
                     trades = self.client.get_token_trades(
                         token_address=token_address,
-                        limit=10
+                        limit=10,
+                        decoder=decode_list_data
                     )
-                    logger.debug(f"Trades response: {json.dumps(trades, indent=2)}")
-                    if isinstance(trades, dict):
-                        result['trades'] = trades.get('trades', [])[:5]
-                    elif isinstance(trades, list):
-                        result['trades'] = trades[:5]
+                    log_json(logger, "Trades response", trades)
+                    result['trades'] = trades[:5]
                 except Exception as trade_error:
-                    logger.error(f"Error fetching trades: {trade_error}", exc_info=True)
+                    logger.error("Error fetching trades: %s", trade_error, exc_info=True)
                 
                 # Get token comments
-                logger.debug(f"Fetching comments for token: {token_address}")
+                logger.debug("Fetching comments for token: %s", token_address)
                 try:
-                    comments = self.client.get_token_comments(token_address, limit=5)
-                    logger.debug(f"Comments response: {json.dumps(comments, indent=2)}")
-                    if isinstance(comments, dict):
-                        result['comments'] = comments.get('replies', [])[:3]
-                    elif isinstance(comments, list):
-                        result['comments'] = comments[:3]
+                    comments = self.client.get_token_comments(token_address, limit=5, decoder=decode_list_data)
+                    log_json(logger, "Comments response", comments)
+                    result['comments'] = comments[:3]
                 except Exception as comment_error:
-                    logger.error(f"Error fetching comments: {comment_error}", exc_info=True)
+                    logger.error("Error fetching comments: %s", comment_error, exc_info=True)
                 
         except Exception as e:
-            logger.error(f"Error analyzing token: {e}", exc_info=True)
+            logger.error("Error analyzing token: %s", e, exc_info=True)
             
         return result
+    
+    def analyze_many(self, token_addresses: List[str]) -> List[Dict]:
+        """Run get_token_analysis for several tokens concurrently.
+        
+        The blocking requests release the GIL while waiting on the network, so a
+        small thread pool overlaps the round-trips. All workers share the client's
+        session and rate limiter.
+        
+        Args:
+            token_addresses: Token mint addresses to analyze
+            
+        Returns:
+            One analysis dictionary per address, in the same order
+        """
+        if len(token_addresses) <= 1:
+            return [self.get_token_analysis(address) for address in token_addresses]
+        
+        return list(self._get_pool().map(self.get_token_analysis, token_addresses))
 
     def get_wallet_analysis(self, wallet_address: str) -> Dict[str, Any]:
         """Get analysis for a wallet address."""
-        logger.info(f"Analyzing wallet: {wallet_address}")
+        logger.info("Analyzing wallet: %s", wallet_address)
         result = {
             'holdings': [],
             'created_tokens': []
         }
         
         try:
-            # Get wallet holdings
-            logger.debug(f"Fetching holdings for wallet: {wallet_address}")
-            holdings = self.client.get_wallet_holdings(
+            # Holdings and created tokens are independent, so fetch them together
+            logger.debug("Fetching holdings and created tokens for wallet: %s", wallet_address)
+            pool = self._get_pool()
+            holdings_future = pool.submit(
+                self.client.get_wallet_holdings,
                 wallet_address=wallet_address,
                 limit=10
             )
-            logger.debug(f"Holdings response: {json.dumps(holdings, indent=2)}")
-            
-            # Handle different response formats for holdings
-            if isinstance(holdings, dict):
-                result['holdings'] = holdings.get('data', [])
-            elif isinstance(holdings, list):
-                result['holdings'] = holdings
-            
-            # Get created tokens
-            logger.debug(f"Fetching created tokens for wallet: {wallet_address}")
-            created = self.client.get_wallet_created_coins(
+            created_future = pool.submit(
+                self.client.get_wallet_created_coins,
                 wallet_address=wallet_address,
                 limit=10
             )
-            logger.debug(f"Created tokens response: {json.dumps(created, indent=2)}")
+            holdings = holdings_future.result()
+            log_json(logger, "Holdings response", holdings)
+            
+            result['holdings'] = list_items(holdings)
             
-            # Handle different response formats for created tokens
-            if isinstance(created, dict):
-                result['created_tokens'] = created.get('data', [])
-            elif isinstance(created, list):
-                result['created_tokens'] = created
+            created = created_future.result()
+            log_json(logger, "Created tokens response", created)
+            
+            result['created_tokens'] = list_items(created)
             
         except Exception as e:
-            logger.error(f"Error analyzing wallet: {e}", exc_info=True)
+            logger.error("Error analyzing wallet: %s", e, exc_info=True)
             
         return result
 
+class AsyncMarketAnalyzer:
+    """asyncio counterpart to MarketAnalyzer for the multi-request analyses.
+    
+    Independent lookups are issued concurrently over the shared pooled
+    AsyncPumpFunAPI client instead of one round-trip after another.
+    """
+    
+    def __init__(self, api_key: str = None):
+        from utils.async_client import AsyncPumpFunAPI
+        self.client = AsyncPumpFunAPI(api_key=api_key)
+    
+    async def __aenter__(self) -> 'AsyncMarketAnalyzer':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+    
+    async def get_token_analysis(self, token_address: str) -> Dict:
+        """Get detailed analysis for a specific token. See MarketAnalyzer.get_token_analysis."""
+        logger.info("Analyzing token: %s", token_address)
+        result = {
+            'token_info': None,
+            'trades': [],
+            'comments': []
+        }
+        
+        try:
+            # Get token details
+            logger.debug("Searching for token: %s", token_address)
+            token_data = await self.client.search_coins(
+                search_term=token_address,
+                limit=1,
+                search_type='exact',
+                decoder=decode_list_data
+            )
+            log_json(logger, "Token search results", token_data)
+            
+            if token_data:
+                result['token_info'] = token_data[0] if isinstance(token_data[0], dict) else {}
+                
+                # Trades and comments are independent, so fetch them concurrently
+                logger.debug("Fetching trades and comments for token: %s", token_address)
+                trades, comments = await asyncio.gather(
+                    self.client.get_token_trades(token_address=token_address, limit=10, decoder=decode_list_data),
+                    self.client.get_token_comments(token_address, limit=5, decoder=decode_list_data),
+                    return_exceptions=True
+                )
+                
+                if isinstance(trades, Exception):
+                    logger.error("Error fetching trades: %s", trades)
+                else:
+                    log_json(logger, "Trades response", trades)
+                    result['trades'] = trades[:5]
+                
+                if isinstance(comments, Exception):
+                    logger.error("Error fetching comments: %s", comments)
+                else:
+                    log_json(logger, "Comments response", comments)
+                    result['comments'] = comments[:3]
+                
+        except Exception as e:
+            logger.error("Error analyzing token: %s", e, exc_info=True)
+            
+        return result
+    
+    async def analyze_many(self, token_addresses: List[str]) -> List[Dict]:
+        """Analyze several tokens concurrently, returning results in input order."""
+        return list(await asyncio.gather(
+            *(self.get_token_analysis(address) for address in token_addresses)
+        ))
+
+    async def get_wallet_analysis(self, wallet_address: str) -> Dict[str, Any]:
+        """Get analysis for a wallet address. See MarketAnalyzer.get_wallet_analysis."""
+        logger.info("Analyzing wallet: %s", wallet_address)
+        result = {
+            'holdings': [],
+            'created_tokens': []
+        }
+        
+        try:
+            # Holdings and created tokens are independent, so fetch them concurrently
+            logger.debug("Fetching holdings and created tokens for wallet: %s", wallet_address)
+            holdings, created = await asyncio.gather(
+                self.client.get_wallet_holdings(wallet_address=wallet_address, limit=10),
+                self.client.get_wallet_created_coins(wallet_address=wallet_address, limit=10)
+            )
+            log_json(logger, "Holdings response", holdings)
+            log_json(logger, "Created tokens response", created)
+            
+            result['holdings'] = list_items(holdings)
+            result['created_tokens'] = list_items(created)
+            
+        except Exception as e:
+            logger.error("Error analyzing wallet: %s", e, exc_info=True)
+            
+        return result
+
+async def _analyze_wallet(wallet_address: str) -> Dict[str, Any]:
+    """Run the wallet analysis for the CLI on a single async client."""
+    async with AsyncMarketAnalyzer() as analyzer:
+        return await analyzer.get_wallet_analysis(wallet_address)
+
+async def _analyze_tokens(token_addresses: List[str]) -> List[Dict]:
+    """Run the token analyses for the CLI on a single async client."""
+    async with AsyncMarketAnalyzer() as analyzer:
+        return await analyzer.analyze_many(token_addresses)
+
 def display_top_tokens(tokens: List[Dict]):
     """Display top tokens in a detailed format with key metrics."""
     if not tokens:
         print("No tokens found.")
         return
     
-    # Calculate some statistics
-    total_market_cap = sum(float(token.get('market_cap', 0)) for token in tokens)
-    avg_market_cap = total_market_cap / len(tokens) if tokens else 0
+    # Calculate some statistics over the whole column at once; missing or
+    # unparseable market caps count as zero
+    market_caps = [_to_float(token.get('market_cap') or 0) for token in tokens]
+    if np is not None:
+        total_market_cap = float(np.nansum(market_caps))
+    else:
+        total_market_cap = sum(cap for cap in market_caps if cap == cap)
+    avg_market_cap = total_market_cap / len(tokens)
     
-    print("\n" + "=" * 90)
-    print(f"{colorize('TOP TOKENS', 'yellow', bold=True)} (Showing {len(tokens)} latest tokens)")
-    print(f"Total Market Cap: {colorize(f'${total_market_cap:,.2f}', 'green' if total_market_cap > 0 else 'red')}")
-    print(f"Average Market Cap: {colorize(f'${avg_market_cap:,.2f}', 'cyan')}")
-    print("=" * 90)
+    # Pre-format the supply columns in one batch each
+    total_supplies = format_numbers([token.get('total_supply') for token in tokens], 0)
+    circ_supplies = format_numbers([token.get('circulating_supply') for token in tokens], 0)
+    
+    header = [
+        "\n" + "=" * 90,
+        f"{colorize('TOP TOKENS', 'yellow', bold=True)} (Showing {len(tokens)} latest tokens)",
+        f"Total Market Cap: {colorize(f'${total_market_cap:,.2f}', 'green' if total_market_cap > 0 else 'red')}",
+        f"Average Market Cap: {colorize(f'${avg_market_cap:,.2f}', 'cyan')}",
+        "=" * 90,
+    ]
+    sys.stdout.write("\n".join(header) + "\n")
     
     for i, token in enumerate(tokens, 1):
-        print("\n" + "-" * 90)
-        print(f"{colorize(f'TOKEN #{i}:', 'yellow', bold=True)} {colorize(token.get('name', 'N/A'), 'cyan', bold=True)} "
-              f"({colorize(token.get('symbol', 'N/A'), 'green')})")
-        print("-" * 90)
+        # Build each token block in memory and emit it with a single write
+        lines = []
+        lines.append("\n" + "-" * 90)
+        lines.append(f"{colorize(f'TOKEN #{i}:', 'yellow', bold=True)} {colorize(token.get('name', 'N/A'), 'cyan', bold=True)} "
+                     f"({colorize(token.get('symbol', 'N/A'), 'green')})")
+        lines.append("-" * 90)
         
         # Basic Info
-        print(f"\n{colorize('📝 BASIC INFORMATION', 'blue', bold=True)}")
-        print(f"  {colorize('• Symbol:', 'cyan')} {token.get('symbol', 'N/A')}")
-        print(f"  {colorize('• Name:', 'cyan')} {token.get('name', 'N/A')}")
-        print(f"  {colorize('• Mint Address:', 'cyan')} {token.get('mint', 'N/A')}")
-        print(f"  {colorize('• Creator:', 'cyan')} {token.get('creator', 'N/A')}")
+        lines.append(f"\n{colorize('📝 BASIC INFORMATION', 'blue', bold=True)}")
+        lines.append(f"  {colorize('• Symbol:', 'cyan')} {token.get('symbol', 'N/A')}")
+        lines.append(f"  {colorize('• Name:', 'cyan')} {token.get('name', 'N/A')}")
+        lines.append(f"  {colorize('• Mint Address:', 'cyan')} {token.get('mint', 'N/A')}")
+        lines.append(f"  {colorize('• Creator:', 'cyan')} {token.get('creator', 'N/A')}")
         
         # Format creation time
         created_at = token.get('created_at', token.get('created_timestamp', 0))
@@ -346,30 +591,30 @@ def display_top_tokens(tokens: List[Dict]):
                     created_str = datetime.fromtimestamp(created_at).strftime('%Y-%m-%d %H:%M:%S')
                 else:
                     created_str = str(created_at)
-                print(f"  {colorize('• Created:', 'cyan')} {created_str}")
+                lines.append(f"  {colorize('• Created:', 'cyan')} {created_str}")
             except (ValueError, TypeError, OverflowError) as e:
-                print(f"  {colorize('• Created:', 'cyan')} {created_at}")
+                lines.append(f"  {colorize('• Created:', 'cyan')} {created_at}")
         
         # Market Data
-        print(f"\n{colorize('📊 MARKET DATA', 'blue', bold=True)}")
+        lines.append(f"\n{colorize('📊 MARKET DATA', 'blue', bold=True)}")
         
         # Price information
         price = token.get('price_usd') or token.get('price')
         if price is not None:
             try:
                 price_float = float(price)
-                print(f"  {colorize('• Price:', 'cyan')} ${price_float:,.8f}")
+                lines.append(f"  {colorize('• Price:', 'cyan')} ${price_float:,.8f}")
             except (ValueError, TypeError):
-                print(f"  {colorize('• Price:', 'cyan')} {price}")
+                lines.append(f"  {colorize('• Price:', 'cyan')} {price}")
         
         # Market cap
         market_cap = token.get('market_cap')
         if market_cap is not None:
             try:
                 market_cap_float = float(market_cap)
-                print(f"  {colorize('• Market Cap:', 'cyan')} ${market_cap_float:,.2f}")
+                lines.append(f"  {colorize('• Market Cap:', 'cyan')} ${market_cap_float:,.2f}")
             except (ValueError, TypeError):
-                print(f"  {colorize('• Market Cap:', 'cyan')} {market_cap}")
+                lines.append(f"  {colorize('• Market Cap:', 'cyan')} {market_cap}")
         
         # 24h change
         price_change = token.get('price_change_24h')
@@ -379,47 +624,45 @@ def display_top_tokens(tokens: List[Dict]):
                 change_str = f"{abs(change):.2f}%"
                 change_color = "green" if change >= 0 else "red"
                 change_arrow = "↑" if change >= 0 else "↓"
-                print(f"  {colorize('• 24h Change:', 'cyan')} {colorize(f'{change_arrow} {change_str}', change_color)}")
+                lines.append(f"  {colorize('• 24h Change:', 'cyan')} {colorize(f'{change_arrow} {change_str}', change_color)}")
             except (ValueError, TypeError):
                 pass
         
         # Supply Info
-        print(f"\n{colorize('📦 SUPPLY', 'blue', bold=True)}")
+        lines.append(f"\n{colorize('📦 SUPPLY', 'blue', bold=True)}")
         
         # Total supply
         total_supply = token.get('total_supply')
         if total_supply is not None:
-            try:
-                supply = float(total_supply)
-                print(f"  {colorize('• Total Supply:', 'cyan')} {format_number(supply, 0)}")
-            except (ValueError, TypeError):
-                print(f"  {colorize('• Total Supply:', 'cyan')} {total_supply}")
+            lines.append(f"  {colorize('• Total Supply:', 'cyan')} {total_supplies[i - 1]}")
         
         # Circulating supply if available
         circ_supply = token.get('circulating_supply')
         if circ_supply is not None:
             try:
                 circ = float(circ_supply)
-                print(f"  {colorize('• Circulating Supply:', 'cyan')} {format_number(circ, 0)}")
+                lines.append(f"  {colorize('• Circulating Supply:', 'cyan')} {circ_supplies[i - 1]}")
                 
                 # Calculate and show percentage of total supply in circulation
                 if total_supply and float(total_supply) > 0:
                     circ_pct = (circ / float(total_supply)) * 100
-                    print(f"  {colorize('• % in Circulation:', 'cyan')} {circ_pct:.2f}%")
+                    lines.append(f"  {colorize('• % in Circulation:', 'cyan')} {circ_pct:.2f}%")
             except (ValueError, TypeError):
-                print(f"  {colorize('• Circulating Supply:', 'cyan')} {circ_supply}")
+                lines.append(f"  {colorize('• Circulating Supply:', 'cyan')} {circ_supply}")
         
         # Explorer link
         if 'mint' in token:
-            print(f"\n{colorize('🔗 EXPLORER', 'blue', bold=True)}")
-            print(f"  {colorize('• Pump.fun:', 'cyan')} https://pump.fun/token/{token['mint']}")
-            print(f"  {colorize('• Solscan:', 'cyan')} https://solscan.io/token/{token['mint']}")
+            lines.append(f"\n{colorize('🔗 EXPLORER', 'blue', bold=True)}")
+            lines.append(f"  {colorize('• Pump.fun:', 'cyan')} https://pump.fun/token/{token['mint']}")
+            lines.append(f"  {colorize('• Solscan:', 'cyan')} https://solscan.io/token/{token['mint']}")
         
-        print("-" * 90)
+        lines.append("-" * 90)
         
         # Add a separator between tokens if not the last one
         if i < len(tokens):
-            print("\n" + "=" * 90 + "\n")
+            lines.append("\n" + "=" * 90 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def display_token_analysis(analysis: Dict):
     """Display detailed token analysis."""
@@ -453,31 +696,40 @@ def display_token_analysis(analysis: Dict):
             print(f"- {comment.get('author', 'Anonymous')}: {comment.get('content', '')}")
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Pump.fun Market Analyzer')
     parser.add_argument('--top', type=int, help='Show top N tokens by market cap')
     parser.add_argument('--search', type=str, help='Search for tokens matching the query')
-    parser.add_argument('--token', type=str, help='Analyze a specific token by address')
+    parser.add_argument('--token', type=str, nargs='+', help='Analyze one or more tokens by address')
     parser.add_argument('--wallet', type=str, help='Analyze a wallet address')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--no-cache', action='store_true', help='Always query the API instead of using cached results')
     
     args = parser.parse_args()
     
+    # Log files are written by a background thread, off the API-call path
+    configure_queued_logging('market_analyzer.log')
+    
     if args.debug:
         logger.setLevel(logging.DEBUG)
     
-    analyzer = MarketAnalyzer()
-    
-    if args.top:
-        tokens = analyzer.get_top_tokens(limit=args.top)
-        display_top_tokens(tokens)
-    elif args.search:
-        tokens = analyzer.search_tokens(args.search)
-        display_top_tokens(tokens)
+    if args.top or args.search:
+        # Only the listing commands use the sync client and its disk cache
+        analyzer = MarketAnalyzer(cache_ttl=0 if args.no_cache else 30.0)
+        try:
+            if args.top:
+                tokens = analyzer.get_top_tokens(limit=args.top)
+            else:
+                tokens = analyzer.search_tokens(args.search)
+            display_top_tokens(tokens)
+        finally:
+            analyzer.close()
     elif args.token:
-        analysis = analyzer.get_token_analysis(args.token)
-        display_token_analysis(analysis)
+        for analysis in asyncio.run(_analyze_tokens(args.token)):
+            display_token_analysis(analysis)
     elif args.wallet:
-        wallet_data = analyzer.get_wallet_analysis(args.wallet)
+        wallet_data = asyncio.run(_analyze_wallet(args.wallet))
         
         if wallet_data['created_tokens']:
             print(f"\n{colorize('Created Tokens:', 'blue', bold=True)}")
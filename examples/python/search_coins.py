@@ -5,79 +5,50 @@ This script demonstrates how to use the PumpFunAPI client to search for tokens
 on Pump.fun by name or symbol.
 """
 
-import json
 import sys
 import logging
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pumpfun_search.log')
-    ]
-)
+# Logging is configured in main() (see configure_queued_logging)
 logger = logging.getLogger(__name__)
 
 # Add the parent directory to the path so we can import the client
 sys.path.append(str(Path(__file__).parent.parent.parent))
 try:
-    from utils.python_client import PumpFunAPI
+    from examples.python.logging_utils import configure_queued_logging, log_json
 except ImportError as e:
-    logger.error("Failed to import PumpFunAPI. Make sure you've installed the required dependencies.")
-    logger.error(f"Error: {e}")
+    logger.error("Failed to import the logging helpers. Make sure you've installed the required dependencies.")
+    logger.error("Error: %s", e)
     sys.exit(1)
 
-def print_usage():
-    """Print usage instructions."""
-    print("\nUsage: python search_coins.py <search_term> [options]")
-    print("\nOptions:")
-    print("  <search_term>    The token name or symbol to search for (required)")
-    print("  --limit N       Number of results to return (default: 5)")
-    print("  --exact         Use exact match instead of fuzzy search")
-    print("  --debug         Enable debug logging")
-    print("\nExamples:")
-    print("  python search_coins.py ethereum")
-    print("  python search_coins.py btc --limit 10")
-    print("  python search_coins.py ""solana"" --exact")
-
-def parse_arguments(args):
+def parse_arguments(args=None):
     """Parse command line arguments."""
-    if not args or args[0] in ('-h', '--help'):
-        print_usage()
-        sys.exit(0)
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Search for tokens on Pump.fun by name or symbol.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "Examples:\n"
+            "  python search_coins.py ethereum\n"
+            "  python search_coins.py btc --limit 10\n"
+            "  python search_coins.py \"solana\" --exact"
+        )
+    )
+    parser.add_argument('search_term', help='The token name or symbol to search for')
+    parser.add_argument('--limit', type=int, default=5, help='Number of results to return (default: 5, max: 100)')
+    parser.add_argument('--exact', action='store_const', const='exact', default='fuzzy', dest='search_type',
+                        help='Use exact match instead of fuzzy search')
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     
-    search_term = args[0]
-    limit = 5
-    search_type = 'fuzzy'
+    parsed = parser.parse_args(args)
+    parsed.limit = max(1, min(100, parsed.limit))  # Clamp between 1 and 100
     
-    i = 1
-    while i < len(args):
-        if args[i] == '--limit' and i + 1 < len(args):
-            try:
-                limit = max(1, min(100, int(args[i + 1])))  # Clamp between 1 and 100
-                i += 2
-            except ValueError:
-                logger.error(f"Invalid limit value: {args[i+1]}. Using default limit of 5.")
-                i += 2
-        elif args[i] == '--exact':
-            search_type = 'exact'
-            i += 1
-        elif args[i] == '--debug':
-            logging.getLogger().setLevel(logging.DEBUG)
-            logger.debug("Debug logging enabled")
-            i += 1
-        else:
-            logger.warning(f"Unknown argument: {args[i]}")
-            i += 1
+    if parsed.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("Debug logging enabled")
     
-    return {
-        'search_term': search_term,
-        'limit': limit,
-        'search_type': search_type
-    }
+    return parsed
 
 def format_market_cap(market_cap):
     """Format market cap value for display."""
@@ -97,26 +68,33 @@ def format_market_cap(market_cap):
         return str(market_cap)
 
 def main():
+    # Log files are written by a background thread, off the API-call path
+    configure_queued_logging('pumpfun_search.log')
     logger.info("Starting Pump.fun API example: Search Coins")
     
     try:
         # Parse command line arguments
-        if len(sys.argv) < 2:
-            print_usage()
-            sys.exit(1)
-            
-        args = parse_arguments(sys.argv[1:])
-        search_term = args['search_term']
-        limit = args['limit']
-        search_type = args['search_type']
+        args = parse_arguments()
+        search_term = args.search_term
+        limit = args.limit
+        search_type = args.search_type
         
-        logger.info(f"Searching for '{search_term}' (limit: {limit}, type: {search_type})")
+        logger.info("Searching for '%s' (limit: %d, type: %s)", search_term, limit, search_type)
+        
+        # Imported after argument parsing so `--help` doesn't load the HTTP stack
+        try:
+            from utils.python_client import PumpFunAPI
+            from utils.schemas import COIN_FIELDS, CoinList
+        except ImportError as e:
+            logger.error("Failed to import PumpFunAPI. Make sure you've installed the required dependencies.")
+            logger.error("Error: %s", e)
+            sys.exit(1)
         
         # Initialize the API client
         client = PumpFunAPI()
         
         # Search for coins
-        result = client.search_coins(
+        result = client.search_coins_typed(
             search_term=search_term,
             limit=limit,
             sort='market_cap',
@@ -125,12 +103,13 @@ def main():
             search_type=search_type
         )
         
-        # Debug: Log the raw API response
-        logger.debug(f"Raw API response: {json.dumps(result, indent=2)}")
+        # Debug: Log the decoded coins
+        if logger.isEnabledFor(logging.DEBUG):
+            log_json(logger, "Decoded coins", [{f: getattr(c, f) for f in COIN_FIELDS} for c in result.data])
         
         # Print the results
-        if isinstance(result, dict) and 'data' in result:
-            data = result['data']
+        if isinstance(result, CoinList):
+            data = result.data
             if data:
                 print(f"\nFound {len(data)} results for '{search_term}':")
                 print("-" * 140)
@@ -138,22 +117,21 @@ def main():
                 print("-" * 140)
                 
                 for coin in data:
-                    symbol = coin.get('symbol', 'N/A') or 'N/A'
-                    name = (coin.get('name') or 'N/A')[:23] + '...' if coin.get('name', '') else 'N/A'
-                    address = coin.get('address', 'N/A') or 'N/A'
-                    market_cap = format_market_cap(coin.get('market_cap'))
+                    symbol = coin.symbol or 'N/A'
+                    name = coin.name[:23] + '...' if coin.name else 'N/A'
+                    address = coin.address or 'N/A'
+                    short_address = f"{address[:10]}...{address[-6:]}" if len(address) > 16 else address
+                    market_cap = format_market_cap(coin.market_cap)
                     
-                    price = coin.get('price')
-                    if price is not None:
-                        price = f"${float(price):.6f}".rstrip('0').rstrip('.')
-                        if price == '0': price = 'N/A'
-                    else:
-                        price = 'N/A'
+                    # Fixed-point like advanced_examples, so sub-cent prices never
+                    # switch to scientific notation; trailing zeros are dropped
+                    price = coin.price
+                    price = f"${price:,.8f}".rstrip('0').rstrip('.') if price else 'N/A'
                     
-                    change_24h = coin.get('price_change_24h')
+                    change_24h = coin.price_change_24h
                     change_24h_str = f"{change_24h:+.2f}%" if change_24h is not None else 'N/A'
                     
-                    change_7d = coin.get('price_change_7d')
+                    change_7d = coin.price_change_7d
                     change_7d_str = f"{change_7d:+.2f}%" if change_7d is not None else 'N/A'
                     
                     # Color code price changes
@@ -171,7 +149,7 @@ def main():
                             return value
                     
                     print(
-                        f"{symbol:<10} {name:<25} {address[:10]}...{address[-6:] if len(address) > 16 else '':<6}  "
+                        f"{symbol:<10} {name:<25} {short_address:<19}  "
                         f"{market_cap:<15} {price:<12} "
                         f"{colorize(change_24h_str):<12} {colorize(change_7d_str)}"
                     )
@@ -179,8 +157,8 @@ def main():
                 print("-" * 140)
                 
                 # Show pagination info if available
-                if 'pagination' in result:
-                    pagination = result['pagination']
+                if result.pagination:
+                    pagination = result.pagination
                     total = int(pagination.get('total', 0))
                     if total > 0:
                         print(f"\nShowing {len(data)} of {total} results. "
@@ -188,13 +166,14 @@ def main():
                         if total > limit:
                             print("Tip: Use --limit N to show more results (max 100 per page)")
             else:
-                logger.warning(f"No results found for '{search_term}'")
+                logger.warning("No results found for '%s'", search_term)
                 print(f"\nNo results found for '{search_term}'.")
                 print("Try a different search term or check the spelling.")
         else:
-            logger.error(f"Unexpected API response format: {type(result)}")
+            logger.error("Unexpected API response format: %s", type(result))
             print("\nError: Unexpected response format from the API.")
             print("Raw response:")
+            import json
             print(json.dumps(result, indent=2, default=str))
             
     except KeyboardInterrupt:
@@ -202,7 +181,7 @@ def main():
         print("\nSearch cancelled.")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"An error occurred: {str(e)}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
         print(f"\nError: {str(e)}")
         print("Check pumpfun_search.log for more details.")
         sys.exit(1)
@@ -5,22 +5,12 @@ This script tests all available endpoints to document their rate limiting behavi
 It makes requests to each endpoint and records the rate limit headers.
 """
 
+import asyncio
 import time
-import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('rate_limit_test.log')
-    ]
-)
-logger = logging.getLogger('RateLimitTester')
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Any
 
 # Add the project root to the path
 import sys
@@ -28,125 +18,275 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from utils.python_client import PumpFunAPI
+from utils.async_client import AsyncPumpFunAPI
+from utils.backoff import TRANSIENT_ERRORS, retry_with_backoff, status_error
+from examples.python.logging_utils import configure_queued_logging
+from examples.python._rate_limit_core import RetryAfterStore, dump_pretty, dumps_line, quota_bucket
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Logging is configured in main() (see configure_queued_logging)
+logger = logging.getLogger('RateLimitTester')
+
+
+# Rate limit headers recorded for every probe
+_RL_KEYS = ('X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset', 'Retry-After')
+
+
+def _for_output(result: Dict) -> Dict:
+    """Return ``result`` with its nanosecond ``tested_at`` formatted as ISO 8601 (UTC)."""
+    tested_at = result.get('tested_at')
+    if not isinstance(tested_at, int):
+        return result
+    return {**result, 'tested_at': datetime.fromtimestamp(tested_at / 1e9, tz=timezone.utc).isoformat()}
+
+
+class EndpointSpec(NamedTuple):
+    """An endpoint to probe. Immutable (and tuple-backed, so Python 3.8 compatible)."""
+    name: str
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, Any]] = None
+
 
 class RateLimitTester:
     """Test rate limits for all Pump.fun API endpoints."""
     
     def __init__(self, api_key: str = None):
         """Initialize the rate limit tester."""
-        self.client = PumpFunAPI(api_key=api_key)
+        self.api_key = api_key
+        # One keep-alive Session for every sync probe; transport retries and the
+        # client's own 429 waits are off so the tester observes each 429 instead
+        # of urllib3 or _request absorbing it
+        self.client = PumpFunAPI(api_key=api_key, max_retries=0, max_429_retries=0)
         self.results = {}
+        self._bucket = quota_bucket(PumpFunAPI.BASE_URL)
+        self._retry_after = RetryAfterStore()
         self.test_wallet = "33UdRJm2p7FGYivdXEzMSM2qjpP3VcPGNTiDBhtCQybJ"  # Example wallet
         self.test_token = "5HvmxE9M24Z1EPxgyd6vCWeYnDF9bMnQYnfLvE2USMHF"  # Example token
-    
-    def test_endpoint(self, name: str, method: str, endpoint: str, **kwargs) -> Dict:
-        """Test a single endpoint and record rate limit information."""
-        logger.info(f"Testing endpoint: {name} ({method} {endpoint})")
         
-        result = {
+        # All endpoints to test, with their paths formatted once
+        self._endpoints = (
+            # Search and discovery endpoints
+            EndpointSpec("Search Coins", "GET", "search/coins", {"query": "bitcoin"}),
+            EndpointSpec("Get Latest Coins", "GET", "coins/latest"),
+            
+            # Token endpoints
+            EndpointSpec("Get Token Info", "GET", f"tokens/{self.test_token}"),
+            EndpointSpec("Get Token Trades", "GET", f"trades/token/{self.test_token}"),
+            
+            # Wallet endpoints
+            EndpointSpec("Get Wallet Holdings", "GET", f"wallets/{self.test_wallet}/tokens"),
+            EndpointSpec("Get Wallet Created Coins", "GET", f"wallets/{self.test_wallet}/created"),
+            
+            # Market data endpoints
+            EndpointSpec("Get Latest Trades", "GET", "trades/latest"),
+            EndpointSpec("Get Trending Tokens", "GET", "tokens/trending"),
+            
+            # Add more endpoints as needed
+        )
+    
+    def _new_result(self, name: str, method: str, endpoint: str) -> Dict:
+        """Create the result record for one endpoint test."""
+        return {
             'name': name,
             'endpoint': endpoint,
             'method': method,
-            'tested_at': datetime.utcnow().isoformat(),
+            'tested_at': time.time_ns(),  # Formatted as ISO 8601 only when written out
             'rate_limit_headers': {},
             'success': False,
             'error': None,
             'response_time_ms': None,
             'response_status': None
         }
+    
+    def _record_success(self, result: Dict, response: Any, start_ns: int) -> None:
+        """Fill in a result record from a successful response."""
+        # Record response time
+        result['response_time_ms'] = (time.perf_counter_ns() - start_ns) // 1_000_000
+        result['response_status'] = getattr(response, 'status_code', 200)
+        result['success'] = True
+        
+        # Record rate limit headers
+        headers = getattr(response, 'headers', {})
+        result['rate_limit_headers'] = {key: headers.get(key) for key in _RL_KEYS}
+        
+        logger.info("✓ Success - Rate limit: %s/%s",
+                    result['rate_limit_headers']['X-RateLimit-Remaining'],
+                    result['rate_limit_headers']['X-RateLimit-Limit'])
+    
+    def _record_error(self, result: Dict, e: Exception) -> None:
+        """Fill in a result record from a failed request."""
+        result['error'] = str(e)
+        result['success'] = False
+        
+        # Dispatch on the error type rather than probing for a response attribute
+        http_error = status_error(e)
+        if http_error is not None:
+            response = http_error.response
+            result['response_status'] = response.status_code
+            
+            # If we hit a rate limit, record the Retry-After header
+            if response.status_code == 429:
+                result['rate_limit_headers']['Retry-After'] = response.headers.get('Retry-After')
+                self._retry_after.defer(self._bucket, result['rate_limit_headers']['Retry-After'])
+                logger.warning("⚠️  Rate limited - Retry after: %ss", result['rate_limit_headers'].get('Retry-After'))
+            else:
+                logger.error("✗ Failed: %s", e)
+        elif isinstance(e, TRANSIENT_ERRORS) or isinstance(e.__cause__, TRANSIENT_ERRORS):
+            logger.error("✗ Network error (still failing after retries): %s", e)
+        else:
+            logger.error("✗ Failed: %s", e)
+    
+    def test_endpoint(self, name: str, method: str, endpoint: str, **kwargs) -> Dict:
+        """Test a single endpoint and record rate limit information."""
+        logger.info("Testing endpoint: %s (%s %s)", name, method, endpoint)
+        result = self._new_result(name, method, endpoint)
+        
+        self._retry_after.sleep(self._bucket)
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()  # Monotonic, integer nanoseconds
             
             # Make the request
-            response = self.client._request(method, endpoint, **kwargs)
-            
-            # Record response time
-            result['response_time_ms'] = int((time.time() - start_time) * 1000)
-            result['response_status'] = 200
-            result['success'] = True
-            
-            # Record rate limit headers
-            result['rate_limit_headers'] = {
-                'X-RateLimit-Limit': getattr(response, 'headers', {}).get('X-RateLimit-Limit'),
-                'X-RateLimit-Remaining': getattr(response, 'headers', {}).get('X-RateLimit-Remaining'),
-                'X-RateLimit-Reset': getattr(response, 'headers', {}).get('X-RateLimit-Reset'),
-                'Retry-After': getattr(response, 'headers', {}).get('Retry-After')
-            }
-            
-            logger.info(f"✓ Success - Rate limit: {result['rate_limit_headers'].get('X-RateLimit-Remaining')}/{result['rate_limit_headers'].get('X-RateLimit-Limit')}")
+            response = self._request_with_retry(method, endpoint, **kwargs)
+            self._record_success(result, response, start_ns)
             
         except Exception as e:
-            result['error'] = str(e)
-            result['success'] = False
-            
-            # Try to get response status if available
-            if hasattr(e, 'response') and hasattr(e.response, 'status_code'):
-                result['response_status'] = e.response.status_code
-                
-                # If we hit a rate limit, record the Retry-After header
-                if e.response.status_code == 429:
-                    result['rate_limit_headers']['Retry-After'] = e.response.headers.get('Retry-After')
-                    logger.warning(f"⚠️  Rate limited - Retry after: {result['rate_limit_headers'].get('Retry-After')}s")
-                else:
-                    logger.error(f"✗ Failed: {e}")
-            else:
-                logger.error(f"✗ Failed: {e}")
+            self._record_error(result, e)
         
         return result
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run tests for all available endpoints."""
-        logger.info("Starting rate limit tests...")
+    async def _test_endpoint_async(self, client: AsyncPumpFunAPI, semaphore: asyncio.Semaphore,
+                                   name: str, method: str, endpoint: str, **kwargs) -> Dict:
+        """Async counterpart of test_endpoint, run under the shared concurrency limit.
         
-        # Define all endpoints to test
-        tests = [
-            # Search and discovery endpoints
-            {"name": "Search Coins", "method": "GET", "endpoint": "search/coins", "params": {"query": "bitcoin"}},
-            {"name": "Get Latest Coins", "method": "GET", "endpoint": "coins/latest"},
+        Failed statuses raise ``httpx.HTTPStatusError``, whose ``response`` carries
+        the status code and ``Retry-After`` header into _record_error.
+        """
+        async with semaphore:
+            logger.info("Testing endpoint: %s (%s %s)", name, method, endpoint)
+            result = self._new_result(name, method, endpoint)
+            await self._retry_after.wait(self._bucket)
             
-            # Token endpoints
-            {"name": "Get Token Info", "method": "GET", "endpoint": f"tokens/{self.test_token}"},
-            {"name": "Get Token Trades", "method": "GET", "endpoint": f"trades/token/{self.test_token}"},
+            try:
+                start_ns = time.perf_counter_ns()
+                response = await self._fetch_async(client, method, endpoint, **kwargs)
+                self._record_success(result, response, start_ns)
+                
+            except Exception as e:
+                self._record_error(result, e)
             
-            # Wallet endpoints
-            {"name": "Get Wallet Holdings", "method": "GET", "endpoint": f"wallets/{self.test_wallet}/tokens"},
-            {"name": "Get Wallet Created Coins", "method": "GET", "endpoint": f"wallets/{self.test_wallet}/created"},
+            return result
+    
+    # 429s are raised at once to be recorded (and deferred), not waited out
+    @retry_with_backoff(retry_rate_limited=False)
+    def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make a sync request, retrying transient failures with jittered backoff."""
+        return self.client._request(method, endpoint, **kwargs)
+    
+    # 429s are raised at once to be recorded (and deferred), not waited out
+    @retry_with_backoff(retry_rate_limited=False)
+    async def _fetch_async(self, client: AsyncPumpFunAPI, method: str, endpoint: str, **kwargs) -> Any:
+        """Make a raw async request, retrying transient failures with jittered backoff."""
+        # Go one level below _request so the raw response, and with it the
+        # rate limit headers and status code, is available to record
+        await client._handle_rate_limiting()
+        response = await client.session.request(method, f"/{endpoint.lstrip('/')}", **kwargs)
+        client._update_rate_limits(response.headers)
+        response.raise_for_status()
+        return response
+    
+    async def _run_all_tests_async(self, concurrency: int, max_rps: float, stream=None) -> List[Dict]:
+        """Probe every endpoint concurrently over one pooled client."""
+        semaphore = asyncio.Semaphore(concurrency)
+        # With HTTP/2 (h2 installed and offered by the server) every probe is a
+        # stream on one connection; otherwise they share a small keep-alive pool
+        async with AsyncPumpFunAPI(api_key=self.api_key, max_connections=10, http2=True) as client:
+            # The client spaces out request starts, which caps the overall request rate
+            client.min_request_interval = 1.0 / max_rps
             
-            # Market data endpoints
-            {"name": "Get Latest Trades", "method": "GET", "endpoint": "trades/latest"},
-            {"name": "Get Trending Tokens", "method": "GET", "endpoint": "tokens/trending"},
+            async def probe(spec: EndpointSpec) -> Dict:
+                result = await self._test_endpoint_async(
+                    client,
+                    semaphore,
+                    name=spec.name,
+                    method=spec.method,
+                    endpoint=spec.endpoint,
+                    params=spec.params
+                )
+                # Written as soon as the endpoint finishes so a crash keeps partial data
+                if stream is not None:
+                    stream.write(dumps_line(_for_output(result)))
+                    stream.flush()
+                return result
             
-            # Add more endpoints as needed
-        ]
+            return await asyncio.gather(*[probe(spec) for spec in self._endpoints])
+    
+    def _run_all_tests_threaded(self, concurrency: int, max_rps: float, stream=None) -> List[Dict]:
+        """Probe every endpoint from a thread pool over the shared sync Session.
         
-        # Run all tests
-        for test in tests:
-            # Add a small delay between tests to avoid hitting rate limits during testing
-            time.sleep(1)
-            
-            # Run the test
-            result = self.test_endpoint(
-                name=test['name'],
-                method=test['method'],
-                endpoint=test['endpoint'],
-                **test.get('params', {})
-            )
-            
-            # Store the result
-            self.results[test['name']] = result
+        Used when httpx is not installed. The probes are I/O bound and release the
+        GIL while waiting on the socket, so threads overlap their latency much
+        like the async path does.
+        """
+        # The sync client's pacing is lock-protected, so threads share the rate cap
+        self.client.min_request_interval = 1.0 / max_rps
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self.test_endpoint, spec.name, spec.method, spec.endpoint, params=spec.params)
+                for spec in self._endpoints
+            ]
+            # Written from this thread as each endpoint finishes so a crash keeps partial data
+            if stream is not None:
+                for future in as_completed(futures):
+                    stream.write(dumps_line(_for_output(future.result())))
+                    stream.flush()
+            return [future.result() for future in futures]
+    
+    def run_all_tests(self, concurrency: int = 4, max_rps: float = 4.0,
+                      stream_to: str = 'rate_limit_results.jsonl', pretty: bool = False) -> Dict[str, Any]:
+        """Run tests for all available endpoints.
+        
+        Endpoints are probed concurrently instead of one after another with a
+        pause in between, so their network latency overlaps. Without httpx the
+        probes run on a thread pool using the sync client instead.
+        
+        Args:
+            concurrency: Maximum number of endpoints probed at the same time
+            max_rps: Maximum number of requests started per second overall
+            stream_to: JSON Lines file each endpoint's result is written to as
+                soon as it completes
+            pretty: Also save all results as one indented JSON document
+        """
+        logger.info("Starting rate limit tests...")
+        
+        # Run all tests and store the results in endpoint order
+        with open(stream_to, 'wb') as stream:
+            if httpx is not None:
+                results = asyncio.run(self._run_all_tests_async(concurrency, max_rps, stream))
+            else:
+                results = self._run_all_tests_threaded(concurrency, max_rps, stream)
+            for result in results:
+                self.results[result['name']] = result
+        logger.info("Results streamed to %s", stream_to)
         
         # Save results to a file
-        self.save_results()
+        if pretty:
+            self.save_results()
         
         logger.info("All tests completed!")
         return self.results
     
     def save_results(self, filename: str = 'rate_limit_results.json') -> None:
         """Save test results to a JSON file."""
-        with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        logger.info(f"Results saved to {filename}")
+        results = {name: _for_output(result) for name, result in self.results.items()}
+        dump_pretty(results, filename)
+        logger.info("Results saved to %s", filename)
     
     def print_summary(self) -> None:
         """Print a summary of the test results."""
@@ -170,11 +310,20 @@ class RateLimitTester:
 
 def main():
     """Run the rate limit tests."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Test rate limits of Pump.fun API endpoints')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Also save the results as one indented JSON document (rate_limit_results.json)')
+    args = parser.parse_args()
+    
+    configure_queued_logging('rate_limit_test.log')
+    
     # Initialize the tester
     tester = RateLimitTester()
     
     # Run all tests
-    tester.run_all_tests()
+    tester.run_all_tests(pretty=args.pretty)
     
     # Print a summary
     tester.print_summary()
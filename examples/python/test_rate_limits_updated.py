@@ -5,100 +5,99 @@ This script tests the rate limiting behavior of the Pump.fun API endpoints.
 It makes requests to each endpoint and records the rate limit headers.
 """
 
+import asyncio
 import os
 import sys
 import time
-import json
 import logging
-import os
+import reprlib
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 
 # Add the parent directory to the path so we can import the client
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from utils.python_client import PumpFunAPI
+from utils.async_client import AsyncPumpFunAPI
+from utils.backoff import retry_with_backoff, status_error
+from examples.python.logging_utils import configure_queued_logging
+from examples.python._rate_limit_core import RetryAfterStore, SlidingWindow, dump_pretty, dumps_line, quota_bucket
 
 # Ensure log directory exists
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'log')
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Configure logging
-log_file = os.path.join(LOG_DIR, 'rate_limit_test.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(log_file)
-    ]
-)
+# Logging is configured in main() (see configure_queued_logging)
 logger = logging.getLogger(__name__)
 
+# AIMD tuning for the stress loop: additive increase per round while the mean
+# of the last _AIMD_WINDOW latencies stays under _AIMD_LATENCY_FACTOR times the
+# first request's latency, multiplicative decrease on a failed round
+_AIMD_INCREASE = 0.5
+_AIMD_DECREASE = 0.5
+_AIMD_WINDOW = 20
+_AIMD_LATENCY_FACTOR = 2.0
+_AIMD_MAX_CONCURRENCY = 16
+
+class EndpointSpec(NamedTuple):
+    """A client method to probe. Immutable (and tuple-backed, so Python 3.8 compatible)."""
+    name: str
+    method: str
+    params: Dict[str, Any]
+
 class RateLimitTester:
     """Class to test rate limits of Pump.fun API endpoints."""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, probe: bool = False):
         """Initialize the rate limit tester.
         
         Args:
             api_key: Optional API key for authenticated requests
+            probe: Stress each endpoint to find its limit even when the response
+                headers already declare the quota
         """
-        self.client = PumpFunAPI(api_key=api_key)
+        self.api_key = api_key
+        self.probe = probe
         self.results = []
+        self._bucket = quota_bucket(AsyncPumpFunAPI.BASE_URL)
+        self._retry_after = RetryAfterStore()
+        # Quota advertised by the first successful response; it is the same for every
+        # endpoint, so later endpoints are paced to it instead of re-discovering it
+        self._profile = {'limit': None, 'window_s': 60}
+        self._window = None
+        self._fallback_window = None  # Shared until the profile's limit is known
         
         # Known endpoints to test with their required parameters
-        self.endpoints = [
-            {
-                'name': 'search_coins',
-                'method': 'GET',
-                'params': {'search_term': 'ethereum', 'limit': 1}
-            },
-            {
-                'name': 'get_latest_trades',
-                'method': 'GET',
-                'params': {'limit': 1}
-            },
-            {
-                'name': 'get_latest_coins',
-                'method': 'GET',
-                'params': {'limit': 1}
-            },
-            {
-                'name': 'get_wallet_holdings',
-                'method': 'GET',
-                'params': {'wallet_address': '0x0000000000000000000000000000000000000000', 'limit': 1}
-            },
-            {
-                'name': 'get_wallet_created_coins',
-                'method': 'GET',
-                'params': {'wallet_address': '0x0000000000000000000000000000000000000000', 'limit': 1}
-            },
-            {
-                'name': 'get_token_trades',
-                'method': 'GET',
-                'params': {'token_address': '0x0000000000000000000000000000000000000000', 'limit': 1}
-            },
-            {
-                'name': 'get_token_comments',
-                'method': 'GET',
-                'params': {'token_address': '0x0000000000000000000000000000000000000000', 'limit': 1}
-            }
-        ]
+        self.endpoints = (
+            EndpointSpec('search_coins', 'GET', {'search_term': 'ethereum', 'limit': 1}),
+            EndpointSpec('get_latest_trades', 'GET', {'limit': 1}),
+            EndpointSpec('get_latest_coins', 'GET', {'limit': 1}),
+            EndpointSpec('get_wallet_holdings', 'GET',
+                         {'wallet_address': '0x0000000000000000000000000000000000000000', 'limit': 1}),
+            EndpointSpec('get_wallet_created_coins', 'GET',
+                         {'wallet_address': '0x0000000000000000000000000000000000000000', 'limit': 1}),
+            EndpointSpec('get_token_trades', 'GET',
+                         {'token_address': '0x0000000000000000000000000000000000000000', 'limit': 1}),
+            EndpointSpec('get_token_comments', 'GET',
+                         {'token_address': '0x0000000000000000000000000000000000000000', 'limit': 1}),
+        )
     
-    def test_endpoint(self, endpoint: Dict) -> Dict:
+    async def test_endpoint(self, client: AsyncPumpFunAPI, endpoint: EndpointSpec) -> Dict:
         """Test a single API endpoint and record rate limit information.
         
+        The rate limit attributes are read right after each awaited call returns,
+        with no await in between, so concurrent probes sharing ``client`` never
+        see each other's values.
+        
         Args:
-            endpoint: Dictionary containing endpoint configuration
+            client: Shared async API client
+            endpoint: Endpoint to test
             
         Returns:
             Dictionary containing test results
         """
-        endpoint_name = endpoint['name']
-        method = endpoint['method']
-        params = endpoint.get('params', {})
+        endpoint_name, method, params = endpoint
         
-        logger.info(f"Testing endpoint: {endpoint_name}")
+        logger.info("Testing endpoint: %s", endpoint_name)
         
         result = {
             'endpoint': endpoint_name,
@@ -110,102 +109,207 @@ class RateLimitTester:
         }
         
         try:
+            await self._retry_after.wait(self._bucket)
+            
             # Make the API call
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Call the appropriate method on the client
-            method_to_call = getattr(self.client, endpoint_name)
-            response = method_to_call(**params)
+            method_to_call = getattr(client, endpoint_name)
+            response = await self._call_with_retry(method_to_call, params)
             
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
             # Get rate limit info from the client
             rate_info = {
                 'status_code': 200,
-                'response_time_sec': end_time - start_time,
-                'rate_limit_remaining': self.client.rate_limit_remaining,
-                'rate_limit_limit': self.client.rate_limit_limit,
-                'rate_limit_reset': self.client.rate_limit_reset,
+                'response_time_sec': elapsed_ns / 1e9,
+                'rate_limit_remaining': client.rate_limit_remaining,
+                'rate_limit_limit': client.rate_limit_limit,
+                'rate_limit_reset': client.rate_limit_reset,
                 'response_sample': self._sample_response(response) if response else None
             }
             
             result['status'] = 'success'
             result['requests'].append(rate_info)
             
-            # If we have rate limit info, try to hit the limit
-            if self.client.rate_limit_remaining and int(self.client.rate_limit_remaining) > 0:
-                self._test_rate_limit(endpoint, result)
+            if self._profile['limit'] is None:
+                self._record_profile(client)
+            
+            # A declared limit and reset answer the question in one request; only
+            # probe to exhaustion when asked to, or when the headers are missing
+            if client.rate_limit_limit and client.rate_limit_reset and not self.probe:
+                result['declared_limit'] = client.rate_limit_limit
+                result['declared_reset'] = client.rate_limit_reset
+            elif client.rate_limit_remaining and int(client.rate_limit_remaining) > 0:
+                await self._test_rate_limit(client, endpoint, result)
             
         except Exception as e:
-            logger.error(f"Error testing {endpoint_name}: {str(e)}")
+            logger.error("Error testing %s: %s", endpoint_name, e)
             result['status'] = 'error'
             result['error'] = str(e)
             
             # Check if this was a rate limit error
-            if hasattr(e, 'response') and hasattr(e.response, 'status_code') and e.response.status_code == 429:
+            http_error = status_error(e)
+            if http_error is not None and http_error.response.status_code == 429:
                 result['rate_limited'] = True
-                result['retry_after'] = e.response.headers.get('Retry-After')
+                result['retry_after'] = http_error.response.headers.get('Retry-After')
+                self._retry_after.defer(self._bucket, result['retry_after'])
         
         return result
     
-    def _test_rate_limit(self, endpoint: Dict, result: Dict) -> None:
+    def _record_profile(self, client: AsyncPumpFunAPI) -> None:
+        """Cache the advertised limit and window from the client's last response."""
+        try:
+            self._profile['limit'] = int(client.rate_limit_limit)
+        except (TypeError, ValueError):
+            return
+        # A reset header further out than the default window means a longer window
+        if client.rate_limit_reset:
+            self._profile['window_s'] = max(self._profile['window_s'], client.rate_limit_reset - time.time())
+        logger.info("Rate limit profile: %d requests per %.0fs", self._profile['limit'], self._profile['window_s'])
+    
+    def _shared_window(self) -> SlidingWindow:
+        """Return the sliding window shared by every endpoint's stress loop.
+        
+        Sized from the cached profile; without a known limit, a shared fallback
+        of 10 requests per second is used until one is seen.
+        """
+        limit = self._profile['limit']
+        if limit is None:
+            if self._fallback_window is None:
+                self._fallback_window = SlidingWindow(10, 1.0)
+            return self._fallback_window
+        if self._window is None:
+            self._window = SlidingWindow(limit, self._profile['window_s'])
+        return self._window
+    
+    # 429s are raised at once to be recorded (and deferred), not waited out
+    @retry_with_backoff(retry_rate_limited=False)
+    async def _call_with_retry(self, method_to_call, params: Dict) -> Any:
+        """Call a client method, retrying transient failures with jittered backoff.
+        
+        Only the first probe of an endpoint is retried; in the stress loop a
+        failure is the signal being measured.
+        """
+        return await method_to_call(**params)
+    
+    async def _test_rate_limit(self, client: AsyncPumpFunAPI, endpoint: EndpointSpec, result: Dict) -> None:
         """Test the rate limit by making requests until rate limited.
         
         Args:
+            client: Shared async API client
             endpoint: Endpoint configuration
             result: Result dictionary to update with test data
         """
-        endpoint_name = endpoint['name']
-        method = endpoint['method']
-        params = endpoint.get('params', {})
+        endpoint_name, params = endpoint.name, endpoint.params
+        
+        # Bind the method to call and the per-iteration helpers once; the loop
+        # below only touches these locals
+        method_to_call = getattr(client, endpoint_name)
+        timed_request = self._timed_request
+        record_request = result['requests'].append
         
-        # Get the method to call
-        method_to_call = getattr(self.client, endpoint_name)
+        # Pace requests at the quota profiled from the first response. The window is
+        # shared, so endpoints probed concurrently split the quota instead of each
+        # ramping into its own 429s.
+        window = self._shared_window()
+        limit = self._profile['limit']
+        low_water = max(2, int(limit * 0.1)) if limit else 2
         
-        # Make requests until we hit the rate limit or reach max_attempts
+        # Make requests until we hit the rate limit or reach max_attempts. Rounds of
+        # int(concurrency) parallel requests are sized by AIMD: grow additively
+        # while latency stays under target, halve on any failure.
         max_attempts = 100  # Safety limit
         attempts = 0
+        concurrency = 1.0
+        latencies = deque(maxlen=_AIMD_WINDOW)
+        record_latency = latencies.append
+        target_latency = _AIMD_LATENCY_FACTOR * result['requests'][0]['response_time_sec']
         
         while attempts < max_attempts:
-            attempts += 1
+            batch = min(int(concurrency), max_attempts - attempts)
+            outcomes = await asyncio.gather(
+                *[timed_request(client, window, method_to_call, params) for _ in range(batch)],
+                return_exceptions=True
+            )
             
-            try:
-                start_time = time.time()
-                response = method_to_call(**params)
-                end_time = time.time()
+            failed = False
+            done = False
+            for outcome in outcomes:
+                attempts += 1
                 
-                rate_info = {
-                    'status_code': 200,
-                    'request_number': attempts + 1,  # +1 because we already made one request
-                    'response_time_sec': end_time - start_time,
-                    'rate_limit_remaining': self.client.rate_limit_remaining,
-                    'rate_limit_limit': self.client.rate_limit_limit,
-                    'rate_limit_reset': self.client.rate_limit_reset
-                }
+                if isinstance(outcome, Exception):
+                    failed = True
+                    logger.error("Error during rate limit test for %s: %s", endpoint_name, outcome)
+                    result['error_during_test'] = str(outcome)
+                    
+                    # Check if this was a rate limit error
+                    http_error = status_error(outcome)
+                    if http_error is not None and http_error.response.status_code == 429:
+                        result['rate_limited'] = True
+                        result['retry_after'] = http_error.response.headers.get('Retry-After')
+                        result['requests_to_limit'] = attempts + 1
+                        self._retry_after.defer(self._bucket, result['retry_after'])
+                        done = True
+                    continue
                 
-                result['requests'].append(rate_info)
+                rate_info = outcome
+                rate_info['request_number'] = attempts + 1  # +1 because we already made one request
+                record_request(rate_info)
+                record_latency(rate_info['response_time_sec'])
+                remaining = rate_info['rate_limit_remaining']
                 
                 # If we've hit the rate limit, stop
-                if self.client.rate_limit_remaining == '0':
-                    logger.info(f"Hit rate limit after {attempts + 1} requests to {endpoint_name}")
+                if remaining == '0':
+                    logger.info("Hit rate limit after %d requests to %s", attempts + 1, endpoint_name)
                     result['rate_limit_hit'] = True
                     result['requests_to_limit'] = attempts + 1
+                    # The shared quota is spent until the advertised reset
+                    if rate_info['rate_limit_reset']:
+                        self._retry_after.defer(self._bucket, rate_info['rate_limit_reset'] - time.time())
+                    done = True
                     break
                 
-                # Small delay between requests to avoid overwhelming the API
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Error during rate limit test for {endpoint_name}: {str(e)}")
-                result['error_during_test'] = str(e)
-                
-                # Check if this was a rate limit error
-                if hasattr(e, 'response') and hasattr(e.response, 'status_code') and e.response.status_code == 429:
-                    result['rate_limited'] = True
-                    result['retry_after'] = e.response.headers.get('Retry-After')
-                    result['requests_to_limit'] = attempts + 1
-                
+                # Once the quota is nearly used up the limit is known; stop before
+                # tripping it rather than waiting out the reset and starting over
+                if remaining and remaining.isdigit() and int(remaining) <= low_water:
+                    logger.info("Quota nearly exhausted after %d requests to %s (%s remaining)",
+                                attempts + 1, endpoint_name, remaining)
+                    result['rate_limit_hit'] = True
+                    result['requests_to_limit'] = attempts + 1 + int(remaining)
+                    done = True
+                    break
+            
+            if done:
                 break
+            if failed:
+                # Nothing left to back off to at a single request in flight
+                if concurrency <= 1:
+                    break
+                concurrency = max(1.0, concurrency * _AIMD_DECREASE)
+            elif sum(latencies) / len(latencies) < target_latency:
+                concurrency = min(_AIMD_MAX_CONCURRENCY, concurrency + _AIMD_INCREASE)
+        
+        result['final_concurrency'] = int(concurrency)
+    
+    async def _timed_request(self, client: AsyncPumpFunAPI, window: SlidingWindow,
+                             method_to_call, params: Dict) -> Dict:
+        """Make one paced request and return its timing and rate limit info."""
+        await window.acquire()
+        await self._retry_after.wait(self._bucket)
+        start_ns = time.perf_counter_ns()
+        await method_to_call(**params)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        
+        # Read with no await in between, so the values belong to this response
+        return {
+            'status_code': 200,
+            'response_time_sec': elapsed_ns / 1e9,
+            'rate_limit_remaining': client.rate_limit_remaining,
+            'rate_limit_limit': client.rate_limit_limit,
+            'rate_limit_reset': client.rate_limit_reset
+        }
     
     def _sample_response(self, response: Any, max_length: int = 200) -> Any:
         """Create a sample of the response for logging purposes.
@@ -221,38 +325,79 @@ class RateLimitTester:
             return None
             
         try:
-            # Convert to string and truncate if necessary
-            response_str = str(response)
+            # Raw bodies (bytes, or a requests/httpx response): decode only the head,
+            # allowing up to 4 bytes per character of UTF-8
+            content = response if isinstance(response, (bytes, bytearray)) else getattr(response, 'content', None)
+            if isinstance(content, (bytes, bytearray)):
+                response_str = bytes(content[:max_length * 4]).decode('utf-8', errors='replace')
+            else:
+                # Parsed JSON: a bounded repr stops walking the tree once it has
+                # enough to show, instead of stringifying the whole response
+                sampler = reprlib.Repr()
+                sampler.maxlevel = 3
+                sampler.maxdict = sampler.maxlist = 10
+                sampler.maxstring = sampler.maxother = max_length
+                response_str = sampler.repr(response)
+            
             if len(response_str) > max_length:
                 return response_str[:max_length] + '...'
             return response_str
         except Exception:
             return "[Unable to serialize response]"
     
-    def run_all_tests(self) -> List[Dict]:
+    async def _run_all_tests_async(self, concurrency: int, max_rps: float, stream=None) -> List[Dict]:
+        """Probe every endpoint concurrently over one pooled client."""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # max_retries=0: the client must not wait out the 429s being measured
+        async with AsyncPumpFunAPI(api_key=self.api_key, max_retries=0) as client:
+            # The client spaces out request starts, which caps the overall request rate
+            client.min_request_interval = 1.0 / max_rps
+            
+            async def probe(endpoint: EndpointSpec) -> Dict:
+                async with semaphore:
+                    try:
+                        result = await self.test_endpoint(client, endpoint)
+                    except Exception as e:
+                        logger.error("Unexpected error testing %s: %s", endpoint.name, e)
+                        result = {
+                            'endpoint': endpoint.name,
+                            'status': 'error',
+                            'error': f"Unexpected error: {str(e)}"
+                        }
+                
+                # Written as soon as the endpoint finishes so a crash keeps partial data
+                if stream is not None:
+                    stream.write(dumps_line(result))
+                    stream.flush()
+                return result
+            
+            return list(await asyncio.gather(*[probe(endpoint) for endpoint in self.endpoints]))
+    
+    def run_all_tests(self, concurrency: int = 4, max_rps: float = 10.0,
+                      stream_to: Optional[str] = None) -> List[Dict]:
         """Run tests on all endpoints.
         
+        Endpoints are probed concurrently instead of one after another with a
+        pause in between, so their network latency overlaps.
+        
+        Args:
+            concurrency: Maximum number of endpoints probed at the same time
+            max_rps: Maximum number of requests started per second overall
+            stream_to: Optional JSON Lines file that each endpoint's result is
+                appended to as soon as it completes
+        
         Returns:
             List of test results for each endpoint
         """
         logger.info("Starting rate limit tests...")
         
-        for endpoint in self.endpoints:
-            try:
-                result = self.test_endpoint(endpoint)
-                self.results.append(result)
-                
-                # Add a small delay between testing different endpoints
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Unexpected error testing {endpoint.get('name', 'unknown')}: {str(e)}")
-                self.results.append({
-                    'endpoint': endpoint.get('name', 'unknown'),
-                    'status': 'error',
-                    'error': f"Unexpected error: {str(e)}"
-                })
-        
+        if stream_to is None:
+            self.results.extend(asyncio.run(self._run_all_tests_async(concurrency, max_rps)))
+        else:
+            with open(stream_to, 'wb') as stream:
+                self.results.extend(asyncio.run(self._run_all_tests_async(concurrency, max_rps, stream)))
+            logger.info("Results streamed to %s", stream_to)
         return self.results
     
     def save_results(self, filename: str = 'rate_limit_results.json') -> str:
@@ -272,14 +417,13 @@ class RateLimitTester:
             # Save to log directory
             filepath = os.path.join(LOG_DIR, filename)
             
-            with open(filepath, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            dump_pretty(self.results, filepath)
                 
-            logger.info(f"Results saved to {filepath}")
+            logger.info("Results saved to %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"Error saving results: {str(e)}")
+            logger.error("Error saving results: %s", e)
             raise
     
     def print_summary(self) -> None:
@@ -300,6 +444,9 @@ class RateLimitTester:
                 first_req = result['requests'][0]
                 print(f"  Rate Limit: {first_req.get('rate_limit_remaining', '?')}/{first_req.get('rate_limit_limit', '?')} remaining")
                 
+                if 'declared_limit' in result:
+                    print(f"  Declared limit: {result['declared_limit']} (resets at {result['declared_reset']})")
+                
                 if 'requests_to_limit' in result:
                     print(f"  Requests to hit limit: {result['requests_to_limit']}")
             
@@ -314,17 +461,30 @@ def main():
     parser.add_argument('--api-key', type=str, help='Pump.fun API key (optional)')
     parser.add_argument('--output', type=str, default='rate_limit_results', 
                        help='Output filename (without extension) for test results (default: rate_limit_results)')
+    parser.add_argument('--concurrency', type=int, default=4,
+                       help='Maximum number of endpoints probed at the same time (default: 4)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Also save the results as one indented JSON array (<output>.json)')
+    parser.add_argument('--probe', action='store_true',
+                       help='Send requests until rate limited even when the headers declare the quota')
     
     args = parser.parse_args()
     
+    configure_queued_logging(os.path.join(LOG_DIR, 'rate_limit_test.log'))
+    
     # Initialize the tester
-    tester = RateLimitTester(api_key=args.api_key)
+    tester = RateLimitTester(api_key=args.api_key, probe=args.probe)
     
-    # Run the tests
-    results = tester.run_all_tests()
+    # Run the tests, streaming each endpoint's result to <output>.jsonl
+    output = args.output[:-len('.json')] if args.output.endswith('.json') else args.output
+    results = tester.run_all_tests(
+        concurrency=args.concurrency,
+        stream_to=os.path.join(LOG_DIR, f"{output}.jsonl")
+    )
     
     # Save and display results
-    tester.save_results(args.output)
+    if args.pretty:
+        tester.save_results(output)
     tester.print_summary()
 
 
@@ -18,7 +18,6 @@ Examples:
     python token_metrics.py 0x123... --days 30 --chart
 """
 
-import argparse
 import json
 import logging
 import math
@@ -26,117 +25,74 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('token_metrics.log')
-    ]
-)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 # Add the parent directory to the path so we can import the client
 sys.path.append(str(Path(__file__).parent.parent.parent))
 try:
+    from examples.python._common import colorize, format_change, format_number, format_price
+    from examples.python.logging_utils import buffered_file_handler
+    from utils.http_cache import default_http_cache
     from utils.python_client import PumpFunAPI
+    from utils.token_cache import default_cache
 except ImportError as e:
     logger.error("Failed to import PumpFunAPI. Make sure you've installed the required dependencies.")
     logger.error(f"Error: {e}")
     sys.exit(1)
 
-# Terminal color codes
-COLORS = {
-    'red': '\033[91m',
-    'green': '\033[92m',
-    'yellow': '\033[93m',
-    'blue': '\033[94m',
-    'magenta': '\033[95m',
-    'cyan': '\033[96m',
-    'white': '\033[97m',
-    'reset': '\033[0m',
-    'bold': '\033[1m',
-    'underline': '\033[4m'
-}
-
-def colorize(text, color=None, bold=False, underline=False):
-    """Apply color and styling to text for terminal output."""
-    if not color or color.lower() not in COLORS:
-        color = ''
-    else:
-        color = COLORS[color.lower()]
-    
-    result = f"{color}{text}{COLORS['reset']}"
-    if bold:
-        result = f"{COLORS['bold']}{result}"
-    if underline:
-        result = f"{COLORS['underline']}{result}"
-    
-    return result
+def _configure_logging(debug=False):
+    """Log to stderr, and to token_metrics.log only when something goes wrong."""
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(), buffered_file_handler('token_metrics.log')]
+    )
 
-def format_number(value, decimal_places=2, prefix='', suffix=''):
-    """Format large numbers with K, M, B suffixes."""
-    if value is None:
-        return 'N/A'
+def _remember_token(cache, identifier, token):
+    """Cache ``token`` under the identifier it was looked up by and its mint.
     
-    try:
-        value = float(value)
-        abs_value = abs(value)
-        
-        if abs_value >= 1_000_000_000:
-            return f"{prefix}{value/1_000_000_000:.{decimal_places}f}B{suffix}"
-        elif abs_value >= 1_000_000:
-            return f"{prefix}{value/1_000_000:.{decimal_places}f}M{suffix}"
-        elif abs_value >= 1_000:
-            return f"{prefix}{value/1_000:.{decimal_places}f}K{suffix}"
-        return f"{prefix}{value:.{decimal_places}f}{suffix}"
-    except (TypeError, ValueError):
-        return 'N/A'
+    Symbols are stored with a ``symbol:`` prefix so they can never collide with
+    a mint address.
+    """
+    if cache is None or not isinstance(token, dict):
+        return token
+    cache.set(f"symbol:{identifier.lower()}", token)
+    if token.get('mint'):
+        cache.set(token['mint'], token)
+    return token
 
-def format_price(price, currency='SOL'):
-    """Format price with appropriate decimal places."""
-    if price is None:
-        return 'N/A'
-    
-    try:
-        price = float(price)
-        if price >= 1:
-            return f"{price:,.4f} {currency}"
-        elif price >= 0.0001:
-            return f"{price:.8f} {currency}".rstrip('0').rstrip('.')
-        else:
-            return f"{price:.4e} {currency}"
-    except (TypeError, ValueError):
-        return 'N/A'
-
-def format_change(change, is_percent=True):
-    """Format price/percent change with color coding."""
-    if change is None:
-        return 'N/A'
+def get_token_by_identifier(client, identifier):
+    """Find a token by its address or symbol, from the on-disk cache when fresh."""
+    cache = default_cache()
+    if cache is not None:
+        cached = cache.get(identifier) or cache.get(f"symbol:{identifier.lower()}")
+        if cached is not None:
+            logger.info(f"Using cached token: {identifier}")
+            return cached
     
-    try:
-        change = float(change)
-        suffix = '%' if is_percent else ''
-        
-        if change > 0:
-            return f"{colorize(f'+{change:.2f}{suffix}', 'green')} ↑"
-        elif change < 0:
-            return f"{colorize(f'{change:.2f}{suffix}', 'red')} ↓"
-        else:
-            return f"{change:.2f}{suffix} →"
-    except (TypeError, ValueError):
-        return 'N/A'
+    token = _find_token(client, identifier)
+    return _remember_token(cache, identifier, token) if token else None
 
-def get_token_by_identifier(client, identifier):
-    """Find a token by its address or symbol."""
+def _find_token(client, identifier):
+    """Search the API for a token by its address or symbol."""
     logger.info(f"Looking up token: {identifier}")
     
     try:
-        # First, try to get by exact symbol match
+        # First, try to get by exact symbol match. Only the first result is
+        # used, so don't make the server send (and us parse) any more.
         result = client.search_coins(
             search_term=identifier,
-            limit=10,  # Get more results to find better matches
+            limit=1,
             search_type='exact'
         )
         
@@ -155,18 +111,21 @@ def get_token_by_identifier(client, identifier):
         # If no exact match, try fuzzy search
         result = client.search_coins(
             search_term=identifier,
-            limit=10  # Get more results to find better matches
+            limit=10,  # Get more results to find better matches
+            search_type='fuzzy'
         )
         
         # Process fuzzy search results
         if isinstance(result, list) and len(result) > 0:
-            # If the API returns a list directly, find the best match
+            # If the API returns a list directly, take the first that matches
+            lower_id = identifier.lower()
             for token in result:
-                if isinstance(token, dict):
-                    # Check if the symbol or name matches (case-insensitive)
-                    if (token.get('symbol', '').lower() == identifier.lower() or 
-                        token.get('name', '').lower() == identifier.lower()):
-                        return token
+                # Check if the symbol or name matches (case-insensitive)
+                if isinstance(token, dict) and (
+                    (token.get('symbol') or '').lower() == lower_id or
+                    (token.get('name') or '').lower() == lower_id
+                ):
+                    return token
             # If no exact match, return the first result
             return result[0]
         elif isinstance(result, dict):
@@ -221,6 +180,92 @@ def display_token_info(token):
     
     print("="*100 + "\n")
 
+if njit is not None:
+    @njit(cache=True)
+    def _render_chart(values, min_val, value_range, height):
+        """Compiled chart fill: a (height, len(values)) uint8 grid, 1 where filled.
+        
+        Same rule as _chart_rows; ``cache=True`` keeps the compiled code on disk
+        so later runs skip compilation.
+        """
+        width = values.shape[0]
+        grid = np.zeros((height, width), dtype=np.uint8)
+        for row in range(height):
+            threshold = min_val + value_range * ((height - row) / height)
+            for i in range(width):
+                if values[i] >= threshold and (
+                    i == 0 or i == width - 1 or values[i - 1] >= threshold or values[i + 1] >= threshold
+                ):
+                    grid[row, i] = 1
+        return grid
+else:
+    _render_chart = None
+
+def _chart_rows(sampled_values, min_val, value_range, chart_height):
+    """Render the chart body, top row first.
+    
+    A cell is filled when its value reaches the row's threshold and so does a
+    neighbour's; the first and last columns only need to reach it themselves.
+    """
+    if _render_chart is not None:
+        grid = _render_chart(np.asarray(sampled_values, dtype=np.float64),
+                             float(min_val), float(value_range), chart_height)
+        return [''.join(row) for row in np.where(grid, '▄', ' ').tolist()]
+    
+    if np is not None:
+        # One broadcast comparison of every sample against every row threshold
+        arr = np.asarray(sampled_values, dtype=np.float64)
+        thresholds = min_val + value_range * (np.arange(chart_height, 0, -1) / chart_height)[:, None]
+        mask = arr[None, :] >= thresholds
+        draw = mask.copy()
+        draw[:, 1:-1] &= mask[:, :-2] | mask[:, 2:]
+        cells = np.where(draw, '▄', ' ')
+        return [''.join(row) for row in cells.tolist()]
+    
+    chart = []
+    for y in range(chart_height, 0, -1):
+        line = []
+        threshold = min_val + (value_range * (y / chart_height))
+        
+        for i, val in enumerate(sampled_values):
+            if i > 0 and i < len(sampled_values) - 1:
+                prev_val = sampled_values[i-1]
+                next_val = sampled_values[i+1]
+                
+                # Simple line drawing with unicode box characters
+                if val >= threshold and (prev_val >= threshold or next_val >= threshold):
+                    line.append('▄')
+                else:
+                    line.append(' ')
+            else:
+                line.append(' ' if val < threshold else '▄')
+        
+        chart.append(''.join(line))
+    return chart
+
+def _bucket_stats(values, n_buckets):
+    """Reduce ``values`` to per-bucket low, high and mean over ``n_buckets`` even spans."""
+    arr = np.asarray(values, dtype=np.float64)
+    starts = np.linspace(0, len(arr), n_buckets + 1, dtype=int)[:-1]
+    counts = np.diff(np.append(starts, len(arr)))
+    lows = np.minimum.reduceat(arr, starts)
+    highs = np.maximum.reduceat(arr, starts)
+    means = np.add.reduceat(arr, starts) / counts
+    return lows, highs, means
+
+def _candle_rows(lows, highs, means, min_val, value_range, chart_height):
+    """Render bucketed prices as candles, top row first.
+    
+    Each column spans its bucket's low to high ('│'), with the row holding the
+    bucket mean drawn solid ('█').
+    """
+    row_tops = min_val + value_range * (np.arange(chart_height, 0, -1) / chart_height)[:, None]
+    row_bottoms = row_tops - value_range / chart_height
+    in_range = (highs[None, :] >= row_bottoms) & (lows[None, :] <= row_tops)
+    at_mean = (means[None, :] >= row_bottoms) & (means[None, :] <= row_tops)
+    cells = np.where(at_mean, '█', np.where(in_range, '│', ' '))
+    return [''.join(row) for row in cells.tolist()]
+
 def generate_price_chart(prices, width=60, height=15):
     """Generate a simple price chart for terminal display."""
     if not prices or len(prices) < 2:
@@ -242,31 +287,18 @@ def generate_price_chart(prices, width=60, height=15):
         chart_width = min(width, len(values))
         chart_height = height
         
-        # Sample data points to fit chart width
-        step = max(1, len(values) // chart_width)
-        sampled_values = values[::step]
-        sampled_timestamps = timestamps[::step]
-        
-        # Generate chart
-        chart = []
-        for y in range(chart_height, 0, -1):
-            line = []
-            threshold = min_val + (value_range * (y / chart_height))
-            
-            for i, val in enumerate(sampled_values):
-                if i > 0 and i < len(sampled_values) - 1:
-                    prev_val = sampled_values[i-1]
-                    next_val = sampled_values[i+1]
-                    
-                    # Simple line drawing with unicode box characters
-                    if val >= threshold and (prev_val >= threshold or next_val >= threshold):
-                        line.append('▄')
-                    else:
-                        line.append(' ')
-                else:
-                    line.append(' ' if val < threshold else '▄')
-            
-            chart.append(''.join(line))
+        if np is not None and len(values) > chart_width:
+            # Summarize each column's span of samples instead of picking every
+            # Nth one, so spikes between the picked samples still show up
+            lows, highs, means = _bucket_stats(values, chart_width)
+            chart = _candle_rows(lows, highs, means, min_val, value_range, chart_height)
+            sampled_timestamps = [timestamps[0], timestamps[-1]]
+        else:
+            # Sample data points to fit chart width
+            step = max(1, len(values) // chart_width)
+            sampled_values = values[::step]
+            sampled_timestamps = timestamps[::step]
+            chart = _chart_rows(sampled_values, min_val, value_range, chart_height)
         
         # Add x-axis with timestamps
         if sampled_timestamps:
@@ -288,6 +320,8 @@ def generate_price_chart(prices, width=60, height=15):
 
 def main():
     """Main function to run the token metrics example."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Track token metrics and price history')
     parser.add_argument('token_identifier', help='Token symbol or address')
     parser.add_argument('--days', type=int, default=7, help='Number of days of history to fetch')
@@ -295,16 +329,16 @@ def main():
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     
     args = parser.parse_args()
+    _configure_logging(args.debug)
     
     if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Debug logging enabled")
     
     logger.info(f"Starting token metrics for: {args.token_identifier}")
     
     try:
         # Initialize the API client
-        client = PumpFunAPI()
+        client = PumpFunAPI(http_cache=default_http_cache())
         
         # Get token information
         token = get_token_by_identifier(client, args.token_identifier)
@@ -9,91 +9,51 @@ This script demonstrates how to use the PumpFunAPI client to:
 
 Usage:
     python wallet_info.py <wallet_address> [--limit N] [--debug]
+    python wallet_info.py --batch wallets.txt [--limit N] [--debug]
 
 Examples:
     python wallet_info.py 2AQdpHJ2JpcEgPiATUXjnmAWSYnzsFfUeH3L6r3jTmcX
     python wallet_info.py 2AQdpHJ2JpcEgPiATUXjnmAWSYnzsFfUeH3L6r3jTmcX --limit 5 --debug
+    python wallet_info.py --batch wallets.txt
 """
 
-import argparse
+import asyncio
 import json
 import logging
-import re
+import math
 import sys
-from datetime import datetime
 from pathlib import Path
 
-# Terminal color codes
-COLORS = {
-    'red': '\033[91m',
-    'green': '\033[92m',
-    'yellow': '\033[93m',
-    'blue': '\033[94m',
-    'magenta': '\033[95m',
-    'cyan': '\033[96m',
-    'white': '\033[97m',
-    'reset': '\033[0m',
-    'bold': '\033[1m',
-    'underline': '\033[4m'
-}
+# Colored trade side labels, and the row layout for the recent trades table.
+# The type column is 17 wide so the 9 bytes of escape codes leave 8 visible.
+_BUY_STR = '\033[92mBUY\033[0m'
+_SELL_STR = '\033[91mSELL\033[0m'
+_TRADE_FMT = "{:<20} {:<17} {:<22} {:<20} {:<22} {:<30} {}"
 
-def colorize(text, color=None, bold=False, underline=False):
-    """Apply color and styling to text for terminal output."""
-    if not color or color.lower() not in COLORS:
-        color = ''
-    else:
-        color = COLORS[color.lower()]
-    
-    result = f"{color}{text}{COLORS['reset']}"
-    if bold:
-        result = f"{COLORS['bold']}{result}"
-    if underline:
-        result = f"{COLORS['underline']}{result}"
-    
-    return result
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('wallet_info.log')
-    ]
-)
 logger = logging.getLogger(__name__)
 
 # Add the parent directory to the path so we can import the client
 sys.path.append(str(Path(__file__).parent.parent.parent))
 try:
+    from examples.python._common import (
+        _fmt_ts, colorize, format_number, format_number_array, format_timestamp, is_valid_solana_address
+    )
+    from examples.python.logging_utils import buffered_file_handler
+    from utils.http_cache import default_http_cache
     from utils.python_client import PumpFunAPI
+    from utils.token_cache import default_cache
 except ImportError as e:
     logger.error("Failed to import PumpFunAPI. Make sure you've installed the required dependencies.")
     logger.error(f"Error: {e}")
     sys.exit(1)
 
-def format_timestamp(timestamp):
-    """Convert Unix timestamp to human-readable format."""
-    try:
-        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-    except (TypeError, ValueError):
-        return str(timestamp)
-
-def format_number(value, decimal_places=2):
-    """Format large numbers with K, M, B suffixes."""
-    if value is None:
-        return 'N/A'
-    try:
-        value = float(value)
-        if value >= 1_000_000_000:
-            return f"{value/1_000_000_000:.{decimal_places}f}B"
-        elif value >= 1_000_000:
-            return f"{value/1_000_000:.{decimal_places}f}M"
-        elif value >= 1_000:
-            return f"{value/1_000:.{decimal_places}f}K"
-        return f"{value:.{decimal_places}f}"
-    except (TypeError, ValueError):
-        return str(value)
+def _configure_logging(debug=False):
+    """Log to stderr, and to wallet_info.log only when something goes wrong."""
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(), buffered_file_handler('wallet_info.log')]
+    )
 
 def get_wallet_holdings(client, wallet_address, limit=10):
     """Fetch and display wallet holdings."""
@@ -126,24 +86,156 @@ def get_wallet_holdings(client, wallet_address, limit=10):
         logger.error(f"Error fetching wallet holdings: {e}", exc_info=True)
         return []
 
-def get_token_details(client, token_address):
-    """Fetch token details."""
-    logger.debug(f"Fetching details for token: {token_address}")
-    try:
-        # In the Pump.fun API, we can search for the token by address
-        result = client.search_coins(
-            search_term=token_address,
-            limit=1,
-            search_type='exact'
-        )
-        
-        if isinstance(result, dict) and 'data' in result and result['data']:
-            return result['data'][0]
+def merge_holdings(holdings):
+    """Collapse holdings that share a mint into one entry with the summed balance.
+    
+    The API can return one entry per token account, so the same mint may appear
+    several times; merging first means each token is looked up only once.
+    Holdings without a mint are dropped, since they cannot be looked up.
+    """
+    by_mint = {}
+    for item in holdings:
+        mint = item.get('mint')
+        if not mint:
+            continue
+        try:
+            balance = float(item.get('balance') or 0)
+        except (TypeError, ValueError):
+            balance = 0.0
+        if mint in by_mint:
+            by_mint[mint]['balance'] += balance
+        else:
+            by_mint[mint] = {**item, 'balance': balance}
+    return list(by_mint.values())
+
+def _holding_value(item, details):
+    """Return a holding's balance and SOL value given its token details."""
+    balance = float(item.get('balance', 0)) / 1e9  # Assuming 9 decimals
+    price = float(details.get('price', 0)) if details and details.get('price') else 0
+    return balance, balance * price
+
+def _top_holding(holdings, details_by_mint):
+    """Return the mint of the highest-value holding that has details, or None."""
+    valued = [item for item in holdings if item.get('mint') in details_by_mint]
+    if not valued:
         return None
+    top = max(valued, key=lambda item: _holding_value(item, details_by_mint[item['mint']])[1])
+    return top['mint']
+
+def _cached_details(token_addresses):
+    """Split ``token_addresses`` into fresh cached details and addresses still to fetch."""
+    cache = default_cache()
+    details = {}
+    if cache is not None:
+        for address in token_addresses:
+            if address and address not in details:
+                cached = cache.get(address)
+                if cached is not None:
+                    details[address] = cached
+    
+    missing = list(dict.fromkeys(address for address in token_addresses if address and address not in details))
+    return cache, details, missing
+
+def _store_details(cache, fetched):
+    if cache is not None:
+        for address, record in fetched.items():
+            cache.set(address, record)
+
+async def _show_progress(progress, total, holdings_by_mint):
+    """Consume finished lookups from ``progress``, reporting a running count and value."""
+    running_value = 0
+    for done in range(1, total + 1):
+        address, details = await progress.get()
+        if details:
+            running_value += _holding_value(holdings_by_mint[address], details)[1]
+        print(f"\r  Fetched {done}/{total} token details ({running_value:.4f} SOL so far)", end='', flush=True)
+    if total:
+        print()
+
+async def _fetch_wallet_tokens_async(holdings, known, missing, candidates, api_key=None,
+                                     trade_limit=5, max_concurrency=20):
+    """Look up ``missing`` details while prefetching trades for the likely top holdings.
+    
+    Trades for every candidate are requested alongside the detail lookups. Once
+    the details reveal the actual top holding its prefetched trades are used and
+    the other prefetches are cancelled; if the guess missed, the top holding's
+    trades are fetched afterwards.
+    
+    Returns:
+        Tuple of (fetched details by mint, top mint or None, its trades)
+    """
+    from utils.async_client import AsyncPumpFunAPI
+    
+    async with AsyncPumpFunAPI(
+        api_key=api_key, max_connections=max_concurrency, http_cache=default_http_cache()
+    ) as client:
+        prefetches = {
+            mint: asyncio.create_task(client.get_token_trades(mint, limit=trade_limit))
+            for mint in candidates
+        }
+        # Lookups report through a queue as they finish, so progress shows up
+        # after the first round-trip instead of after the last
+        progress = asyncio.Queue()
+        holdings_by_mint = {item['mint']: item for item in holdings if item.get('mint')}
+        reporter = asyncio.create_task(_show_progress(progress, len(missing), holdings_by_mint))
+        fetched = await client.search_coins_bulk(
+            missing, max_concurrency=max_concurrency, results=progress
+        ) if missing else {}
+        await reporter
+        top = _top_holding(holdings, {**known, **fetched})
         
-    except Exception as e:
-        logger.error(f"Error fetching token details: {e}", exc_info=True)
-        return None
+        losers = [task for mint, task in prefetches.items() if mint != top]
+        for task in losers:
+            task.cancel()
+        await asyncio.gather(*losers, return_exceptions=True)
+        
+        if top is None:
+            return fetched, None, []
+        
+        if top in prefetches:
+            logger.debug(f"Using prefetched trades for {top}")
+        else:
+            logger.debug(f"Prefetch missed; fetching trades for {top}")
+        try:
+            response = await (prefetches[top] if top in prefetches else client.get_token_trades(top, limit=trade_limit))
+        except Exception as e:
+            logger.error(f"Error fetching token trades: {e}", exc_info=True)
+            response = None
+        trades = response['trades'] if isinstance(response, dict) and 'trades' in response else []
+        return fetched, top, trades
+
+def get_wallet_token_data(client, holdings, trade_limit=5, prefetch=3):
+    """Fetch details for all holdings plus recent trades for the top-value one.
+    
+    The ``prefetch`` holdings ranked highest by balance times cached price get
+    their trades requested concurrently with the detail lookups, so the trades
+    round-trip is usually off the critical path.
+    
+    Returns:
+        Tuple of (details by mint, top mint, its trades). Without httpx the top
+        mint is None and the caller fetches trades itself.
+    """
+    cache, details, missing = _cached_details([item.get('mint') for item in holdings])
+    
+    # Rank with what is already known: cached prices, else the raw balance
+    ranked = sorted(
+        (item for item in holdings if item.get('mint')),
+        key=lambda item: _holding_value(item, details.get(item['mint']))[::-1],
+        reverse=True
+    )
+    candidates = list(dict.fromkeys(item['mint'] for item in ranked))[:prefetch]
+    
+    try:
+        fetched, top, trades = asyncio.run(_fetch_wallet_tokens_async(
+            holdings, details, missing, candidates, api_key=client.api_key, trade_limit=trade_limit
+        ))
+    except ImportError:
+        logger.debug("httpx not installed; using the sync client for the bulk lookup")
+        fetched, top, trades = client.search_coins_bulk(missing) if missing else {}, None, []
+    
+    _store_details(cache, fetched)
+    details.update(fetched)
+    return details, top, trades
 
 def get_token_trades(client, token_address, limit=5):
     """Fetch recent trades for a token."""
@@ -162,8 +254,12 @@ def get_token_trades(client, token_address, limit=5):
         logger.error(f"Error fetching token trades: {e}", exc_info=True)
         return []
 
-def display_wallet_info(holdings, client):
-    """Display formatted wallet information."""
+def display_wallet_info(holdings, client, token_data=None):
+    """Display formatted wallet information.
+    
+    ``token_data`` is the (details by mint, top mint, its trades) tuple from
+    get_wallet_token_data when it has already been fetched, e.g. by batch mode.
+    """
     if not holdings:
         print("\n" + colorize("No token holdings found.", 'yellow', bold=True))
         print("This could be because:")
@@ -174,39 +270,42 @@ def display_wallet_info(holdings, client):
         
     print("\n" + colorize(f"Found {len(holdings)} token holdings:", 'green', bold=True))
     
+    total_value = 0
+    token_details = []
+    
+    # First pass: collect all token details with one bulk lookup, prefetching
+    # trades for the holdings likely to end up on top
+    if token_data is None:
+        token_data = get_wallet_token_data(client, holdings, trade_limit=5)
+    details_by_mint, top_mint, top_trades = token_data
+    
     print("\n" + "="*120)
     print(f"{'TOKEN':<10} {'BALANCE':<20} {'VALUE (SOL)':<15} {'PRICE (SOL)':<15} {'24H CHANGE':<15} {'HOLDINGS %'}")
     print("-"*120)
     
-    total_value = 0
-    token_details = []
-    
-    # First pass: collect all token details
     for item in holdings:
         token_address = item.get('mint')
-        balance = float(item.get('balance', 0)) / 1e9  # Assuming 9 decimals
-        
-        if token_address:
-            details = get_token_details(client, token_address)
-            if details:
-                price = float(details.get('price', 0)) if details.get('price') else 0
-                value = balance * price
-                total_value += value
-                
-                token_details.append({
-                    'symbol': details.get('symbol', 'N/A'),
-                    'balance': balance,
-                    'price': price,
-                    'value': value,
-                    'change_24h': details.get('price_change_24h', 0),
-                    'address': token_address
-                })
+        details = details_by_mint.get(token_address)
+        if details:
+            balance, value = _holding_value(item, details)
+            price = float(details.get('price', 0)) if details.get('price') else 0
+            total_value += value
+            
+            token_details.append({
+                'symbol': details.get('symbol', 'N/A'),
+                'balance': balance,
+                'price': price,
+                'value': value,
+                'change_24h': details.get('price_change_24h', 0),
+                'address': token_address
+            })
     
     # Sort by value (highest first)
     token_details.sort(key=lambda x: x['value'], reverse=True)
     
     # Second pass: display the sorted list
-    for token in token_details:
+    balances = format_number_array([token['balance'] for token in token_details], 4)
+    for token, balance_str in zip(token_details, balances):
         value_pct = (token['value'] / total_value * 100) if total_value > 0 else 0
         
         # Color coding for price changes
@@ -219,7 +318,7 @@ def display_wallet_info(holdings, client):
         
         print(
             f"{token['symbol'][:10]:<10} "
-            f"{format_number(token['balance'], 4):<20} "
+            f"{balance_str:<20} "
             f"{token['value']:.4f} SOL{'':<11} "
             f"{token['price']:.8f} SOL{'':<7} "
             f"{change_str:<15} "
@@ -235,42 +334,40 @@ def display_wallet_info(holdings, client):
         top_token = token_details[0]
         print(f"\nRecent Trades for {top_token['symbol']}:")
         print("-"*120)
-        trades = get_token_trades(client, top_token['address'], limit=5)
+        if top_token['address'] == top_mint:
+            trades = top_trades
+        else:
+            trades = get_token_trades(client, top_token['address'], limit=5)
         
         if trades:
-            print(f"{'TIME':<20} {'TYPE':<8} {'PRICE (SOL)':<15} {'AMOUNT':<20} {'VALUE (SOL)':<15} "
+            print(f"{'TIME':<20} {'TYPE':<8} {'PRICE (SOL)':<22} {'AMOUNT':<20} {'VALUE (SOL)':<22} "
                   f"{'BUYER/SELLER':<30} TX")
             print("-"*120)
             
             for trade in trades:
                 timestamp = format_timestamp(trade.get('timestamp'))
-                trade_type = "BUY" if trade.get('is_buy') else "SELL"
-                price = float(trade.get('price', 0)) if trade.get('price') else 0
+                price = trade.get('price')
+                price = float(price) if price else 0
                 amount = float(trade.get('token_amount', 0)) / 1e9  # Assuming 9 decimals
                 value = price * amount
-                user = trade.get('user', '')[:28] + ('...' if len(trade.get('user', '')) > 28 else '')
-                tx = trade.get('signature', '')[:8] + '...'
+                u = trade.get('user') or ''
+                user = (u[:28] + '...') if len(u) > 28 else u
+                tx = (trade.get('signature') or '')[:8] + '...'
                 
-                print(
-                    f"{timestamp:<20} "
-                    f"{'\033[92m' if trade_type == 'BUY' else '\033[91m'}{trade_type}\033[0m{'':<5} "
-                    f"{price:.8f} SOL{'':<7} "
-                    f"{format_number(amount, 4):<20} "
-                    f"{value:.4f} SOL{'':<7} "
-                    f"{user:<30} "
-                    f"{tx}"
-                )
+                print(_TRADE_FMT.format(
+                    timestamp,
+                    _BUY_STR if trade.get('is_buy') else _SELL_STR,
+                    f"{price:.8f} SOL",
+                    format_number(amount, 4),
+                    f"{value:.4f} SOL",
+                    user,
+                    tx
+                ))
         else:
             print("No recent trades found.")
         
         print("\n" + "="*120 + "\n")
 
-def is_valid_solana_address(address):
-    """Check if the provided string is a valid Solana address."""
-    import re
-    # Basic Solana address validation (32-44 base58 chars)
-    return bool(re.match(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$', address))
-
 def get_wallet_created_coins(client, wallet_address, limit=10):
     """Fetch coins created by a wallet."""
     logger.info(f"Fetching created coins for wallet: {wallet_address}")
@@ -312,7 +409,7 @@ def display_wallet_created_coins(coins, client):
     for coin in coins[:10]:  # Limit to first 10 for brevity
         symbol = coin.get('symbol', 'N/A')
         name = coin.get('name', 'N/A')[:28] + '...' if coin.get('name') and len(coin['name']) > 30 else coin.get('name', 'N/A')
-        created = datetime.fromtimestamp(coin.get('created_timestamp', 0)/1000).strftime('%Y-%m-%d') if coin.get('created_timestamp') else 'N/A'
+        created = _fmt_ts(math.floor(coin['created_timestamp'] / 1000), '%Y-%m-%d') if coin.get('created_timestamp') else 'N/A'
         market_cap = format_number(coin.get('market_cap', 0), 2, '$')
         
         print(f"{coin.get('mint', 'N/A')[:10]:<10} {symbol:<10} {name:<30} {created:<20} {market_cap}")
@@ -320,59 +417,188 @@ def display_wallet_created_coins(coins, client):
     if len(coins) > 10:
         print(f"\n... and {len(coins) - 10} more coins (use --limit to show more)")
 
+def read_wallet_file(path):
+    """Read wallet addresses from ``path``, one per line.
+    
+    Blank lines and ``#`` comments are skipped, as are duplicates and (with a
+    warning) lines that are not valid Solana addresses.
+    """
+    wallets = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            address = line.split('#', 1)[0].strip()
+            if not address:
+                continue
+            if not is_valid_solana_address(address):
+                logger.warning(f"Skipping invalid wallet address: {address}")
+                continue
+            wallets.append(address)
+    return list(dict.fromkeys(wallets))
+
+async def _fetch_wallet_async(client, wallet_address, limit=10, trade_limit=5):
+    """Fetch everything show_wallet displays for one wallet.
+    
+    Returns:
+        Tuple of (holdings, token data for display_wallet_info, created coins)
+    """
+    holdings_response, created_response = await asyncio.gather(
+        client.get_wallet_holdings(wallet_address=wallet_address, limit=limit, min_balance=0),
+        client.get_wallet_created_coins(wallet_address=wallet_address, limit=limit)
+    )
+    holdings = merge_holdings(holdings_response.get('data', []))
+    created_coins = created_response.get('data', [])
+    
+    cache, details, missing = _cached_details([item.get('mint') for item in holdings])
+    fetched = await client.search_coins_bulk(missing) if missing else {}
+    _store_details(cache, fetched)
+    details.update(fetched)
+    
+    top = _top_holding(holdings, details)
+    trades = []
+    if top is not None:
+        try:
+            response = await client.get_token_trades(top, limit=trade_limit)
+            trades = response['trades'] if isinstance(response, dict) and 'trades' in response else []
+        except Exception as e:
+            logger.error(f"Error fetching token trades: {e}", exc_info=True)
+    return holdings, (details, top, trades), created_coins
+
+async def _fetch_wallets_async(wallets, limit=10, api_key=None, max_connections=100):
+    """Fetch every wallet in ``wallets`` concurrently over one shared connection pool.
+    
+    Returns:
+        Dict mapping each wallet to its _fetch_wallet_async result, or to the
+        exception that wallet's lookups raised
+    """
+    from utils.async_client import AsyncPumpFunAPI
+    
+    async with AsyncPumpFunAPI(
+        api_key=api_key, max_connections=max_connections, http_cache=default_http_cache()
+    ) as client:
+        results = await asyncio.gather(
+            *(_fetch_wallet_async(client, wallet, limit) for wallet in wallets),
+            return_exceptions=True
+        )
+    return dict(zip(wallets, results))
+
+def _install_uvloop():
+    """Use uvloop's event loop when available; it makes fewer syscalls per request."""
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+def show_wallet(client, wallet_address, limit=10, prefetched=None):
+    """Print the holdings and created coins of one wallet.
+    
+    Returns:
+        True if any wallet information was found
+    """
+    if prefetched is None:
+        # Get wallet holdings
+        print("\n" + colorize("1. Fetching token holdings...", 'yellow'))
+        holdings = merge_holdings(get_wallet_holdings(client, wallet_address, limit))
+        token_data = None
+    else:
+        holdings, token_data, created_coins = prefetched
+        print("\n" + colorize("1. Token holdings", 'yellow'))
+    
+    if holdings:
+        display_wallet_info(holdings, client, token_data)
+    else:
+        print("\n" + colorize("No token holdings found.", 'yellow'))
+    
+    # Get created coins
+    if prefetched is None:
+        print("\n" + colorize("2. Checking for created coins...", 'yellow'))
+        created_coins = get_wallet_created_coins(client, wallet_address, limit)
+    else:
+        print("\n" + colorize("2. Created coins", 'yellow'))
+    display_wallet_created_coins(created_coins, client)
+    
+    return bool(holdings or created_coins)
+
+def run_batch(client, wallets, limit=10):
+    """Fetch all ``wallets`` concurrently, then print them one after another.
+    
+    Without httpx the wallets are fetched one at a time with the sync client.
+    """
+    _install_uvloop()
+    try:
+        results = asyncio.run(_fetch_wallets_async(wallets, limit, api_key=client.api_key))
+    except ImportError:
+        logger.debug("httpx not installed; fetching wallets one at a time")
+        results = dict.fromkeys(wallets)
+    
+    for wallet_address, prefetched in results.items():
+        print("\n" + colorize(f"Wallet {wallet_address}", 'cyan', bold=True))
+        if isinstance(prefetched, Exception):
+            logger.error(f"Error fetching wallet {wallet_address}: {prefetched}")
+            print(f"{colorize('Error:', 'red', bold=True)} {prefetched}")
+            continue
+        if not show_wallet(client, wallet_address, limit, prefetched):
+            print("\n" + colorize("No wallet information found.", 'yellow'))
+
 def main():
     """Main function to run the wallet info example."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Fetch wallet information from Pump.fun',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog='''Examples:
   python wallet_info.py 2AQdpHJ2JpcEgPiATUXjnmAWSYnzsFfUeH3L6r3jTmcX
   python wallet_info.py 2AQdpHJ2JpcEgPiATUXjnmAWSYnzsFfUeH3L6r3jTmcX --limit 5 --debug
+  python wallet_info.py --batch wallets.txt
 ''')
     
-    parser.add_argument('wallet_address', 
+    parser.add_argument('wallet_address', nargs='?',
                       help='The Solana wallet address to query (32-44 base58 characters)')
+    parser.add_argument('--batch', metavar='FILE',
+                      help='Query every wallet listed in FILE (one address per line) concurrently')
     parser.add_argument('--limit', type=int, default=10, 
                       help='Maximum number of tokens to show (default: 10)')
     parser.add_argument('--debug', action='store_true', 
                       help='Enable debug logging')
     
     args = parser.parse_args()
+    _configure_logging(args.debug)
     
     if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
         logging.getLogger('PumpFunAPI').setLevel(logging.DEBUG)
         logger.debug("Debug logging enabled")
     
+    if args.batch:
+        try:
+            wallets = read_wallet_file(args.batch)
+        except OSError as e:
+            parser.error(f"cannot read {args.batch}: {e}")
+        if not wallets:
+            parser.error(f"no valid wallet addresses in {args.batch}")
+    elif not args.wallet_address:
+        parser.error("a wallet address or --batch FILE is required")
     # Validate wallet address format
-    if not is_valid_solana_address(args.wallet_address):
+    elif not is_valid_solana_address(args.wallet_address):
         print(f"\n{colorize('Error:', 'red', bold=True)} Invalid Solana address format.")
         print("A valid Solana address should be 32-44 characters long and use base58 encoding.")
         print("Example: 2AQdpHJ2JpcEgPiATUXjnmAWSYnzsFfUeH3L6r3jTmcX\n")
         sys.exit(1)
     
-    logger.info(f"Starting wallet info for address: {args.wallet_address}")
+    if args.batch:
+        logger.info(f"Starting wallet info for {len(wallets)} wallets from {args.batch}")
+    else:
+        logger.info(f"Starting wallet info for address: {args.wallet_address}")
     print(f"\n{colorize('Fetching wallet information...', 'cyan')}")
     
     try:
         # Initialize the API client
-        client = PumpFunAPI()
-        
-        # Get wallet holdings
-        print("\n" + colorize("1. Fetching token holdings...", 'yellow'))
-        holdings = get_wallet_holdings(client, args.wallet_address, args.limit)
-        
-        if holdings:
-            display_wallet_info(holdings, client)
-        else:
-            print("\n" + colorize("No token holdings found.", 'yellow'))
-        
-        # Get created coins
-        print("\n" + colorize("2. Checking for created coins...", 'yellow'))
-        created_coins = get_wallet_created_coins(client, args.wallet_address, args.limit)
-        display_wallet_created_coins(created_coins, client)
+        client = PumpFunAPI(http_cache=default_http_cache())
         
-        if not holdings and not created_coins:
+        if args.batch:
+            run_batch(client, wallets, args.limit)
+        elif not show_wallet(client, args.wallet_address, args.limit):
             print("\n" + colorize("No wallet information found. This could be because:", 'yellow'))
             print("1. The wallet has no token holdings")
             print("2. The wallet hasn't created any tokens")
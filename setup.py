@@ -1,8 +1,22 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional ahead-of-time compilation of the pure-Python hot helpers.
+# Build in place with: PUMPFUN_MYPYC=1 python setup.py build_ext --inplace
+ext_modules = []
+if os.getenv("PUMPFUN_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "--explicit-package-bases",
+        "examples/python/_holdings.py",
+        "utils/_normalize.py",
+    ])
+
 setup(
     name="pumpfun-api",
     version="0.1.0",
@@ -12,14 +26,20 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/pumpfun-api",
-    packages=find_packages(exclude=["tests", "examples"]),
+    packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*"]),
     package_data={"pumpfun": ["py.typed"]},
+    ext_modules=ext_modules,
     install_requires=[
         "requests>=2.25.0",
         "pydantic>=1.8.0",
         "python-dotenv>=0.15.0",
     ],
     extras_require={
+        "async": [
+            "httpx[http2]>=0.25.0",
+            "uvloop>=0.14.0; sys_platform != 'win32'",
+            "websockets>=10.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.0.0",
@@ -28,6 +48,20 @@ setup(
             "mypy>=0.9.0",
             "types-requests>=2.25.0",
         ],
+        "compile": [
+            "mypy>=0.900",
+        ],
+        "speedups": [
+            "orjson>=3.5.0",
+            "numpy>=1.19.0",
+            "numba>=0.53.0",
+            "msgspec>=0.16.0",
+            "ijson>=3.1.0",
+        ],
+        "cache": [
+            "diskcache>=5.0.0",
+            "requests-cache>=1.0.0",
+        ],
         "docs": [
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=0.5.0",
@@ -0,0 +1,32 @@
+"""
+List-envelope normalization shared by the API clients and the response schemas.
+
+The list endpoints answer with a bare list or an object holding the records under
+``data``, ``items``, ``tokens``, ... depending on the endpoint. This module is
+plain, fully annotated Python so it can optionally be compiled with mypyc
+(``PUMPFUN_MYPYC=1 python setup.py build_ext --inplace``). When no compiled
+extension is present the interpreter simply imports this file.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+# Keys under which the various endpoints return their list of records
+LIST_KEYS: Tuple[str, ...] = ('data', 'items', 'tokens', 'trades', 'replies')
+
+
+def list_items(response: Any) -> List[Any]:
+    """Return the records of an already-parsed list response (envelope or bare list)."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        return envelope_items(response)
+    return []
+
+
+def envelope_items(response: Dict[str, Any]) -> List[Any]:
+    """Return the record list of a list envelope, trying each of ``LIST_KEYS``."""
+    for key in LIST_KEYS:
+        records = response.get(key)
+        if isinstance(records, list):
+            return records
+    return []
@@ -0,0 +1,531 @@
+"""
+Async Pump.fun API Client
+
+An asyncio counterpart to ``utils.python_client.PumpFunAPI``. All requests share a
+single pooled ``httpx.AsyncClient`` so independent lookups can be fanned out with
+``asyncio.gather`` instead of paying one round-trip after another.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+from utils.http_cache import ConditionalCache
+from utils.python_client import _BOOL, _RESET_BUFFER, _build_url, _parse_reset, _retry_after, json_loads
+from utils.schemas import decode_list_data
+
+
+class AsyncPumpFunAPI:
+    """An asyncio client for interacting with the Pump.fun API."""
+
+    BASE_URL = 'https://frontend-api-v3.pump.fun'
+
+    logger = logging.getLogger('PumpFunAPI')
+
+    def __init__(
+        self,
+        api_key: str = None,
+        max_connections: int = 64,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        http2: bool = True,
+        http_cache: Optional[ConditionalCache] = None,
+        smoothing: str = 'burst'
+    ):
+        """Initialize the API client.
+
+        Args:
+            api_key: Optional API key for authenticated requests
+            max_connections: Size of the shared connection pool
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries after a 429 response
+            http2: Multiplex concurrent requests over one connection with HTTP/2.
+                Ignored (HTTP/1.1 keep-alive is used) when ``h2`` is not installed.
+            http_cache: Optional store of ETag/Last-Modified validators. GETs are
+                then sent conditionally and a 304 reuses the stored body.
+            smoothing: ``'burst'`` lets requests start as soon as the quota
+                allows; ``'smooth'`` queues them (leaky bucket) and releases one
+                at a time at a constant rate, spreading the quota evenly over
+                its window so concurrent callers do not trip 429s.
+        """
+        if httpx is None:
+            raise ImportError("AsyncPumpFunAPI requires httpx (pip install httpx)")
+        if smoothing not in ('burst', 'smooth'):
+            raise ValueError(f"smoothing must be 'burst' or 'smooth', not {smoothing!r}")
+
+        self.api_key = api_key or os.getenv('PUMPFUN_API_KEY')
+        self.max_retries = max_retries
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.session = self._create_session(max_connections, timeout, self.http2)
+        self.http_version = None  # Protocol negotiated by the server, e.g. 'HTTP/2'
+        self.http_cache = http_cache
+
+        # Rate limiting attributes
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        self.rate_limit_limit = None
+        self.last_request_time = 0
+        self.min_request_interval = 0.1  # Minimum time between request starts in seconds
+        self._rate_lock = None  # Created lazily so it binds to the running loop
+
+        # Leaky bucket for smoothing='smooth': waiting requests queue a future
+        # and a drain task resolves one per interval
+        self.smoothing = smoothing
+        self._queue = None
+        self._drain_task = None
+        self._window = None  # Seconds per quota window, from the first reset seen
+
+    def _create_session(self, max_connections: int, timeout: float, http2: bool = False) -> 'httpx.AsyncClient':
+        """Create a pooled async HTTP client."""
+        headers = {
+            'Accept': 'application/json',
+            'User-Agent': 'PumpFunAPI/1.0.0',
+        }
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+
+        return httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=headers,
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(32, max_connections)
+            )
+        )
+
+    async def __aenter__(self) -> 'AsyncPumpFunAPI':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop the drain task (if any) and close the underlying connection pool."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        await self.session.aclose()
+
+    def _record_http_version(self, http_version: str) -> None:
+        """Remember the protocol the server negotiated on the first response.
+
+        With HTTP/2 every concurrent request is a stream on one shared connection.
+        If the server does not offer ``h2`` via ALPN, httpx falls back to HTTP/1.1
+        keep-alive, and concurrency then comes from the ``max_connections`` pool.
+        """
+        self.http_version = http_version
+        if self.http2 and http_version != 'HTTP/2':
+            self.logger.debug("Server negotiated %s; using the HTTP/1.1 connection pool", http_version)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """Make an API request with rate limit handling.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (e.g., 'coins/search')
+            **kwargs: Additional arguments to pass to httpx.AsyncClient.request(). A
+                ``decoder`` callable may be given to parse the raw response body.
+
+        Returns:
+            Parsed JSON response as a dictionary (or whatever ``decoder`` returns)
+
+        Raises:
+            Exception: If the request fails after all retries
+        """
+        url = _build_url('', endpoint)  # Relative to the client's base_url
+        decoder = kwargs.pop('decoder', json_loads)
+
+        # Revalidate a previously seen response instead of downloading it again
+        cache_key = None
+        validators = {}
+        if self.http_cache is not None and method.upper() == 'GET':
+            cache_key = self.http_cache.key(f"{self.BASE_URL}{url}", kwargs.get('params'))
+            validators = self.http_cache.validators(cache_key)
+            if validators:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **validators}
+
+        retries = 0
+        while True:
+            await self._handle_rate_limiting()
+
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                self.logger.error("API request failed: %s", e)
+                raise Exception(f"API request failed: {e}") from e
+
+            self._update_rate_limits(response.headers)
+            if self.http_version is None:
+                self._record_http_version(response.http_version)
+
+            if response.status_code == 429 and retries < self.max_retries:
+                retries += 1
+                retry_after = _retry_after(response.headers, time.time())
+                self.logger.warning("Rate limit exceeded. Waiting %.1f seconds before retrying...", retry_after)
+                await asyncio.sleep(retry_after)
+                continue
+
+            if response.is_error:
+                try:
+                    error_msg = json_loads(response.content).get('error', response.reason_phrase)
+                except (ValueError, AttributeError):  # Not JSON, or not an object
+                    error_msg = response.text or response.reason_phrase
+                self.logger.error("API request failed: %s", error_msg)
+                # Chained like the sync client, so callers can still reach the response
+                status_error = httpx.HTTPStatusError(error_msg, request=response.request, response=response)
+                raise Exception(f"API request failed: {error_msg}") from status_error
+
+            if cache_key is not None:
+                if response.status_code == 304:
+                    body = self.http_cache.body(cache_key)
+                    if body is not None:
+                        return decoder(body)
+                    if validators:
+                        # The stored body went away after its validators were read;
+                        # ask again without them to get the full response
+                        kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k not in validators}
+                        validators = {}
+                        continue
+                else:
+                    self.http_cache.store(cache_key, response.headers, response.content)
+
+            return decoder(response.content)
+
+    def _update_rate_limits(self, headers) -> None:
+        """Update rate limit information from response headers."""
+        self.rate_limit_remaining = headers.get('X-RateLimit-Remaining')
+        self.rate_limit_limit = headers.get('X-RateLimit-Limit')
+
+        reset_time = headers.get('X-RateLimit-Reset')
+        if reset_time:
+            now = time.time()
+            self.rate_limit_reset = _parse_reset(reset_time, now)
+            if self._window is None:
+                # Sized once, like the sync token bucket: recomputing it from the
+                # time still left would shrink the spacing as the reset nears
+                self._window = max(1.0, self.rate_limit_reset - now) + _RESET_BUFFER
+
+    async def _handle_rate_limiting(self) -> None:
+        """Space out request starts and wait when the quota is nearly exhausted."""
+        if self.smoothing == 'smooth':
+            await self._wait_for_slot()
+            return
+
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
+
+        async with self._rate_lock:
+            time_since_last = time.time() - self.last_request_time
+            if time_since_last < self.min_request_interval:
+                await asyncio.sleep(self.min_request_interval - time_since_last)
+
+            await self._wait_for_reset()
+            self.last_request_time = time.time()
+
+    async def _wait_for_reset(self) -> None:
+        """Sleep out the rest of the window once the quota is nearly exhausted."""
+        if self.rate_limit_remaining is not None and self.rate_limit_remaining.isdigit():
+            if int(self.rate_limit_remaining) <= 1 and self.rate_limit_reset:
+                # Non-positive once the window (plus buffer) has passed, so a
+                # stale "remaining" from an old response never causes a wait
+                wait_time = self.rate_limit_reset + _RESET_BUFFER - time.time()
+                if wait_time > 0:
+                    self.logger.warning("Approaching rate limit. Waiting %.1f seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
+
+    def _drain_interval(self) -> float:
+        """Seconds between releases: the quota spread over its window, once known."""
+        limit = self.rate_limit_limit
+        if limit and limit.isdigit() and int(limit) and self._window:
+            return max(self.min_request_interval, self._window / int(limit))
+        return self.min_request_interval
+
+    async def _wait_for_slot(self) -> None:
+        """Queue for the leaky bucket and return once the drain task lets us go."""
+        if self._drain_task is None:
+            self._queue = asyncio.Queue()
+            self._drain_task = asyncio.ensure_future(self._drain_loop())
+
+        slot = asyncio.get_running_loop().create_future()
+        await self._queue.put(slot)
+        await slot
+
+    async def _drain_loop(self) -> None:
+        """Release queued requests one at a time at the current drain interval."""
+        while True:
+            slot = await self._queue.get()
+            if slot.done():
+                continue  # The waiting caller was cancelled; its slot is free
+            await self._wait_for_reset()
+            if slot.done():
+                continue
+            slot.set_result(None)
+            self.last_request_time = time.time()
+            await asyncio.sleep(self._drain_interval())
+
+    # General Endpoints
+
+    async def search_coins(
+        self,
+        search_term: str,
+        limit: int = 50,
+        offset: int = 0,
+        sort: str = 'market_cap',
+        order: str = 'DESC',
+        include_nsfw: bool = False,
+        search_type: str = 'exact',
+        decoder: Callable[[bytes], Any] = json_loads
+    ) -> Dict:
+        """Search for tokens. See ``PumpFunAPI.search_coins``."""
+        params = {
+            'searchTerm': search_term,
+            'limit': limit,
+            'offset': offset,
+            'sort': sort,
+            'order': order,
+            'includeNsfw': _BOOL[include_nsfw],
+            'type': search_type
+        }
+        return await self._request('GET', '/coins/search', params=params, decoder=decoder)
+
+    async def get_latest_trades(self, limit: int = 10) -> Dict:
+        """Get the latest trades across all tokens."""
+        return await self._request('GET', '/trades/latest', params={'limit': limit})
+
+    async def get_latest_coins(self, limit: int = 10, offset: int = 0, include_nsfw: bool = False) -> Dict:
+        """Get the most recently created tokens. See ``PumpFunAPI.get_latest_coins``."""
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'includeNsfw': _BOOL[include_nsfw],
+            'sort': 'created_timestamp',
+            'order': 'desc'
+        }
+
+        try:
+            tokens = await self._request('GET', '/coins/latest', params=params, decoder=decode_list_data)
+
+            for token in tokens:
+                if 'price' in token and 'total_supply' in token:
+                    try:
+                        token['market_cap'] = float(token['price']) * float(token['total_supply'])
+                    except (ValueError, TypeError):
+                        pass
+
+                if 'mint' in token:
+                    token['explorer_url'] = f"https://pump.fun/token/{token['mint']}"
+
+            return {'data': tokens}
+
+        except Exception as e:
+            self.logger.error("Error in get_latest_coins: %s", e, exc_info=True)
+            return {'data': []}
+
+    async def search_coins_bulk(
+        self,
+        addresses: List[str],
+        max_concurrency: int = 20,
+        results: Optional['asyncio.Queue'] = None
+    ) -> Dict[str, Dict]:
+        """Look up several tokens by mint address. See ``PumpFunAPI.search_coins_bulk``.
+
+        The exact-match searches run concurrently, at most ``max_concurrency`` at a time.
+        If ``results`` is given, an ``(address, record or None)`` pair is put on it
+        as each lookup finishes, so callers can report progress before all are done.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def lookup(address: str) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    response = await self.search_coins(address, limit=1, search_type='exact')
+                except Exception as e:
+                    self.logger.warning("Error looking up token %s: %s", address, e)
+                    return None
+            data = response.get('data') if isinstance(response, dict) else None
+            return data[0] if data else None
+
+        async def lookup_and_report(address: str) -> Optional[Dict]:
+            record = await lookup(address)
+            await results.put((address, record))
+            return record
+
+        unique = list(dict.fromkeys(address for address in addresses if address))
+        worker = lookup if results is None else lookup_and_report
+        records = await asyncio.gather(*[worker(address) for address in unique])
+        return {address: record for address, record in zip(unique, records) if record}
+
+    # Wallet Endpoints
+
+    async def get_wallet_holdings(
+        self,
+        wallet_address: str,
+        limit: int = 50,
+        offset: int = 0,
+        min_balance: int = -1
+    ) -> Dict:
+        """Get token holdings for a wallet. See ``PumpFunAPI.get_wallet_holdings``."""
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'minBalance': min_balance
+        }
+
+        try:
+            return {'data': await self._request(
+                'GET', f'/balances/{wallet_address}', params=params, decoder=decode_list_data
+            )}
+        except Exception as e:
+            self.logger.warning("Error fetching token balances: %s", e)
+
+        return {'data': []}
+
+    async def get_wallet_created_coins(
+        self,
+        wallet_address: str,
+        limit: int = 10,
+        offset: int = 0,
+        include_nsfw: bool = False
+    ) -> Dict:
+        """Get coins created by a wallet. See ``PumpFunAPI.get_wallet_created_coins``."""
+        params = {
+            'offset': offset,
+            'limit': limit,
+            'includeNsfw': _BOOL[include_nsfw],
+            'sort': 'created_timestamp',
+            'order': 'desc'
+        }
+
+        async def created_coins() -> List[Dict]:
+            try:
+                return await self._request(
+                    'GET', f'/coins/user-created-coins/{wallet_address}', params=params, decoder=decode_list_data
+                )
+            except Exception as e:
+                self.logger.warning("Error using user-created-coins endpoint: %s", e)
+                return []
+
+        async def search_by_creator() -> List[Dict]:
+            try:
+                return await self._request(
+                    'GET', '/coins/search', params={**params, 'creator': wallet_address}, decoder=decode_list_data
+                )
+            except Exception as e:
+                self.logger.warning("Error searching for created coins: %s", e)
+                return []
+
+        # Race both sources; the first with coins wins and the other is cancelled
+        pending = {asyncio.ensure_future(created_coins()), asyncio.ensure_future(search_by_creator())}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    data = task.result()
+                    if data:
+                        return {'data': data}
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return {'data': []}
+
+    # Token-Specific Endpoints
+
+    async def get_token_trades(
+        self,
+        token_address: str,
+        limit: int = 200,
+        offset: int = 0,
+        minimum_size: int = 50000000,
+        decoder: Callable[[bytes], Any] = json_loads
+    ) -> Dict:
+        """Get trades for a specific token."""
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'minimumSize': minimum_size
+        }
+        return await self._request('GET', f'/trades/all/{token_address}', params=params, decoder=decoder)
+
+    async def get_all_trades_async(
+        self,
+        token_address: str,
+        batch_size: int = 200,
+        max_trades: int = None,
+        minimum_size: int = 50000000,
+        window: int = 8
+    ) -> List[Dict]:
+        """Get all trades for a token, fetching up to ``window`` pages at once.
+
+        The pages of a window are requested concurrently at consecutive offsets, so
+        N pages take about N / ``window`` round-trips instead of N. Request starts
+        are still spaced out by ``_handle_rate_limiting``.
+
+        Args:
+            token_address: The token contract address
+            batch_size: Number of trades to fetch per request (default: 200)
+            max_trades: Maximum number of trades to return (default: None, return all)
+            minimum_size: Minimum trade size to include (default: 50000000)
+            window: Number of pages in flight at a time (default: 8)
+
+        Returns:
+            List of trade dictionaries, in offset order
+        """
+        all_trades = []
+        offset = 0
+
+        while not max_trades or len(all_trades) < max_trades:
+            pages = window
+            if max_trades:
+                pages = min(window, -(-(max_trades - len(all_trades)) // batch_size))
+
+            responses = await asyncio.gather(*[
+                self.get_token_trades(
+                    token_address,
+                    limit=batch_size,
+                    offset=offset + page * batch_size,
+                    minimum_size=minimum_size
+                )
+                for page in range(pages)
+            ])
+
+            # A short (or empty) page means there is nothing after it
+            for response in responses:
+                trades = response.get('trades') if isinstance(response, dict) else None
+                if trades:
+                    all_trades.extend(trades)
+                if not trades or len(trades) < batch_size:
+                    return all_trades[:max_trades] if max_trades else all_trades
+
+            offset += pages * batch_size
+
+        return all_trades[:max_trades]
+
+    async def get_token_comments(
+        self,
+        token_address: str,
+        limit: int = 1000,
+        offset: int = 0,
+        decoder: Callable[[bytes], Any] = json_loads
+    ) -> Dict:
+        """Get comments for a specific token."""
+        params = {
+            'limit': limit,
+            'offset': offset
+        }
+        return await self._request('GET', f'/replies/{token_address}', params=params, decoder=decoder)
@@ -0,0 +1,129 @@
+"""
+Retry helpers: capped exponential backoff with full jitter.
+
+Each retry sleeps ``random.uniform(0, min(cap, base * 2 ** attempt))``, so
+concurrent workers that failed together don't retry in lockstep. A 429's
+``Retry-After`` header takes precedence over the computed delay.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import requests
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None
+
+logger = logging.getLogger(__name__)
+
+# Failures without an HTTP status that are worth retrying (network blips, timeouts)
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+# Failures carrying the HTTP response (status code, Retry-After) that caused them
+HTTP_STATUS_ERRORS = ()
+if httpx is not None:
+    TRANSIENT_ERRORS += (httpx.TransportError,)
+    HTTP_STATUS_ERRORS += (httpx.HTTPStatusError,)
+if requests is not None:
+    TRANSIENT_ERRORS += (requests.ConnectionError, requests.Timeout)
+    HTTP_STATUS_ERRORS += (requests.HTTPError,)
+
+
+def backoff_delays(max_retries: int = 5, base: float = 0.5, cap: float = 30.0) -> Iterator[float]:
+    """Yield up to ``max_retries`` full-jitter sleep durations, in seconds."""
+    for attempt in range(max_retries):
+        yield random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def status_error(exc: BaseException) -> Optional[BaseException]:
+    """Return the HTTP status error ``exc`` is or was raised from, else None.
+
+    The API clients wrap failures in a plain ``Exception`` chained from the
+    original, so the typed error is looked for along ``__cause__``.
+    """
+    while exc is not None:
+        if isinstance(exc, HTTP_STATUS_ERRORS) and exc.response is not None:
+            return exc
+        exc = exc.__cause__
+    return None
+
+
+def retry_delay(exc: BaseException, computed: float, retry_rate_limited: bool = True) -> Optional[float]:
+    """Return how long to wait before retrying after ``exc``, or None to give up.
+
+    429 responses wait for ``Retry-After`` (else ``computed``) unless
+    ``retry_rate_limited`` is False, 5xx responses and transient network errors
+    wait ``computed``, and other client errors are not retried. Wrapped
+    exceptions are classified by their ``__cause__``.
+    """
+    http_error = status_error(exc)
+    if http_error is not None:
+        response = http_error.response
+        if response.status_code == 429:
+            if not retry_rate_limited:
+                return None
+            try:
+                return float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                return computed
+        return computed if response.status_code >= 500 else None
+
+    while exc is not None:
+        if isinstance(exc, TRANSIENT_ERRORS):
+            return computed
+        exc = exc.__cause__
+    return None
+
+
+def retry_with_backoff(max_retries: int = 5, base: float = 0.5, cap: float = 30.0,
+                       retry_rate_limited: bool = True) -> Callable:
+    """Decorator retrying a sync or async callable per ``retry_delay``.
+
+    Args:
+        max_retries: Retries after the first attempt
+        base: Delay cap of the first retry, doubled on each further retry
+        cap: Upper bound of any computed delay
+        retry_rate_limited: Also wait out and retry 429 responses; when False
+            they are raised at once (e.g. for callers measuring rate limits)
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                for computed in backoff_delays(max_retries, base, cap):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = retry_delay(e, computed, retry_rate_limited)
+                        if delay is None:
+                            raise
+                        logger.warning("Retrying %s in %.2fs after %r", func.__name__, delay, e)
+                        await asyncio.sleep(delay)
+                # Last attempt; its failure propagates
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            for computed in backoff_delays(max_retries, base, cap):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    delay = retry_delay(e, computed, retry_rate_limited)
+                    if delay is None:
+                        raise
+                    logger.warning("Retrying %s in %.2fs after %r", func.__name__, delay, e)
+                    time.sleep(delay)
+            # Last attempt; its failure propagates
+            return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,110 @@
+"""
+Conditional GET support for the API clients.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` header are stored in a small
+SQLite file together with their body. The next GET of the same URL sends
+``If-None-Match`` / ``If-Modified-Since``; when the server answers ``304 Not
+Modified`` the stored body is used instead of downloading it again.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path.home() / '.pumpfun' / 'http_cache.sqlite'
+
+
+class ConditionalCache:
+    """SQLite store of validators and bodies for conditional GETs, keyed by URL."""
+
+    def __init__(self, path: Optional[os.PathLike] = None):
+        """Open (creating if needed) the cache file.
+
+        Args:
+            path: SQLite file to use (default: ~/.pumpfun/http_cache.sqlite, or
+                the ``PUMPFUN_HTTP_CACHE`` environment variable when set)
+        """
+        self.path = Path(path or os.getenv('PUMPFUN_HTTP_CACHE') or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)'
+            )
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Return the cache key for a GET of ``url`` with query ``params``."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """Return the conditional request headers for ``key`` (empty if not cached)."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified FROM responses WHERE url = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def body(self, key: str) -> Optional[bytes]:
+        """Return the stored body for ``key``, or None if it is not cached."""
+        with self._lock:
+            row = self._conn.execute('SELECT body FROM responses WHERE url = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Remember ``body`` for ``key`` if the response carries a validator."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (url, etag, last_modified, body) VALUES (?, ?, ?, ?)',
+                (key, etag, last_modified, body)
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_http_cache() -> Optional[ConditionalCache]:
+    """Return the process-wide conditional GET cache, opening it on first use.
+
+    Returns None (after logging a warning) when the cache file cannot be opened,
+    so clients simply make unconditional requests.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = ConditionalCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("HTTP cache unavailable: %s", e)
+                return None
+        return _default_cache
@@ -6,29 +6,214 @@ A simple Python client for interacting with the Pump.fun API.
 
 import os
 import time
+import functools
 import json
+import itertools
+import math
+import socket
+import threading
 import logging
 import requests
-from typing import Dict, List, Optional, Union, Any
+import urllib3
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
+from utils.http_cache import ConditionalCache
+from utils._normalize import LIST_KEYS
+from utils.schemas import CoinList, decode_coin_list, decode_list_data
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import httpx
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None
+
+# Per-request expire_after that keeps a response out of the requests-cache store
+_DO_NOT_CACHE = requests_cache.DO_NOT_CACHE if requests_cache is not None else None
+
+# Query-string spelling of boolean parameters
+_BOOL = {True: 'true', False: 'false'}
+
+# Transport failures from whichever HTTP library the session uses
+_REQUEST_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+# Decodes a JSON response body. Bound straight to orjson's C parser when it is
+# installed, so each response pays no extra Python call on top of the parse.
+json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+# X-RateLimit-Reset values below this are seconds from now, not a Unix time
+_RESET_DELTA_MAX = 10 ** 6
+# Seconds added to every reset time to absorb clock skew against the API
+_RESET_BUFFER = 5
+
+
+def _parse_reset(value: str, now: float) -> Optional[float]:
+    """Return an X-RateLimit-Reset header as a Unix time, or None if it is not a number."""
+    try:
+        reset = int(value)
+    except (ValueError, TypeError):
+        return None
+    return now + reset if reset < _RESET_DELTA_MAX else float(reset)
+
+
+def _retry_after(headers: Dict[str, str], now: float) -> float:
+    """Seconds to wait after a 429: Retry-After (default 60), but no longer than
+    until the quota resets (plus the safety buffer) when the response says when."""
+    retry_after = int(headers.get('Retry-After', 60))
+    reset = _parse_reset(headers.get('X-RateLimit-Reset'), now)
+    if reset is not None:
+        return min(retry_after, max(0, reset - now) + _RESET_BUFFER)
+    return retry_after
+
+
+def _is_older(cursor: Any, previous: Any) -> bool:
+    """Whether a trade cursor sorts before the previous one (False if they don't compare)."""
+    try:
+        return cursor is not None and cursor < previous
+    except TypeError:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _build_url(base: str, endpoint: str) -> str:
+    """Join ``base`` and ``endpoint``; memoized, as the same endpoints recur constantly."""
+    return f"{base}/{endpoint.lstrip('/')}"
+
+
+class _StreamFallback(Exception):
+    """A streamed response could not be read as a list; fetch it buffered instead."""
+
+
+def _list_item_prefix(events: Iterator[tuple]) -> Optional[str]:
+    """Consume ijson events up to the list to stream and return its item prefix.
+    
+    Matches a bare list, or the first top-level ``LIST_KEYS`` field of an
+    envelope whose value is a list. Returns None if there is no such list.
+    """
+    _, event, _ = next(events, (None, None, None))
+    if event == 'start_array':
+        return 'item'
+    if event == 'start_map':
+        for prefix, event, _ in events:
+            if event == 'start_array' and prefix in LIST_KEYS:
+                return f'{prefix}.item'
+    return None
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle and send TCP keep-alives.
+
+    Small API requests go out without waiting on delayed ACKs, and idle pooled
+    connections are less likely to be silently dropped by middleboxes between
+    calls, which would otherwise cost a fresh TCP and TLS handshake.
+    """
+
+    # urllib3's defaults already set TCP_NODELAY; add it explicitly only if not
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        option for option in [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if option not in HTTPConnection.default_socket_options
+    ] + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class PumpFunAPI:
     """A client for interacting with the Pump.fun API."""
     
     BASE_URL = 'https://frontend-api-v3.pump.fun'
     
-    def __init__(self, api_key: str = None, max_retries: int = 3, backoff_factor: float = 1.0):
+    # Shared by every instance; the example scripts tune it by this name
+    logger = logging.getLogger('PumpFunAPI')
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        max_retries: int = 3,
+        backoff_factor: float = 1.0,
+        pool_maxsize: int = 100,
+        http_cache: Optional[ConditionalCache] = None,
+        http2: bool = False,
+        response_cache: Optional[str] = None,
+        max_429_retries: int = 5
+    ):
         """Initialize the API client.
         
         Args:
             api_key: Optional API key for authenticated requests
-            max_retries: Maximum number of retries for failed requests
+            max_retries: Maximum number of retries for failed requests. 0 disables
+                transport-level retries, so every 429/5xx reaches the caller.
             backoff_factor: Backoff factor for retries (exponential backoff)
+            pool_maxsize: Maximum number of keep-alive connections kept per host
+            http_cache: Optional store of ETag/Last-Modified validators. GETs are
+                then sent conditionally and a 304 reuses the stored body.
+            http2: Send requests through an ``httpx.Client`` that multiplexes
+                them as HTTP/2 streams over one connection, instead of a
+                ``requests`` connection pool. Needs httpx with h2 installed; if
+                they are not, a warning is logged and requests is used.
+            response_cache: Path of a requests-cache SQLite file. GET responses
+                are then served from it for 30 seconds (or as long as their
+                Cache-Control headers allow), revalidated with their ETag after
+                that, and reused when the API errors. Needs requests-cache;
+                ignored with ``http2``.
+            max_429_retries: How many times one request waits out a 429's
+                Retry-After and tries again before the error is raised
         """
         self.api_key = api_key or os.getenv('PUMPFUN_API_KEY')
-        self.logger = logging.getLogger('PumpFunAPI')
-        self.session = self._create_session(max_retries, backoff_factor)
+        if http2 and httpx is None:
+            self.logger.warning("HTTP/2 needs httpx[http2]; falling back to requests")
+        self.http2 = http2 and httpx is not None
+        if response_cache and requests_cache is None:
+            self.logger.warning("response_cache needs requests-cache; responses will not be cached")
+        if self.http2:
+            self.session = self._create_http2_client(max_retries)
+        else:
+            self.session = self._create_session(max_retries, backoff_factor, pool_maxsize, response_cache)
+        self.response_cache = requests_cache is not None and isinstance(self.session, requests_cache.CachedSession)
+        self.http_cache = http_cache
+        
+        # Bare urllib3 pool for get_all_trades' page loop; not used when the
+        # session adds HTTP/2 or response caching that the pool would bypass
+        self._pool = None
+        if not self.http2 and not self.response_cache:
+            self._pool = self._create_pool(max_retries, backoff_factor, pool_maxsize)
+            self._headers = dict(self.session.headers)
+        self.max_429_retries = max_429_retries
+        self._shutdown_event = threading.Event()  # Set by close() to cut waits short
+        
+        # Fixed-URL GETs used by polling loops, pre-bound to their method,
+        # endpoint and cache lifetime so each call only passes its params
+        self._get_latest_trades = functools.partial(self._request, 'GET', '/trades/latest', expire_after=2)
+        self._get_latest_coins = functools.partial(self._request, 'GET', '/coins/latest')
+        self._get_search = functools.partial(self._request, 'GET', '/coins/search')
         
         # Rate limiting attributes
         self.rate_limit_remaining = None
@@ -36,27 +221,70 @@ class PumpFunAPI:
         self.rate_limit_limit = None
         self.last_request_time = 0
         self.min_request_interval = 0.1  # Minimum time between requests in seconds
+        self._rate_lock = threading.Lock()  # Lets threads share one client safely
+        
+        # Token bucket sized from the quota headers; until they are seen, requests
+        # are only spaced by min_request_interval
+        self._capacity = None
+        self._tokens = 0.0
+        self._refill_rate = None  # Tokens per second
+        self._window = None  # Seconds per quota window, from the first reset seen
+        self._last_refill = time.time()
     
-    def _create_session(self, max_retries: int, backoff_factor: float) -> requests.Session:
-        """Create a requests session with retry logic."""
-        session = requests.Session()
+    def _create_session(
+        self,
+        max_retries: int,
+        backoff_factor: float,
+        pool_maxsize: int = 100,
+        response_cache: Optional[str] = None
+    ) -> requests.Session:
+        """Create a requests session with retry logic and a shared keep-alive pool.
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
+        With ``response_cache`` (and requests-cache installed) the session is a
+        ``CachedSession`` storing GET responses in that SQLite file.
+        """
+        if response_cache and requests_cache is not None:
+            session = requests_cache.CachedSession(
+                response_cache,
+                backend='sqlite',
+                expire_after=30,
+                allowable_methods=('GET',),
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            session = requests.Session()
         
-        # Mount the retry strategy to all HTTPS requests
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Configure retry strategy. With no retries allowed, a status forcelist
+        # would turn the first 429 into a RetryError that hides the response.
+        if max_retries:
+            retry_strategy = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+        else:
+            retry_strategy = Retry(total=0, read=False)
+        
+        # Mount the retry strategy for both schemes. The pool is sized so
+        # concurrent callers reuse open connections instead of discarding them;
+        # with pool_block=False a burst beyond it opens extra connections
+        # rather than waiting for one to be returned.
+        adapter = _KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=pool_maxsize,
+            pool_block=False
+        )
         session.mount('https://', adapter)
+        session.mount('http://', adapter)
         
         # Set default headers
         session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'PumpFunAPI/1.0.0',
+            'Connection': 'keep-alive',
         })
         
         if self.api_key:
@@ -64,28 +292,119 @@ class PumpFunAPI:
             
         return session
     
+    def _create_pool(self, max_retries: int, backoff_factor: float, pool_maxsize: int) -> urllib3.PoolManager:
+        """Create the urllib3 pool behind ``_request_fast``.
+        
+        It retries the same server errors as the session, but not 429, which
+        is left to the caller's rate-limit handling.
+        """
+        retry_strategy = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        ) if max_retries else Retry(total=0, read=False)
+        return urllib3.PoolManager(
+            num_pools=1,
+            maxsize=pool_maxsize,
+            block=False,
+            retries=retry_strategy,
+            socket_options=_KeepAliveAdapter.SOCKET_OPTIONS
+        )
+    
+    def _create_http2_client(self, max_retries: int) -> 'httpx.Client':
+        """Create an httpx client that multiplexes requests over HTTP/2.
+        
+        The transport only retries failed connection attempts; 429 and other
+        status codes are handled in ``_request``.
+        """
+        headers = {
+            'Accept': 'application/json',
+            'User-Agent': 'PumpFunAPI/1.0.0',
+        }
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        
+        return httpx.Client(
+            base_url=self.BASE_URL,
+            headers=headers,
+            http2=True,
+            # Pool limits go on the transport: httpx ignores a client-level
+            # ``limits`` once a transport is passed in
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=max_retries,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+            )
+        )
+    
+    def __enter__(self) -> 'PumpFunAPI':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Interrupt any rate-limit waits and close the connection pools.
+        
+        Requests blocked waiting out a 429 or an empty quota bucket fail
+        immediately instead of sleeping to the end of the wait.
+        """
+        self._shutdown_event.set()
+        self.session.close()
+        if self._pool is not None:
+            self._pool.clear()
+    
+    def _wait(self, seconds: float) -> None:
+        """Sleep for ``seconds``, or raise at once if the client is closed meanwhile."""
+        if self._shutdown_event.wait(seconds):
+            raise Exception("API request failed: client closed")
+    
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make an API request with rate limit handling.
         
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (e.g., 'tokens/search')
-            **kwargs: Additional arguments to pass to requests.request()
+            **kwargs: Additional arguments to pass to the session's request(). A
+                ``decoder`` callable may be given to parse the raw response body
+                instead of the default JSON decoding, and ``expire_after`` sets
+                this response's lifetime in the response cache (if enabled).
             
         Returns:
-            Parsed JSON response as a dictionary
+            Parsed JSON response as a dictionary (or whatever ``decoder`` returns)
             
         Raises:
             Exception: If the request fails after all retries
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        url = _build_url(self.BASE_URL, endpoint)
+        decoder = kwargs.pop('decoder', json_loads)
+        expire_after = kwargs.pop('expire_after', None)
+        if expire_after is not None and self.response_cache:
+            kwargs['expire_after'] = expire_after
         
-        # Respect rate limits
-        self._handle_rate_limiting()
+        # Revalidate a previously seen response instead of downloading it again
+        cache_key = None
+        validators = {}
+        if self.http_cache is not None and method.upper() == 'GET':
+            cache_key = self.http_cache.key(url, kwargs.get('params'))
+            validators = self.http_cache.validators(cache_key)
+            if validators:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **validators}
         
-        try:
-            # Make the request
-            response = self.session.request(method, url, **kwargs)
+        retries_429 = 0
+        while True:
+            # Respect rate limits
+            self._handle_rate_limiting()
+            
+            try:
+                # Make the request
+                response = self.session.request(method, url, **kwargs)
+            except _REQUEST_ERRORS as e:
+                # Transport failure, or the retry adapter gave up on 429/5xx
+                self.logger.error("API request failed: %s", e)
+                raise Exception(f"API request failed: {e}") from e
             
             # Update rate limit information from headers
             self._update_rate_limits(response.headers)
@@ -93,40 +412,90 @@ class PumpFunAPI:
             # Log rate limit information
             self._log_rate_limit_info(endpoint)
             
-            # Check for rate limit exceeded (429 status code)
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                self.logger.warning(f"Rate limit exceeded. Waiting {retry_after} seconds before retrying...")
-                time.sleep(retry_after)
-                return self._request(method, endpoint, **kwargs)
-                
-            # Raise an exception for other error status codes
-            response.raise_for_status()
+            status = response.status_code
             
-            # Update last request time
-            self.last_request_time = time.time()
+            # Unchanged since the cached copy
+            if status == 304 and cache_key is not None:
+                body = self.http_cache.body(cache_key)
+                if body is not None:
+                    self.last_request_time = time.time()
+                    return decoder(body)
+                if validators:
+                    # The stored body went away after its validators were read;
+                    # ask again without them to get the full response
+                    kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k not in validators}
+                    validators = {}
+                    continue
             
-            return response.json()
+            if status < 400:
+                self.last_request_time = time.time()
+                if cache_key is not None and status != 304:
+                    self.http_cache.store(cache_key, response.headers, response.content)
+                return decoder(response.content)
             
-        except requests.exceptions.RequestException as e:
-            error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get('error', error_msg)
-                    
-                    # Check for rate limit in error response
-                    if e.response.status_code == 429:
-                        retry_after = int(e.response.headers.get('Retry-After', 60))
-                        self.logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                        time.sleep(retry_after)
-                        return self._request(method, endpoint, **kwargs)
-                        
-                except ValueError:
-                    error_msg = e.response.text or error_msg
-                    
-            self.logger.error(f"API request failed: {error_msg}")
-            raise Exception(f"API request failed: {error_msg}") from e
+            # Rate limit exceeded; once out of retries it is raised like any error
+            if status == 429 and retries_429 < self.max_429_retries:
+                retries_429 += 1
+                retry_after = _retry_after(response.headers, time.time())
+                self.logger.warning("Rate limit exceeded. Waiting %.1f seconds before retrying...", retry_after)
+                self._wait(retry_after)
+                continue
+            
+            error_msg = self._error_message(response, url)
+            self.logger.error("API request failed: %s", error_msg)
+            raise Exception(f"API request failed: {error_msg}") from self._status_error(response, error_msg)
+    
+    @staticmethod
+    def _error_message(response: Any, url: str) -> str:
+        """Return the API's ``error`` field from an error response, else its body or status."""
+        fallback = f"{response.status_code} Error for url: {url}"
+        try:
+            error_data = json_loads(response.content)
+            return error_data.get('error', fallback)
+        except (ValueError, AttributeError):
+            return response.text or fallback
+    
+    @staticmethod
+    def _status_error(response: Any, error_msg: str) -> Exception:
+        """Return the HTTP library's status error for ``response``.
+        
+        Failures are raised chained from it, as raise_for_status used to do, so
+        callers (e.g. utils.backoff) can still reach the status and headers.
+        """
+        if httpx is not None and isinstance(response, httpx.Response):
+            return httpx.HTTPStatusError(error_msg, request=response.request, response=response)
+        return requests.HTTPError(error_msg, response=response)
+    
+    def _request_fast(self, endpoint: str, params: Dict) -> Optional[Any]:
+        """GET ``endpoint`` straight through the urllib3 pool and decode the body.
+        
+        Skips requests' per-call request preparation, hooks and cookie merging,
+        but still paces the request and reads the rate-limit headers.
+        
+        Returns:
+            The decoded body, or None if the pool is not in use or the request
+            failed or was rate limited; callers then fall back to ``_request``,
+            which handles retries and error reporting.
+        """
+        if self._pool is None:
+            return None
+        
+        self._handle_rate_limiting()
+        try:
+            response = self._pool.request(
+                'GET', _build_url(self.BASE_URL, endpoint), fields=params, headers=self._headers
+            )
+        except urllib3.exceptions.HTTPError as e:
+            self.logger.warning("Fast request to %s failed, retrying through the session: %s", endpoint, e)
+            return None
+        
+        self._update_rate_limits(response.headers)
+        if response.status != 200:
+            return None
+        try:
+            return json_loads(response.data)
+        except ValueError:
+            return None
     
     def _update_rate_limits(self, headers: Dict[str, str]) -> None:
         """Update rate limit information from response headers."""
@@ -135,41 +504,74 @@ class PumpFunAPI:
         self.rate_limit_limit = headers.get('X-RateLimit-Limit')
         
         # Parse rate limit reset time if available
+        now = time.time()
         reset_time = headers.get('X-RateLimit-Reset')
         if reset_time:
-            try:
-                self.rate_limit_reset = int(reset_time)
-            except (ValueError, TypeError):
-                self.rate_limit_reset = None
+            self.rate_limit_reset = _parse_reset(reset_time, now)
+        
+        if self.rate_limit_limit and self.rate_limit_limit.isdigit() and reset_time and self.rate_limit_reset:
+            remaining = self.rate_limit_remaining
+            remaining = float(remaining) if remaining and remaining.isdigit() else None
+            with self._rate_lock:
+                self._refill_bucket(now)
+                capacity = int(self.rate_limit_limit)
+                if self._capacity is None:
+                    # Start from what the server says is left of this window, and
+                    # size the window once from this first reset; recomputing it
+                    # from the time still left would refill ever faster near the reset
+                    self._tokens = remaining if remaining is not None else float(capacity)
+                    self._window = max(1.0, self.rate_limit_reset - now) + _RESET_BUFFER
+                self._capacity = capacity
+                self._tokens = min(self._tokens, capacity)
+                if remaining is not None:
+                    # Never assume more quota than the server reports is left
+                    self._tokens = min(self._tokens, remaining)
+                # Spread the quota over the window (plus the safety buffer)
+                self._refill_rate = capacity / self._window
+    
+    def _refill_bucket(self, now: float) -> None:
+        """Add the tokens earned since the last refill, up to capacity. Needs the lock."""
+        if self._refill_rate:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
     
     def _handle_rate_limiting(self) -> None:
-        """Handle rate limiting by waiting if necessary."""
-        current_time = time.time()
-        
-        # Enforce minimum time between requests
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        # Check if we're close to hitting rate limits
-        if self.rate_limit_remaining is not None and self.rate_limit_remaining.isdigit():
-            remaining = int(self.rate_limit_remaining)
-            if remaining <= 1:  # If we have 1 or 0 requests left
-                if self.rate_limit_reset:
-                    reset_time = self.rate_limit_reset
-                    wait_time = max(0, reset_time - time.time() + 1)  # Add 1 second buffer
-                    if wait_time > 0:
-                        self.logger.warning(f"Approaching rate limit. Waiting {wait_time:.1f} seconds...")
-                        time.sleep(wait_time)
+        """Handle rate limiting by waiting if necessary.
+        
+        Once the quota headers are known this is a token bucket: tokens refill
+        continuously at limit / window and each request spends one, so bursts up
+        to the quota go out immediately and only an empty bucket waits. Before
+        that, request starts are spaced by ``min_request_interval``.
+        
+        Serialized with a lock so concurrent threads space out their request
+        starts instead of all passing the check at once.
+        """
+        with self._rate_lock:
+            if self._capacity is None:
+                # Enforce minimum time between requests
+                time_since_last = time.time() - self.last_request_time
+                if time_since_last < self.min_request_interval:
+                    time.sleep(self.min_request_interval - time_since_last)
+            else:
+                self._refill_bucket(time.time())
+                if self._tokens < 1:
+                    wait_time = (1 - self._tokens) / self._refill_rate
+                    if wait_time >= 1:
+                        self.logger.warning("Rate limit quota used up. Waiting %.1f seconds...", wait_time)
+                    self._wait(wait_time)
+                    self._refill_bucket(time.time())
+                self._tokens -= 1
+            
+            self.last_request_time = time.time()
     
     def _log_rate_limit_info(self, endpoint: str) -> None:
         """Log rate limit information for debugging."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if self.rate_limit_remaining is not None and self.rate_limit_limit is not None:
             self.logger.debug(
-                f"Rate limits - Endpoint: {endpoint}, "
-                f"Remaining: {self.rate_limit_remaining}/{self.rate_limit_limit}, "
-                f"Reset: {self.rate_limit_reset}"
+                "Rate limits - Endpoint: %s, Remaining: %s/%s, Reset: %s",
+                endpoint, self.rate_limit_remaining, self.rate_limit_limit, self.rate_limit_reset
             )
     
     # General Endpoints
@@ -182,7 +584,8 @@ class PumpFunAPI:
         sort: str = 'market_cap',
         order: str = 'DESC',
         include_nsfw: bool = False,
-        search_type: str = 'exact'
+        search_type: str = 'exact',
+        decoder: Callable[[bytes], Any] = json_loads
     ) -> Dict:
         """Search for tokens.
         
@@ -194,9 +597,11 @@ class PumpFunAPI:
             order: Sort order ('ASC' or 'DESC')
             include_nsfw: Include NSFW content (default: False)
             search_type: Search type ('exact' or 'fuzzy')
+            decoder: Parser for the raw response body, e.g. one of the typed
+                decoders in utils.schemas (default: plain JSON)
             
         Returns:
-            Dictionary containing search results
+            Dictionary containing search results (or whatever ``decoder`` returns)
         """
         params = {
             'searchTerm': search_term,
@@ -204,10 +609,34 @@ class PumpFunAPI:
             'offset': offset,
             'sort': sort,
             'order': order,
-            'includeNsfw': str(include_nsfw).lower(),
+            'includeNsfw': _BOOL[include_nsfw],
             'type': search_type
         }
-        return self._request('GET', '/coins/search', params=params)
+        # Fuzzy results are not worth keeping in the response cache
+        expire_after = _DO_NOT_CACHE if search_type == 'fuzzy' else None
+        return self._get_search(params=params, decoder=decoder, expire_after=expire_after)
+    
+    def search_coins_typed(
+        self,
+        search_term: str,
+        limit: int = 50,
+        offset: int = 0,
+        sort: str = 'market_cap',
+        order: str = 'DESC',
+        include_nsfw: bool = False,
+        search_type: str = 'exact'
+    ) -> CoinList:
+        """Search for tokens, decoding only the display fields into typed objects.
+        
+        Takes the same arguments as search_coins, but returns a ``CoinList`` whose
+        ``data`` holds ``Coin`` objects (see utils.schemas). With msgspec installed
+        the response bytes are decoded directly into structs, skipping the full
+        dict tree.
+        """
+        return self.search_coins(
+            search_term, limit, offset, sort, order, include_nsfw, search_type,
+            decoder=decode_coin_list
+        )
     
     def get_latest_trades(self, limit: int = 10) -> Dict:
         """Get the latest trades across all tokens.
@@ -218,7 +647,7 @@ class PumpFunAPI:
         Returns:
             Dictionary containing latest trades
         """
-        return self._request('GET', f'/trades/latest?limit={limit}')
+        return self._get_latest_trades(params={'limit': limit})
     
     def get_latest_coins(self, limit: int = 10, offset: int = 0, include_nsfw: bool = False) -> Dict:
         """Get the most recently created tokens with pagination support.
@@ -234,44 +663,176 @@ class PumpFunAPI:
         params = {
             'limit': limit,
             'offset': offset,
-            'includeNsfw': str(include_nsfw).lower(),
+            'includeNsfw': _BOOL[include_nsfw],
             'sort': 'created_timestamp',
             'order': 'desc'
         }
         
         try:
             # Get the list of latest coins
-            response = self._request('GET', '/coins/latest', params=params)
-            
-            # Process the response to ensure consistent format
-            if isinstance(response, dict) and 'data' in response:
-                tokens = response['data']
-            elif isinstance(response, list):
-                tokens = response
-            else:
-                tokens = [response] if response else []
+            # The decoder pulls the coin list out of whichever envelope (or bare
+            # list) the endpoint answers with
+            tokens = self._get_latest_coins(params=params, decoder=decode_list_data)
             
             # Add additional calculated fields
-            for token in tokens:
-                # Calculate market cap if we have price and supply
-                if 'price' in token and 'total_supply' in token:
-                    try:
-                        price = float(token['price'])
-                        supply = float(token['total_supply'])
-                        token['market_cap'] = price * supply
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Add a link to the token on Pump.fun
-                if 'mint' in token:
-                    token['explorer_url'] = f"https://pump.fun/token/{token['mint']}"
+            self._add_coin_fields_bulk(tokens)
             
             return {'data': tokens}
                 
         except Exception as e:
-            self.logger.error(f"Error in get_latest_coins: {str(e)}", exc_info=True)
+            self.logger.error("Error in get_latest_coins: %s", e, exc_info=True)
             return {'data': []}
     
+    def iter_latest_coins(self, limit: int = 10, offset: int = 0, include_nsfw: bool = False) -> Iterator[Dict]:
+        """Yield the most recently created tokens as they are parsed.
+        
+        With ijson installed the response body is streamed and parsed one coin at a
+        time, stopping after ``limit`` coins, so the full list is never held in
+        memory. Otherwise (on the HTTP/2 client, or if the body cannot be
+        streamed) this falls back to get_latest_coins.
+        
+        Args:
+            limit: Maximum number of coins to yield (default: 10)
+            offset: Pagination offset (default: 0)
+            include_nsfw: Include NSFW content (default: False)
+            
+        Yields:
+            Coin dictionaries with the same calculated fields as get_latest_coins
+        """
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'includeNsfw': _BOOL[include_nsfw],
+            'sort': 'created_timestamp',
+            'order': 'desc'
+        }
+        
+        items = self._iter_items(
+            '/coins/latest', params,
+            lambda: self.get_latest_coins(limit=limit, offset=offset, include_nsfw=include_nsfw)['data']
+        )
+        count = 0
+        try:
+            for token in items:
+                if count >= limit:
+                    break
+                if isinstance(token, dict):
+                    self._add_coin_fields(token)
+                    yield token
+                    count += 1
+        finally:
+            items.close()
+    
+    def _iter_items(self, endpoint: str, params: Dict, buffered: Callable[[], List[Any]]) -> Iterator[Any]:
+        """Yield the records of a list endpoint, streamed when possible.
+        
+        The records are streamed with ``_stream_items``. If streaming is
+        unavailable or fails partway (bad or truncated body, no list in the
+        envelope), the rest comes from ``buffered()``, the regular request,
+        skipping the records already yielded.
+        """
+        items = self._stream_items(endpoint, params)
+        count = 0
+        if items is not None:
+            try:
+                for item in items:
+                    count += 1
+                    yield item
+                return
+            except _StreamFallback as e:
+                self.logger.warning("Streaming %s failed, retrying buffered: %s", endpoint, e)
+            finally:
+                items.close()
+        yield from itertools.islice(buffered(), count, None)
+    
+    def _stream_items(self, endpoint: str, params: Dict) -> Optional[Iterator[Any]]:
+        """Start a streamed GET and return an iterator over the items of its JSON list.
+        
+        The endpoint may answer with a bare list or an envelope holding the list
+        under any of ``LIST_KEYS``; items are parsed with ijson as the body arrives.
+        
+        Returns:
+            The item iterator (it closes the response when exhausted or closed,
+            and raises ``_StreamFallback`` if the body is not such a list), or
+            None if streaming is unavailable (no ijson, or the HTTP/2 client) or
+            the request failed or was rate limited. Callers then fall back to
+            the buffered request, which handles retries and error reporting.
+        """
+        if ijson is None or self.http2:
+            return None
+        
+        self._handle_rate_limiting()
+        try:
+            response = self.session.get(_build_url(self.BASE_URL, endpoint), params=params, stream=True)
+        except _REQUEST_ERRORS as e:
+            self.logger.warning("Streaming %s failed, retrying buffered: %s", endpoint, e)
+            return None
+        
+        self._update_rate_limits(response.headers)
+        if response.status_code == 429 or not response.ok:
+            response.close()
+            return None
+        return self._iter_response_items(response)
+    
+    @staticmethod
+    def _iter_response_items(response: requests.Response) -> Iterator[Any]:
+        """Parse the items of a streamed JSON list, closing the response afterwards."""
+        with response:
+            response.raw.decode_content = True
+            try:
+                events = ijson.parse(response.raw, use_float=True)
+                prefix = _list_item_prefix(events)
+                if prefix is None:
+                    raise _StreamFallback("response has no list of records")
+                yield from ijson.items(events, prefix)
+            except (ijson.JSONError, urllib3.exceptions.HTTPError) as e:
+                raise _StreamFallback(str(e)) from e
+    
+    @staticmethod
+    def _add_coin_fields(token: Dict) -> None:
+        """Add the calculated market cap and explorer URL to a coin record."""
+        # Calculate market cap if we have price and supply
+        if 'price' in token and 'total_supply' in token:
+            try:
+                price = float(token['price'])
+                supply = float(token['total_supply'])
+                token['market_cap'] = price * supply
+            except (ValueError, TypeError):
+                pass
+        
+        # Add a link to the token on Pump.fun
+        if 'mint' in token:
+            token['explorer_url'] = f"https://pump.fun/token/{token['mint']}"
+    
+    @classmethod
+    def _add_coin_fields_bulk(cls, tokens: List[Dict]) -> None:
+        """Add the fields of ``_add_coin_fields`` to every coin in ``tokens``.
+        
+        With NumPy installed all market caps are computed in one vectorized
+        multiply; missing or null prices and supplies become NaN and are skipped.
+        Pages with values NumPy cannot parse fall back to the per-coin path.
+        """
+        if np is None or not tokens:
+            for token in tokens:
+                cls._add_coin_fields(token)
+            return
+        
+        count = len(tokens)
+        try:
+            prices = np.fromiter((t.get('price') for t in tokens), dtype=np.float64, count=count)
+            supplies = np.fromiter((t.get('total_supply') for t in tokens), dtype=np.float64, count=count)
+        except (ValueError, TypeError, AttributeError):
+            for token in tokens:
+                cls._add_coin_fields(token)
+            return
+        
+        prefix = "https://pump.fun/token/"
+        for token, market_cap in zip(tokens, (prices * supplies).tolist()):
+            if not math.isnan(market_cap):
+                token['market_cap'] = market_cap
+            if 'mint' in token:
+                token['explorer_url'] = prefix + str(token['mint'])
+    
     # Wallet Endpoints
     
     def get_wallet_holdings(
@@ -296,7 +857,7 @@ class PumpFunAPI:
             Returns empty list in 'data' key if no holdings found or on error
         """
         try:
-            self.logger.debug(f"Fetching token balances for wallet: {wallet_address}")
+            self.logger.debug("Fetching token balances for wallet: %s", wallet_address)
             
             # Try to get token balances using the /balances endpoint
             params = {
@@ -306,21 +867,19 @@ class PumpFunAPI:
             }
             
             try:
-                response = self._request('GET', f'/balances/{wallet_address}', params=params)
-                if response and ('data' in response or 'tokens' in response):
-                    # Normalize the response format
-                    data = response.get('data', response.get('tokens', []))
-                    self.logger.info(f"Found {len(data)} token holdings for wallet")
+                data = self._request('GET', f'/balances/{wallet_address}', params=params, decoder=decode_list_data)
+                if data:
+                    self.logger.info("Found %d token holdings for wallet", len(data))
                     return {'data': data}
             except Exception as e:
-                self.logger.warning(f"Error fetching token balances: {str(e)}")
+                self.logger.warning("Error fetching token balances: %s", e)
                 
             # If we get here, no tokens found
             self.logger.info("No token balances found for wallet")
             return {'data': []}
             
         except Exception as e:
-            self.logger.error(f"Error in get_wallet_holdings: {str(e)}", exc_info=True)
+            self.logger.error("Error in get_wallet_holdings: %s", e, exc_info=True)
             return {'data': []}
     
     def get_wallet_created_coins(
@@ -332,6 +891,12 @@ class PumpFunAPI:
     ) -> Dict:
         """Get coins created by a wallet.
         
+        The user-created-coins endpoint and the creator-filtered search fallback
+        are requested at the same time; the first one to return coins wins, so a
+        failing primary endpoint no longer delays the fallback by its whole
+        retry budget. The slower request is cancelled if it has not started and
+        otherwise left to finish in the background.
+        
         Args:
             wallet_address: The wallet address that created the coins
             limit: Number of coins to return (default: 10)
@@ -341,54 +906,52 @@ class PumpFunAPI:
         Returns:
             Dictionary containing created coins with 'data' key
         """
-        try:
-            self.logger.debug(f"Fetching created coins for wallet: {wallet_address}")
-            
-            # First try the user-created-coins endpoint
-            params = {
-                'offset': offset,
-                'limit': limit,
-                'includeNsfw': str(include_nsfw).lower(),
-                'sort': 'created_timestamp',
-                'order': 'desc'
-            }
-            
+        self.logger.debug("Fetching created coins for wallet: %s", wallet_address)
+        
+        params = {
+            'offset': offset,
+            'limit': limit,
+            'includeNsfw': _BOOL[include_nsfw],
+            'sort': 'created_timestamp',
+            'order': 'desc'
+        }
+        
+        def created_coins() -> List[Dict]:
             try:
-                response = self._request('GET', f'/coins/user-created-coins/{wallet_address}', params=params)
-                if response and ('data' in response or 'items' in response):
-                    # Normalize the response format
-                    data = response.get('data', response.get('items', []))
-                    self.logger.info(f"Found {len(data)} created coins for wallet")
-                    return {'data': data}
+                data = self._request(
+                    'GET', f'/coins/user-created-coins/{wallet_address}', params=params, decoder=decode_list_data
+                )
             except Exception as e:
-                self.logger.warning(f"Error using user-created-coins endpoint: {str(e)}")
-            
-            # Fallback to search with creator filter
+                self.logger.warning("Error using user-created-coins endpoint: %s", e)
+                return []
+            self.logger.info("Found %d created coins for wallet", len(data))
+            return data
+        
+        def search_by_creator() -> List[Dict]:
             try:
-                search_params = {
-                    'creator': wallet_address,
-                    'limit': limit,
-                    'offset': offset,
-                    'includeNsfw': str(include_nsfw).lower(),
-                    'sort': 'created_timestamp',
-                    'order': 'desc'
-                }
-                response = self._request('GET', '/coins/search', params=search_params)
-                if response and ('data' in response or 'items' in response):
-                    # Normalize the response format
-                    data = response.get('data', response.get('items', []))
-                    self.logger.info(f"Found {len(data)} created coins using search endpoint")
-                    return {'data': data}
+                data = self._get_search(params={**params, 'creator': wallet_address}, decoder=decode_list_data)
             except Exception as e:
-                self.logger.warning(f"Error searching for created coins: {str(e)}")
-            
-            # If we get here, no coins found
-            self.logger.info("No created coins found for wallet")
-            return {'data': []}
-            
-        except Exception as e:
-            self.logger.error(f"Error in get_wallet_created_coins: {str(e)}", exc_info=True)
-            return {'data': []}
+                self.logger.warning("Error searching for created coins: %s", e)
+                return []
+            self.logger.info("Found %d created coins using search endpoint", len(data))
+            return data
+        
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            pending = {executor.submit(created_coins), executor.submit(search_by_creator)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    data = future.result()
+                    if data:
+                        for loser in pending:
+                            loser.cancel()
+                        return {'data': data}
+        finally:
+            executor.shutdown(wait=False)
+        
+        self.logger.info("No created coins found for wallet")
+        return {'data': []}
     
     # Token-Specific Endpoints
     
@@ -397,7 +960,8 @@ class PumpFunAPI:
         token_address: str,
         limit: int = 200,
         offset: int = 0,
-        minimum_size: int = 50000000
+        minimum_size: int = 50000000,
+        decoder: Callable[[bytes], Any] = json_loads
     ) -> Dict:
         """Get trades for a specific token.
         
@@ -406,22 +970,64 @@ class PumpFunAPI:
             limit: Number of trades to return (default: 200)
             offset: Pagination offset (default: 0)
             minimum_size: Minimum trade size to include (default: 50000000)
+            decoder: Parser for the raw response body (default: plain JSON)
             
         Returns:
-            Dictionary containing token trades
+            Dictionary containing token trades (or whatever ``decoder`` returns)
         """
         params = {
             'limit': limit,
             'offset': offset,
             'minimumSize': minimum_size
         }
-        return self._request('GET', f'/trades/all/{token_address}', params=params)
+        return self._request('GET', f'/trades/all/{token_address}', params=params, decoder=decoder)
+    
+    def get_token_trades_iter(
+        self,
+        token_address: str,
+        limit: int = 200,
+        offset: int = 0,
+        minimum_size: int = 50000000
+    ) -> Iterator[Dict]:
+        """Yield trades for a specific token as they are parsed.
+        
+        With ijson installed the response is streamed and parsed one trade at a
+        time, so parsing overlaps the download and the full page is never held
+        in memory. Otherwise (on the HTTP/2 client, or if the body cannot be
+        streamed) it falls back to get_token_trades.
+        
+        Args:
+            token_address: The token contract address
+            limit: Number of trades to request (default: 200)
+            offset: Pagination offset (default: 0)
+            minimum_size: Minimum trade size to include (default: 50000000)
+            
+        Yields:
+            Trade dictionaries
+        """
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'minimumSize': minimum_size
+        }
+        
+        items = self._iter_items(
+            f'/trades/all/{token_address}', params,
+            lambda: self.get_token_trades(
+                token_address, limit=limit, offset=offset, minimum_size=minimum_size, decoder=decode_list_data
+            )
+        )
+        try:
+            yield from items
+        finally:
+            items.close()
     
     def get_token_comments(
         self,
         token_address: str,
         limit: int = 1000,
-        offset: int = 0
+        offset: int = 0,
+        decoder: Callable[[bytes], Any] = json_loads
     ) -> Dict:
         """Get comments for a specific token.
         
@@ -429,60 +1035,177 @@ class PumpFunAPI:
             token_address: The token contract address
             limit: Number of comments to return (default: 1000)
             offset: Pagination offset (default: 0)
+            decoder: Parser for the raw response body (default: plain JSON)
             
         Returns:
-            Dictionary containing token comments
+            Dictionary containing token comments (or whatever ``decoder`` returns)
         """
         params = {
             'limit': limit,
             'offset': offset
         }
-        return self._request('GET', f'/replies/{token_address}', params=params)
+        return self._request('GET', f'/replies/{token_address}', params=params, decoder=decoder, expire_after=60)
     
     # Helper Methods
     
+    def search_coins_bulk(self, addresses: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """Look up several tokens by mint address in one call.
+        
+        The API has no multi-address query, so this runs one exact-match search
+        per distinct address on a thread pool over the shared Session; request
+        starts are still spaced out by ``_handle_rate_limiting``.
+        
+        Args:
+            addresses: Token mint addresses (duplicates and empty values are skipped)
+            max_workers: Maximum number of lookups in flight
+            
+        Returns:
+            Dictionary mapping each address that was found to its token record
+        """
+        def lookup(address: str) -> Optional[Dict]:
+            try:
+                response = self.search_coins(address, limit=1, search_type='exact')
+            except Exception as e:
+                self.logger.warning("Error looking up token %s: %s", address, e)
+                return None
+            data = response.get('data') if isinstance(response, dict) else None
+            return data[0] if data else None
+        
+        unique = list(dict.fromkeys(address for address in addresses if address))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            records = list(executor.map(lookup, unique))
+        return {address: record for address, record in zip(unique, records) if record}
+    
     def get_all_trades(
         self,
         token_address: str,
         batch_size: int = 200,
         max_trades: int = None,
-        minimum_size: int = 50000000
+        minimum_size: int = 50000000,
+        max_workers: int = 8,
+        cursor_field: Optional[str] = 'id'
     ) -> List[Dict]:
         """Get all trades for a token, handling pagination automatically.
         
+        The first page doubles as a probe: if its trades carry ``cursor_field``,
+        later pages are requested with ``before=<last cursor>``, so every page
+        costs the backend the same instead of growing with the offset. Cursor
+        pages are inherently sequential.
+        
+        Otherwise (or if the server ignores ``before``) pages are fetched by
+        offset, up to ``max_workers`` at once on a thread pool over the shared
+        Session, so N pages take about N / ``max_workers`` round-trips; request
+        starts are still paced by ``_handle_rate_limiting``.
+        ``AsyncPumpFunAPI.get_all_trades_async`` does the same with asyncio.
+        Pages go through the bare urllib3 pool (``_request_fast``) when it is in
+        use, falling back to the session. Trades whose ``cursor_field`` was
+        already seen are dropped, since pages overlap when new trades arrive
+        mid-pagination.
+        
         Args:
             token_address: The token contract address
             batch_size: Number of trades to fetch per request (default: 200)
             max_trades: Maximum number of trades to return (default: None, return all)
             minimum_size: Minimum trade size to include (default: 50000000)
+            max_workers: Number of pages in flight at a time (default: 8)
+            cursor_field: Trade field to paginate on (default: 'id'); None always
+                paginates by offset
             
         Returns:
-            List of trade dictionaries
+            List of trade dictionaries, in offset order
         """
-        all_trades = []
-        offset = 0
+        endpoint = f'/trades/all/{token_address}'
         
-        while True:
-            if max_trades and len(all_trades) >= max_trades:
-                break
-                
-            batch = self.get_token_trades(
-                token_address=token_address,
-                limit=min(batch_size, max_trades - len(all_trades)) if max_trades else batch_size,
+        def trades_of(batch: Any) -> List[Dict]:
+            return (batch.get('trades') or []) if isinstance(batch, dict) else batch
+        
+        def fetch_page(offset: int) -> List[Dict]:
+            batch = self._request_fast(endpoint, {
+                'limit': batch_size,
+                'offset': offset,
+                'minimumSize': minimum_size
+            })
+            if batch is not None:
+                return trades_of(batch)
+            return list(self.get_token_trades_iter(
+                token_address,
+                limit=batch_size,
                 offset=offset,
                 minimum_size=minimum_size
-            )
+            ))
+        
+        def fetch_before(cursor: Any) -> List[Dict]:
+            params = {
+                'limit': batch_size,
+                'before': cursor,
+                'minimumSize': minimum_size
+            }
+            batch = self._request_fast(endpoint, params)
+            return trades_of(batch if batch is not None else self._request('GET', endpoint, params=params))
+        
+        def done() -> bool:
+            return bool(max_trades) and len(all_trades) >= max_trades
+        
+        def unseen(trades: List[Dict]) -> List[Dict]:
+            # Pages overlap when trades arrive mid-pagination; keep each id once
+            fresh = []
+            for trade in trades:
+                key = trade.get(cursor_field) if cursor_field else None
+                if key is None or key not in seen:
+                    if key is not None:
+                        seen.add(key)
+                    fresh.append(trade)
+            return fresh
+        
+        all_trades = []
+        seen = set()
+        
+        if cursor_field:
+            first_page = fetch_page(0)
+            all_trades = unseen(first_page)
+            if len(first_page) < batch_size or done():
+                return all_trades[:max_trades] if max_trades else all_trades
             
-            if not batch.get('trades'):
-                break
-                
-            all_trades.extend(batch['trades'])
-            offset += len(batch['trades'])
+            cursor = first_page[-1].get(cursor_field)
+            while cursor is not None and not done():
+                trades = fetch_before(cursor)
+                next_cursor = trades[-1].get(cursor_field) if trades else None
+                # A server that ignores ``before`` keeps sending the newest page,
+                # which shifts as trades arrive: give up on the cursor when a page
+                # does not reach further back or adds no new trades
+                if trades and not _is_older(next_cursor, cursor):
+                    break
+                fresh = unseen(trades)
+                if trades and not fresh:
+                    break
+                all_trades.extend(fresh)
+                if len(trades) < batch_size:
+                    return all_trades[:max_trades] if max_trades else all_trades
+                cursor = next_cursor
             
-            # Be nice to the API
-            time.sleep(0.5)
+            if done():
+                return all_trades[:max_trades]
+        
+        # Offset pagination, continuing after whatever the cursor pages covered
+        offset = len(all_trades)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while not done():
+                pages = max(1, max_workers)
+                if max_trades:
+                    pages = min(pages, -(-(max_trades - len(all_trades)) // batch_size))
+                
+                offsets = [offset + page * batch_size for page in range(pages)]
+                # map() returns pages in submission (offset) order
+                for trades in executor.map(fetch_page, offsets):
+                    all_trades.extend(unseen(trades))
+                    # A short (or empty) page means there is nothing after it
+                    if len(trades) < batch_size:
+                        return all_trades[:max_trades] if max_trades else all_trades
+                
+                offset += pages * batch_size
         
-        return all_trades
+        return all_trades[:max_trades]
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,185 @@
+"""
+Typed response schemas for the Pump.fun API.
+
+When ``msgspec`` is installed, responses are decoded straight from the raw bytes
+into ``msgspec.Struct`` objects: only the declared fields are materialized, and
+type coercion happens in C. Without msgspec, equivalent lightweight classes are
+built from the regular JSON parse, so callers can use attribute access either way.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from utils._normalize import LIST_KEYS, list_items  # noqa: F401 - re-exported
+
+# utils.python_client imports this module, so it keeps its own loader
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Fields read by the search and listing displays
+COIN_FIELDS = (
+    'mint',
+    'address',
+    'symbol',
+    'name',
+    'price',
+    'market_cap',
+    'price_change_24h',
+    'price_change_7d',
+)
+_TEXT_FIELDS = COIN_FIELDS[:4]
+_NUMBER_FIELDS = COIN_FIELDS[4:]
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_text(value: Any) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _coin_values(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Leniently convert a coin record's display fields: off-type numbers become
+    None and non-string text is stringified, so one bad field never fails a page."""
+    values = {field: _to_text(record.get(field)) for field in _TEXT_FIELDS}
+    values.update((field, _to_float(record.get(field))) for field in _NUMBER_FIELDS)
+    return values
+
+
+if msgspec is not None:
+
+    class Coin(msgspec.Struct):
+        """The subset of a coin record used for display."""
+        mint: Optional[str] = None
+        address: Optional[str] = None
+        symbol: Optional[str] = None
+        name: Optional[str] = None
+        price: Optional[float] = None
+        market_cap: Optional[float] = None
+        price_change_24h: Optional[float] = None
+        price_change_7d: Optional[float] = None
+
+    class CoinList(msgspec.Struct):
+        """A page of coins, as returned by the search and listing endpoints."""
+        data: List[Coin] = []
+        pagination: Optional[Dict[str, Any]] = None
+
+    class _RawCoinList(msgspec.Struct):
+        """Coin-list envelope with the records left undecoded."""
+        data: msgspec.Raw = msgspec.Raw(b'null')
+        pagination: Any = None
+
+    _envelope_decoder = msgspec.json.Decoder(Union[_RawCoinList, List[msgspec.Raw]])
+    _records_decoder = msgspec.json.Decoder(Optional[List[msgspec.Raw]])
+    # strict=False lets numeric strings like "0.0012" decode into float fields
+    _coin_decoder = msgspec.json.Decoder(Coin, strict=False)
+
+    def _decode_coin(raw: msgspec.Raw) -> Optional[Coin]:
+        """Decode one record in C, redoing it leniently if a field is off-type."""
+        try:
+            return _coin_decoder.decode(raw)
+        except msgspec.ValidationError:
+            record = msgspec.json.decode(raw)
+            return Coin(**_coin_values(record)) if isinstance(record, dict) else None
+
+    def decode_coin_list(content: bytes) -> CoinList:
+        """Decode a coin-list response body, accepting an envelope or a bare list.
+
+        Records that are not objects are skipped and off-type fields become None,
+        matching the behaviour without msgspec.
+        """
+        try:
+            decoded = _envelope_decoder.decode(content)
+        except msgspec.ValidationError:
+            return CoinList()
+        if isinstance(decoded, list):
+            records, pagination = decoded, None
+        else:
+            pagination = decoded.pagination if isinstance(decoded.pagination, dict) else None
+            try:
+                records = _records_decoder.decode(decoded.data) or []
+            except msgspec.ValidationError:
+                records = []
+        coins = [_decode_coin(raw) for raw in records]
+        return CoinList(data=[coin for coin in coins if coin is not None], pagination=pagination)
+
+    class ListResponse(msgspec.Struct):
+        """Envelope of a list endpoint; only the ``LIST_KEYS`` fields are decoded.
+
+        They are typed ``Any`` so an off-type value is passed over, as by
+        ``list_items``, instead of failing the decode.
+        """
+        data: Any = None
+        items: Any = None
+        tokens: Any = None
+        trades: Any = None
+        replies: Any = None
+
+    _list_decoder = msgspec.json.Decoder(Union[ListResponse, List[Any]])
+
+    def decode_list_data(content: bytes) -> List[Any]:
+        """Decode a list response body straight to its records.
+
+        Accepts a bare list or an envelope keyed by any of ``LIST_KEYS``; other
+        envelope fields are skipped without being materialized. The first of
+        those keys holding a list wins, the same rule as ``list_items``.
+        """
+        try:
+            decoded = _list_decoder.decode(content)
+        except msgspec.ValidationError:
+            return []  # Neither an object nor a list
+        if isinstance(decoded, list):
+            return decoded
+        for key in LIST_KEYS:
+            records = getattr(decoded, key)
+            if isinstance(records, list):
+                return records
+        return []
+
+else:
+
+    class Coin:
+        """The subset of a coin record used for display."""
+        __slots__ = COIN_FIELDS
+
+        def __init__(self, record: Dict[str, Any]):
+            for field, value in _coin_values(record).items():
+                setattr(self, field, value)
+
+    class CoinList:
+        """A page of coins, as returned by the search and listing endpoints."""
+        __slots__ = ('data', 'pagination')
+
+        def __init__(self, data: List[Coin], pagination: Optional[Dict[str, Any]] = None):
+            self.data = data
+            self.pagination = pagination
+
+    def decode_coin_list(content: bytes) -> CoinList:
+        """Decode a coin-list response body, accepting an envelope or a bare list."""
+        decoded = _json_loads(content)
+        if isinstance(decoded, dict):
+            records, pagination = decoded.get('data') or [], decoded.get('pagination')
+            if not isinstance(pagination, dict):
+                pagination = None
+        else:
+            records, pagination = decoded, None
+        if not isinstance(records, list):
+            records = []
+        return CoinList([Coin(r) for r in records if isinstance(r, dict)], pagination)
+
+    def decode_list_data(content: bytes) -> List[Any]:
+        """Decode a list response body straight to its records."""
+        return list_items(_json_loads(content))
@@ -0,0 +1,108 @@
+"""
+On-disk token metadata cache.
+
+Token records fetched by mint address (or symbol) are kept in a small SQLite file,
+so repeated runs of the example scripts skip the network for tokens they have
+looked up recently. Entries expire after a per-entry TTL.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from utils.python_client import json_loads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path.home() / '.pumpfun' / 'token_cache.sqlite'
+DEFAULT_TTL = 3600  # Seconds
+
+
+def _dumps(record: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(record, default=str).encode('utf-8')
+
+
+class TokenCache:
+    """SQLite-backed cache of token records keyed by mint address.
+
+    One connection is shared by every thread that uses the cache, guarded by a
+    lock; WAL journaling lets other processes keep reading while one writes.
+    """
+
+    def __init__(self, path: Optional[os.PathLike] = None):
+        """Open (creating if needed) the cache file.
+
+        Args:
+            path: SQLite file to use (default: ~/.pumpfun/token_cache.sqlite, or
+                the ``PUMPFUN_TOKEN_CACHE`` environment variable when set)
+        """
+        self.path = Path(path or os.getenv('PUMPFUN_TOKEN_CACHE') or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS tokens '
+                '(mint TEXT PRIMARY KEY, json BLOB, fetched_at REAL, ttl REAL)'
+            )
+
+    def get(self, mint: str) -> Optional[Dict]:
+        """Return the cached record for ``mint``, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT json, fetched_at, ttl FROM tokens WHERE mint = ?', (mint,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        data, fetched_at, ttl = row
+        if time.time() - fetched_at >= ttl:
+            return None
+        return json_loads(data)
+
+    def set(self, mint: str, record: Dict, ttl: float = DEFAULT_TTL) -> None:
+        """Store ``record`` for ``mint``, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO tokens (mint, json, fetched_at, ttl) VALUES (?, ?, ?, ?)',
+                (mint, _dumps(record), time.time(), ttl)
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> Optional[TokenCache]:
+    """Return the process-wide cache, opening it on first use.
+
+    Returns None (after logging a warning) when the cache file cannot be opened,
+    so callers can fall back to fetching everything from the API.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = TokenCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Token cache unavailable: %s", e)
+                return None
+        return _default_cache